@@ -0,0 +1,147 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+import warnings
+
+import numpy as np
+
+import magnopy
+
+
+def get_triangular_afm(n):
+    convention = magnopy.Convention(
+        multiple_counting=True, spin_normalized=False, c21=1, c22=1
+    )
+    cell = np.array([[1, 0, 0], [-0.5, np.sqrt(3) / 2, 0], [0, 0, 1]])
+    atoms = dict(names=["Fe"], spins=[1], positions=[[0, 0, 0]])
+
+    spinham = magnopy.SpinHamiltonian(cell=cell, atoms=atoms, convention=convention)
+    for nu in [(1, 0, 0), (0, 1, 0), (1, 1, 0)]:
+        spinham.add(
+            nus=[nu], alphas=[0, 0], parameter=np.eye(3), populate_equivalent=True
+        )
+    spinham.add(nus=[(0, 0, 0)], alphas=[0, 0], parameter=np.diag([0, 0, 0.1]))
+
+    return magnopy.make_supercell(spinham=spinham, supercell=(n, n, 1))
+
+
+def measure(energy, initial_guesses, optimizer, tangent_space):
+    steps = []
+    evaluations = []
+    times = []
+
+    original = energy.energy_and_torque
+    counter = [0]
+
+    def counted(*args, **kwargs):
+        counter[0] += 1
+        return original(*args, **kwargs)
+
+    energy.energy_and_torque = counted
+
+    for initial_guess in initial_guesses:
+        counter[0] = 0
+        output = StringIO()
+        start = perf_counter()
+        with redirect_stdout(output), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            energy.optimize(
+                initial_guess=initial_guess,
+                optimizer=optimizer,
+                tangent_space=tangent_space,
+            )
+        times.append(perf_counter() - start)
+        evaluations.append(counter[0])
+        # One line of the progress table per step
+        steps.append(
+            len(
+                [
+                    line
+                    for line in output.getvalue().splitlines()
+                    if line.split() and line.split()[0].isdigit()
+                ]
+            )
+        )
+
+    energy.energy_and_torque = original
+
+    return np.mean(steps), np.mean(evaluations), np.mean(times)
+
+
+def main(sizes, number_starts):
+    systems = []
+    for n in sizes:
+        systems.append((f"triangular AFM {n}x{n}", get_triangular_afm(n)))
+        systems.append((f"ivuzjo N={n}", magnopy.examples.ivuzjo(N=n)))
+
+    print(f"Averaged over {number_starts} random initial guesses\n")
+    print(
+        f"{'system':>22} {'M':>5} {'optimizer':>9} {'space':>8} "
+        f"{'steps':>7} {'evaluations':>12} {'time, s':>8}"
+    )
+
+    for name, spinham in systems:
+        energy = magnopy.Energy(spinham=spinham)
+        rng = np.random.default_rng(0)
+        initial_guesses = [rng.normal(size=(energy.M, 3)) for _ in range(number_starts)]
+
+        for optimizer in ["bfgs", "lbfgs"]:
+            for tangent_space in [False, True]:
+                steps, evaluations, time = measure(
+                    energy=energy,
+                    initial_guesses=initial_guesses,
+                    optimizer=optimizer,
+                    tangent_space=tangent_space,
+                )
+                print(
+                    f"{name:>22} {energy.M:>5} {optimizer:>9} "
+                    f"{'2M' if tangent_space else '3M':>8} {steps:>7.1f} "
+                    f"{evaluations:>12.1f} {time:>8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Compares the optimizers of magnopy.Energy.optimize in the 3M "
+        "space of rotation vectors and in the 2M tangent space. Spin Hamiltonians are "
+        "n x n supercells of the triangular antiferromagnet (frustrated) and the "
+        "Hamiltonian of Ivanov, Uzdin and Jonsson (non-collinear, with DMI)."
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=[3, 6, 9],
+        help="Sizes n of the supercells.",
+    )
+    parser.add_argument(
+        "-ns",
+        "--number-starts",
+        type=int,
+        default=5,
+        help="Amount of random initial guesses for each system.",
+    )
+
+    main(**vars(parser.parse_args()))
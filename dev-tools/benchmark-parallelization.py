@@ -0,0 +1,122 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+import magnopy
+
+
+def get_lswt(n):
+    spinham = magnopy.make_supercell(
+        spinham=magnopy.examples.cubic_ferro_nn(), supercell=(n, n, n)
+    )
+
+    return magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]] * spinham.M)
+
+
+def measure(lswt, kpoints, number_processors, backend, repeat):
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        magnopy.dispersion_over_k(
+            lswt=lswt,
+            kpoints=kpoints,
+            number_processors=number_processors,
+            backend=backend,
+        )
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+def main(supercells, number_kpoints, number_processors, repeat):
+    kpoints = np.random.default_rng(0).uniform(size=(number_kpoints, 3))
+
+    print(
+        f"{number_kpoints} k-points, number of processors: "
+        f"{'all' if number_processors is None else number_processors}\n"
+    )
+    print(f"{'M':>6} {'serial, s':>12} {'processes, s':>14} {'threads, s':>12}")
+    for n in supercells:
+        lswt = get_lswt(n)
+        serial = measure(
+            lswt=lswt,
+            kpoints=kpoints,
+            number_processors=1,
+            backend="processes",
+            repeat=repeat,
+        )
+        processes = measure(
+            lswt=lswt,
+            kpoints=kpoints,
+            number_processors=number_processors,
+            backend="processes",
+            repeat=repeat,
+        )
+        threads = measure(
+            lswt=lswt,
+            kpoints=kpoints,
+            number_processors=number_processors,
+            backend="threads",
+            repeat=repeat,
+        )
+        print(f"{lswt.M:>6} {serial:>12.3f} {processes:>14.3f} {threads:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Compares the backends of magnopy.dispersion_over_k. The spin "
+        "Hamiltonian is a supercell n x n x n of the cubic ferromagnet, thus M = n^3."
+    )
+    parser.add_argument(
+        "-s",
+        "--supercells",
+        type=int,
+        nargs="*",
+        default=[1, 2, 3, 4, 5],
+        help="Sizes n of the supercells.",
+    )
+    parser.add_argument(
+        "-nk",
+        "--number-kpoints",
+        type=int,
+        default=2000,
+        help="Number of k-points.",
+    )
+    parser.add_argument(
+        "-np",
+        "--number-processors",
+        type=int,
+        default=None,
+        help="Number of processes or threads. By default all available processors.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Each calculation is repeated that many times, the best time is shown.",
+    )
+
+    main(**vars(parser.parse_args()))
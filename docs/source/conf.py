@@ -248,6 +248,10 @@ custom_links = {
         "multiprocessing",
         "https://docs.python.org/3/library/multiprocessing.html",
     ),
+    "multiprocessing-shared-memory": (
+        "shared memory",
+        "https://docs.python.org/3/library/multiprocessing.shared_memory.html",
+    ),
     "plotly": ("Plotly", "https://plotly.com/python/"),
     "spglib": ("spglib", "https://spglib.readthedocs.io/en/stable/index.html"),
     "plotly-update-layout": (
@@ -270,6 +274,11 @@ custom_links = {
         "https://tutorials.magnopy.org/en/latest/FIXME",
     ),
     "scipy": ("scipy", "https://scipy.org/"),
+    "MP": (
+        "Monkhorst-Pack",
+        "https://doi.org/10.1103/PhysRevB.13.5188",
+    ),
+    "threadpoolctl": ("threadpoolctl", "https://github.com/joblib/threadpoolctl"),
     "paper-2026": (
         "paper about Magnopy",
         "https://docs.magnopy.org/en/latest/cite.html",
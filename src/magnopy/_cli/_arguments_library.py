@@ -114,6 +114,41 @@ def _add_no_html(parser):
     )
 
 
+def _add_chunk_size(parser):
+    parser.add_argument(
+        "-cs",
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Process k-points in chunks of CHUNK_SIZE k-points and write the results "
+        "into the memory-mapped OMEGAS.npy and DELTAS.npy files as soon as each chunk "
+        "is finished. Memory usage does not grow with the amount of k-points. Plots of "
+        "the dispersion are not produced.",
+    )
+
+
+def _add_no_txt(parser):
+    parser.add_argument(
+        "-no-txt",
+        "--no-txt",
+        action="store_true",
+        default=False,
+        help="Do not write omegas and deltas into the .txt files, only into the .npy "
+        "files. Text formatting is slow for large amount of k-points.",
+    )
+
+
+def _add_save_G(parser):
+    parser.add_argument(
+        "-sG",
+        "--save-G",
+        action="store_true",
+        default=False,
+        help="Compute transformation matrices G and save them into the memory-mapped "
+        "G.npy file.",
+    )
+
+
 def _add_hide_personal_data(parser):
     parser.add_argument(
         "-hpd",
@@ -162,6 +197,41 @@ def _add_torque_tolerance(parser):
     )
 
 
+def _add_optimizer(parser):
+    parser.add_argument(
+        "-o",
+        "--optimizer",
+        type=str,
+        choices=["bfgs", "lbfgs", "trust-newton"],
+        default="bfgs",
+        help="Optimization method. Use lbfgs for large supercells, as its memory and time "
+        "per step grow linearly with the amount of spins. Use trust-newton for fast "
+        "convergence near the minimum (analytic Hessian, no quantum correction).",
+    )
+
+
+def _add_history_length(parser):
+    parser.add_argument(
+        "-hl",
+        "--history-length",
+        type=int,
+        default=10,
+        help="Amount of previous steps that are kept by the lbfgs optimizer.",
+    )
+
+
+def _add_starts(parser):
+    parser.add_argument(
+        "-st",
+        "--starts",
+        type=int,
+        default=1,
+        help="Amount of starts of the optimization from random initial guesses. If "
+        "larger than 1, then the starts are run in parallel and distinct local minima "
+        "are reported. The state with the lowest energy is saved as the result.",
+    )
+
+
 def _add_spin_directions(parser):
     parser.add_argument(
         "-sd",
@@ -222,6 +292,22 @@ def _add_k_points(parser):
     )
 
 
+def _add_k_mesh(parser):
+    parser.add_argument(
+        "-km",
+        "--k-mesh",
+        type=int,
+        nargs=3,
+        metavar=("N1", "N2", "N3"),
+        default=None,
+        help="Uniform mesh of k-points N1 x N2 x N3, centered at Gamma. The mesh is "
+        "reduced to its irreducible part by the symmetry of the crystal and of the "
+        "ground state, only irreducible k-points are computed. Full mesh and indices "
+        "of the equivalent irreducible k-points are saved in K-MESH.txt. Ignored if "
+        '"--kpoints" is used.',
+    )
+
+
 def _add_relative(parser):
     parser.add_argument(
         "-r",
@@ -239,8 +325,34 @@ def _add_number_processors(parser):
         "--number-processors",
         type=int,
         default=None,
-        help="Magnopy is parallelized over the k-points. By default it uses all "
-        "available processors. Pass 1 to run in serial.",
+        help="Magnopy is parallelized over the k-points (or over the starts of the "
+        "optimization). By default it uses all available processors. Pass 1 to run in "
+        "serial.",
+    )
+
+
+def _add_number_threads(parser):
+    parser.add_argument(
+        "-nt",
+        "--number-threads",
+        type=int,
+        default=None,
+        help="Total number of threads that Magnopy can use. Each process (or thread) "
+        "uses at most NUMBER_THREADS // NUMBER_PROCESSORS threads for BLAS. The number "
+        "of processes (or threads) is reduced to NUMBER_THREADS if it is larger. By "
+        "default it is equal to the number of available processors.",
+    )
+
+
+def _add_backend(parser):
+    parser.add_argument(
+        "-b",
+        "--backend",
+        type=str,
+        choices=["processes", "threads"],
+        default="processes",
+        help="How the calculation is parallelized over the k-points: with the pool of "
+        "processes or with the pool of threads.",
     )
 
 
@@ -39,6 +39,10 @@ from magnopy._cli._arguments_library import (
     _add_energy_tolerance,
     _add_torque_tolerance,
     _add_quantum_correction,
+    _add_optimizer,
+    _add_history_length,
+    _add_starts,
+    _add_number_processors,
 )
 from magnopy._constants._icons import ICON_IN_FILE
 
@@ -62,6 +66,10 @@ def manager():
     _add_no_html(parser=parser)
     _add_hide_personal_data(parser=parser)
     _add_quantum_correction(parser=parser)
+    _add_optimizer(parser=parser)
+    _add_history_length(parser=parser)
+    _add_starts(parser=parser)
+    _add_number_processors(parser=parser)
 
     # Parse arguments
     args = parser.parse_args()
@@ -111,4 +119,8 @@ def manager():
         no_html=args.no_html,
         hide_personal_data=args.hide_personal_data,
         quantum_correction=args.quantum_correction,
+        optimizer=args.optimizer,
+        history_length=args.history_length,
+        n_starts=args.starts,
+        number_processors=args.number_processors,
     )
@@ -41,9 +41,15 @@ from magnopy._cli._arguments_library import (
     _add_spin_directions,
     _add_k_path,
     _add_k_points,
+    _add_k_mesh,
     _add_relative,
     _add_spglib_symprec,
     _add_number_processors,
+    _add_backend,
+    _add_number_threads,
+    _add_chunk_size,
+    _add_no_txt,
+    _add_save_G,
     _add_spglib_types,
 )
 from magnopy._constants._icons import ICON_IN_FILE
@@ -65,9 +71,15 @@ def manager():
     _add_output_folder(parser=parser)
     _add_k_path(parser=parser)
     _add_k_points(parser=parser)
+    _add_k_mesh(parser=parser)
     _add_relative(parser=parser)
     _add_spglib_symprec(parser=parser)
     _add_number_processors(parser=parser)
+    _add_backend(parser=parser)
+    _add_number_threads(parser=parser)
+    _add_chunk_size(parser=parser)
+    _add_no_txt(parser=parser)
+    _add_save_G(parser=parser)
     _add_spin_values(parser=parser)
     _add_no_html(parser=parser)
     _add_hide_personal_data(parser=parser)
@@ -160,4 +172,10 @@ def manager():
         no_html=args.no_html,
         hide_personal_data=args.hide_personal_data,
         spglib_symprec=args.spglib_symprec,
+        backend=args.backend,
+        number_threads=args.number_threads,
+        chunk_size=args.chunk_size,
+        no_txt=args.no_txt,
+        save_G=args.save_G,
+        kmesh=args.k_mesh,
     )
@@ -66,6 +66,10 @@ def _validate_unit_cell_index(ijk) -> None:
         If ``ijk`` is not a ``tuple``.
     TypeError
         If either ``i``, ``j`` or ``k`` is not an ``int``.
+    ValueError
+        If either ``i``, ``j`` or ``k`` is not less than :math:`2^{62}` by absolute
+        value. Indices are stored as 64-bit integers and differences of two indices
+        shall fit as well.
     """
 
     if not len(ijk) == 3:
@@ -92,6 +96,12 @@ def _validate_unit_cell_index(ijk) -> None:
             f"{type(ijk[2])} from '{ijk[2]}'"
         )
 
+    if not all(abs(_) < 2**62 for _ in ijk):
+        raise ValueError(
+            f"Elements of the unit cell index have to be less than 2**62 by absolute "
+            f"value, got {ijk}"
+        )
+
 
 def _spins_ordered(mu1, alpha1, mu2, alpha2) -> bool:
     r"""
@@ -24,10 +24,21 @@ from numpy.linalg import LinAlgError
 
 from magnopy._exceptions import ColpaFailed
 
+try:
+    from scipy.linalg import solve_triangular
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 # Save local scope at this moment
 old_dir = set(dir())
 old_dir.add("old_dir")
 
+# Maximum size of the triangular matrices, that are solved by the batched
+# back-substitution.
+_MAX_BACKSUBSTITUTION_SIZE = 16
+
 
 def _check_grand_dynamical_matrix(D):
     r"""
@@ -70,17 +81,155 @@ def _check_grand_dynamical_matrix(D):
     return D, D.shape[0] // 2
 
 
+def _check_grand_dynamical_matrices(D):
+    r"""
+    Check that the set of grand dynamical matrices is a (K, 2N, 2N) array
+
+    Parameters
+    ----------
+
+    D : |array-like|_
+        Candidate for the set of grand dynamical matrices
+
+    Returns
+    -------
+
+    D : (K, 2N, 2N) :numpy:`ndarray`
+        Set of grand dynamical matrices.
+
+    N : int
+
+    Raises
+    ------
+
+    ValueError
+        If the check is not passed
+    """
+
+    D = np.array(D)
+
+    if len(D.shape) != 3:
+        raise ValueError(
+            f"Set of grand dynamical matrices is not 3-dimensional, got {D.shape}."
+        )
+
+    if D.shape[1] != D.shape[2]:
+        raise ValueError(f"Grand dynamical matrices are not square, got {D.shape}.")
+
+    if D.shape[1] % 2 != 0:
+        raise ValueError(
+            f"Size of the grand dynamical matrices is not even, got {D.shape}."
+        )
+
+    return D, D.shape[1] // 2
+
+
 def _inverse_by_colpa(matrix):
     # Compute G from G^-1 (or vise versa) following Colpa, see equation (3.7) for details
+    # Works for one matrix and for a stack of matrices
 
-    N = matrix.shape[0] // 2
-    matrix = np.conjugate(matrix).T
-    matrix[:N, N:] *= -1
-    matrix[N:, :N] *= -1
+    N = matrix.shape[-1] // 2
+    matrix = np.conjugate(np.swapaxes(matrix, -1, -2))
+    matrix[..., :N, N:] *= -1
+    matrix[..., N:, :N] *= -1
 
     return matrix
 
 
+def _solve_upper_triangular(K, B):
+    # Solves K X = B for upper triangular K (or a stack of them) without computing an
+    # inverse of K.
+    size = K.shape[-1]
+    X = np.array(np.broadcast_to(B, K.shape), dtype=np.result_type(K, B))
+
+    # Small matrices are solved for the whole stack at once by back-substitution,
+    # as the cost of the python loop over rows is lower than the one over the stack
+    if size <= _MAX_BACKSUBSTITUTION_SIZE:
+        for i in range(size - 1, -1, -1):
+            X[..., i, :] -= np.einsum(
+                "...j,...jk->...k", K[..., i, i + 1 :], X[..., i + 1 :, :]
+            )
+            X[..., i, :] /= K[..., i, i, np.newaxis]
+
+        return X
+
+    if SCIPY_AVAILABLE:
+        for index in np.ndindex(K.shape[:-2]):
+            X[index] = solve_triangular(
+                K[index], X[index], lower=False, check_finite=False
+            )
+
+        return X
+
+    return np.linalg.solve(K, X)
+
+
+def _diagonalize_by_colpa(K, energies_only=False):
+    r"""
+    Second part of the Colpa's algorithm, that follows Cholesky decomposition.
+
+    Parameters
+    ----------
+
+    K : (..., 2N, 2N) :numpy:`ndarray`
+        Upper triangular matrices of the Cholesky decomposition
+        :math:`\boldsymbol{D} = \boldsymbol{K}^{\dagger}\boldsymbol{K}`.
+
+    energies_only : bool, default False
+        Whether to skip the computation of the transformation matrices.
+
+    Returns
+    -------
+
+    E : (..., 2N) :numpy:`ndarray`
+        Eigenvalues, see :py:func:`.solve_via_colpa`.
+
+    G : (..., 2N, 2N) :numpy:`ndarray`
+        Transformation matrices, see :py:func:`.solve_via_colpa`. Not returned if
+        ``energies_only=True``.
+    """
+
+    N = K.shape[-1] // 2
+
+    # Diagonal of the para-unitary matrix
+    g = np.concatenate((np.ones(N), -np.ones(N)))
+
+    # K g K^{\dag} is Hermitian, thus its eigenvalues are real and returned in
+    # ascending order
+    W = (K * g) @ np.conjugate(np.swapaxes(K, -1, -2))
+
+    if energies_only:
+        # Reverse the order to have first N eigenvalues to be positive
+        # and last N eigenvalues to be negative
+        return g * np.linalg.eigvalsh(W)[..., ::-1]
+
+    # Solve the standard eigenvalue problem for K g K^{\dag}.
+    L, U = np.linalg.eigh(W)
+
+    # Reverse the order to have first N eigenvalues to be positive
+    # and last N eigenvalues to be negative
+    L = L[..., ::-1]
+    U = U[..., ::-1]
+
+    # Fix the arbitrary phase of the eigenvectors: the largest component of each one
+    # is real and positive
+    largest = np.take_along_axis(
+        U, np.argmax(np.abs(U), axis=-2)[..., np.newaxis, :], axis=-2
+    )
+    U = U * (np.conjugate(largest) / np.abs(largest))
+
+    # Compute actual eigenvalues of D
+    E = g * L
+
+    # Compute G_inv = K^-1 U sqrt(E)
+    G_inv = _solve_upper_triangular(
+        K, U * np.sqrt(E.astype(U.dtype))[..., np.newaxis, :]
+    )
+
+    # Inverse it by the Colpa's method to get G
+    return E, _inverse_by_colpa(G_inv)
+
+
 def solve_via_colpa(D):
     r"""
     Diagonalizes grand-dynamical matrix following the method of Colpa.
@@ -166,6 +315,8 @@ def solve_via_colpa(D):
         First N eigenvalues are sorted in descending order, while last N eigenvalues are
         sorted in ascending order.
 
+        .. versionchanged:: 0.7.0 Eigenvalues are always real.
+
         .. math::
 
             \boldsymbol{\mathcal{E}}
@@ -224,7 +375,7 @@ def solve_via_colpa(D):
         >>> D = [[1, 1j], [-1j, 2]]
         >>> E, G = magnopy.solve_via_colpa(D)
         >>> np.round(E, decimals=3)
-        array([0.618+0.j, 1.618+0.j])
+        array([0.618, 1.618])
         >>> np.round(G, decimals=4)
         array([[ 1.082-0.j    ,  0.   +0.4133j],
                [-0.   -0.4133j,  1.082-0.j    ]])
@@ -233,9 +384,6 @@ def solve_via_colpa(D):
     # Guarantee that D is 2Nx2N matrix
     D, N = _check_grand_dynamical_matrix(D)
 
-    # Para-unitary matrix
-    g = np.diag(np.concatenate((np.ones(N), -np.ones(N))))
-
     # Cholesky decomposition D = K^{\dag}K
     try:
         # In Colpa article decomposition is K^{\dag}K,
@@ -245,39 +393,114 @@ def solve_via_colpa(D):
     except LinAlgError:
         raise ColpaFailed
 
-    # Solve the standard eigenvalue problem for K g K^{\dag}
-    L, U = np.linalg.eig(K @ g @ np.conjugate(K).T)
+    E, G = _diagonalize_by_colpa(K)
 
-    # Sort with respect to L, in descending order
+    return E, G
 
-    # Step 1 put L as a first line on top of U:
-    # [
-    #   [L_0, ..., L_2N],
-    #   [U_0_0, ..., U_0_2N],
-    #   ...
-    #   [U_2N_0, ..., U_2N_2N],
-    # ]
-    U = np.concatenate((L[np.newaxis, :], U), axis=0)
 
-    # Step 2 sort each row according to the sorted order of the first row (L)
-    U = U[:, np.argsort(U[0])]
+def solve_via_colpa_batched(D, energies_only=False):
+    r"""
+    Diagonalizes a set of grand-dynamical matrices following the method of Colpa.
 
-    # Step 3 separate L and U, and reverse the order to have
-    # first N eigenvalues to be positive
-    # and last N eigenvalues to be negative
-    L = U[0, ::-1]
-    U = U[1:, ::-1]
+    .. versionadded:: 0.7.0
 
-    # Compute actual eigenvalues of D
-    E = g @ L
+    The algorithm is the same as in :py:func:`.solve_via_colpa`, but it is applied to
+    all matrices at once. Instead of raising :py:class:`.ColpaFailed` the failed
+    matrices are marked in the returned mask.
 
-    # Compute G_inv
-    G_inv = np.linalg.inv(K) @ U @ np.sqrt(np.diag(E))
+    Parameters
+    ----------
 
-    # Inverse it by the Colpa's method to get G
-    G = _inverse_by_colpa(G_inv)
+    D : (K, 2N, 2N) |array-like|_
+        Set of grand dynamical matrices. ``D[i]`` is one grand dynamical matrix.
 
-    return E, G
+    energies_only : bool, default False
+        If ``True``, then only the eigenvalues are computed and transformation matrices
+        are not returned. It saves both time and memory if the transformation matrices
+        are not needed.
+
+    Returns
+    -------
+
+    E : (K, 2N) :numpy:`ndarray`
+        The eigenvalues. ``E[i]`` has the same meaning as ``E`` returned by
+        :py:func:`.solve_via_colpa` for ``D[i]``. Filled with NaNs for the failed
+        matrices.
+
+    G : (K, 2N, 2N) :numpy:`ndarray`
+        Transformation matrices. ``G[i]`` has the same meaning as ``G`` returned by
+        :py:func:`.solve_via_colpa` for ``D[i]``. Filled with NaNs for the failed
+        matrices. Not returned if ``energies_only=True``.
+
+    failed : (K, ) :numpy:`ndarray`
+        Boolean mask. ``failed[i]`` is ``True`` if the algorithm failed for ``D[i]``.
+        Typically it means that ``D[i]`` is not positive-defined.
+
+    Raises
+    ------
+
+    ValueError
+        If the grand dynamical matrices are not square or their shape is not even.
+
+    See Also
+    --------
+
+    solve_via_colpa
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import magnopy
+        >>> D = [[[1, 0], [0, 2]], [[1, 0], [0, -2]]]
+        >>> E, G, failed = magnopy.solve_via_colpa_batched(D)
+        >>> E
+        array([[ 1.,  2.],
+               [nan, nan]])
+        >>> failed
+        array([False,  True])
+        >>> E, failed = magnopy.solve_via_colpa_batched(D, energies_only=True)
+        >>> E
+        array([[ 1.,  2.],
+               [nan, nan]])
+    """
+
+    # Guarantee that D is Kx2Nx2N array
+    D, N = _check_grand_dynamical_matrices(D)
+
+    D = D.astype(np.result_type(D.dtype, float))
+
+    # Matrices with infs or NaNs can not be diagonalized
+    failed = ~np.isfinite(D).all(axis=(1, 2))
+
+    # Cholesky decomposition D = K^{\dag}K
+    K = np.zeros(D.shape, dtype=D.dtype)
+    try:
+        K[~failed] = np.linalg.cholesky(D[~failed], upper=True)
+    except LinAlgError:
+        # Identify the matrices that are not positive-defined one by one
+        for i in np.nonzero(~failed)[0]:
+            try:
+                K[i] = np.linalg.cholesky(D[i], upper=True)
+            except LinAlgError:
+                failed[i] = True
+
+    if energies_only:
+        E_ok = _diagonalize_by_colpa(K[~failed], energies_only=True)
+    else:
+        E_ok, G_ok = _diagonalize_by_colpa(K[~failed])
+
+    E = np.full((len(D), 2 * N), np.nan, dtype=E_ok.dtype)
+    E[~failed] = E_ok
+
+    if energies_only:
+        return E, failed
+
+    G = np.full(D.shape, np.nan, dtype=G_ok.dtype)
+    G[~failed] = G_ok
+
+    return E, G, failed
 
 
 # Populate __all__ with objects defined in this file
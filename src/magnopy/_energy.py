@@ -19,7 +19,9 @@
 # ================================ END LICENSE =================================
 
 
+from collections import deque
 from math import log10
+from multiprocessing import Pool
 import warnings
 
 import numpy as np
@@ -33,7 +35,20 @@ from magnopy._parameters._interaction_parameters import (
 from magnopy._parameters._renormalization import _renormalized_parameters
 from magnopy._local_rf import span_local_rfs
 from magnopy._exceptions import ConventionError
+from magnopy._parallelization import (
+    _get_thread_layout,
+    _initialize_energy_worker,
+    _limit_blas_threads,
+    _optimize_start,
+)
+
+try:
+    from scipy.sparse import coo_array
+    from scipy.sparse.linalg import eigsh
 
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 # Save local scope at this moment
 old_dir = set(dir())
@@ -42,6 +57,35 @@ old_dir.add("old_dir")
 _C1 = 1e-4
 _C2 = 0.9
 
+# Hessian is returned as a sparse matrix by default if M is larger than that
+_SPARSE_HESSIAN_M = 1000
+
+# Positions of the spin operators of the n-spin terms, that are kept by the
+# renormalization into the parameters with fewer spin operators (the term itself is
+# kept as well). Order of the positions is the order of indices of the renormalized
+# tensor (see _KEPT_POSITIONS in magnopy._parameters._renormalization).
+_ON_SITE_POSITIONS = {
+    2: [],
+    3: [(0, 1), (0, 2), (1, 2)],
+    4: [
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (1, 2),
+        (1, 3),
+        (2, 3),
+        (0, 1, 2),
+        (0, 1, 3),
+        (0, 3, 2),
+        (3, 1, 2),
+    ],
+}
+
+# Levi-Civita symbol
+_LEVI_CIVITA = np.zeros((3, 3, 3), dtype=float)
+_LEVI_CIVITA[0, 1, 2] = _LEVI_CIVITA[1, 2, 0] = _LEVI_CIVITA[2, 0, 1] = 1
+_LEVI_CIVITA[0, 2, 1] = _LEVI_CIVITA[2, 1, 0] = _LEVI_CIVITA[1, 0, 2] = -1
+
 
 def _cubic_interpolation(alpha_l, alpha_h, phi_l, phi_h, der_l, der_h):
     r"""
@@ -103,30 +147,249 @@ def _rotate_sd(reference_sd, rotation):
         Rotated set of direction vectors.
     """
 
-    directions = reference_sd.copy()
+    rotation = np.reshape(rotation, (-1, 3))
+
+    thetas = np.linalg.norm(rotation, axis=1)
+    # Spins with vanishing rotation are not changed
+    rotated = thetas >= np.finfo(float).eps
+
+    axes = np.divide(
+        rotation,
+        thetas[:, np.newaxis],
+        out=np.zeros(rotation.shape),
+        where=rotated[:, np.newaxis],
+    )
+    cos = np.where(rotated, np.cos(thetas), 1)[:, np.newaxis]
+    sin = np.where(rotated, np.sin(thetas), 0)[:, np.newaxis]
+
+    # Rodrigues' rotation formula
+    return (
+        cos * reference_sd
+        + sin * np.cross(axes, reference_sd)
+        + (1 - cos) * axes * np.einsum("ai,ai->a", axes, reference_sd)[:, np.newaxis]
+    )
+
 
-    ax = rotation[::3]
-    ay = rotation[1::3]
-    az = rotation[2::3]
+def _compile_parameters(parameters):
+    r"""
+    Compiles interaction parameters into the stacked arrays.
 
-    thetas = np.sqrt(ax**2 + ay**2 + az**2)
+    Parameters
+    ----------
+    parameters : :py:class:`._InteractionParameters`
+        Parameters with all nus equal to ``(0, 0, 0)`` and alphas that refer to the
+        magnetic atoms.
 
-    r = []
-    for alpha in range(len(thetas)):
-        theta = thetas[alpha]
+    Returns
+    -------
+    compiled : dict
+        Dictionary ``{n: (alphas, tensors)}``, where ``alphas`` is a (T, n)
+        :numpy:`ndarray` of integers and ``tensors`` is a (T, 3, ..., 3)
+        :numpy:`ndarray` with ``n`` dimensions of size 3. ``T`` is the amount of
+        parameters with the given ``n``. Only present values of ``n`` are included.
+    """
 
-        if theta < np.finfo(float).eps:
-            continue
+    compiled = {}
 
-        r = np.array([ax[alpha], ay[alpha], az[alpha]]) / theta
+    for n in [1, 2, 3, 4]:
+        blocks = [block for block in parameters._get_blocks(n=n) if len(block) > 0]
 
-        directions[alpha] = (
-            np.cos(theta) * directions[alpha]
-            + np.sin(theta) * np.cross(r, directions[alpha])
-            + (1 - np.cos(theta)) * r * (r @ directions[alpha])
-        )
+        if len(blocks) > 0:
+            compiled[n] = (
+                np.concatenate([block.alphas for block in blocks], axis=0),
+                np.concatenate([block.tensors for block in blocks], axis=0),
+            )
+
+    return compiled
+
+
+def _lbfgs_direction(gradient, s_history, y_history):
+    r"""
+    Computes search direction of the L-BFGS method with the two-loop recursion.
+
+    Parameters
+    ----------
+    gradient : (N,) :numpy:`ndarray`
+        Gradient at the current point.
+    s_history : list of (N,) :numpy:`ndarray`
+        Steps of the previous iterations, from the oldest to the newest.
+    y_history : list of (N,) :numpy:`ndarray`
+        Changes of the gradient at the previous iterations, from the oldest to the
+        newest.
+
+    Returns
+    -------
+    search_direction : (N,) :numpy:`ndarray`
+        :math:`-H_k\nabla f_k`, where :math:`H_k` is the approximation of the
+        inverse Hessian.
+    """
+
+    q = gradient.copy()
+
+    rhos = [1.0 / (y @ s) for s, y in zip(s_history, y_history)]
+    coefficients = []
+
+    for s, y, rho in zip(reversed(s_history), reversed(y_history), reversed(rhos)):
+        coefficients.append(rho * (s @ q))
+        q -= coefficients[-1] * y
+
+    # Initial approximation of the inverse Hessian is gamma * I
+    if len(s_history) > 0:
+        q *= (s_history[-1] @ y_history[-1]) / (y_history[-1] @ y_history[-1])
+
+    for s, y, rho, coefficient in zip(
+        s_history, y_history, rhos, reversed(coefficients)
+    ):
+        q += s * (coefficient - rho * (y @ q))
+
+    return -q
+
+
+def _to_tangent_space(vectors, x, y):
+    r"""
+    Computes components of the vectors in the tangent planes of the spins.
+
+    Parameters
+    ----------
+    vectors : (M, 3) :numpy:`ndarray`
+        Vectors (for instance, torques).
+    x : (M, 3) :numpy:`ndarray`
+        First vectors of the local reference frames.
+    y : (M, 3) :numpy:`ndarray`
+        Second vectors of the local reference frames.
+
+    Returns
+    -------
+    components : (M*2,) :numpy:`ndarray`
+        Components along ``x`` and ``y`` for each spin.
+    """
+
+    return np.stack(
+        (np.einsum("ai,ai->a", vectors, x), np.einsum("ai,ai->a", vectors, y)),
+        axis=1,
+    ).flatten()
+
+
+def _from_tangent_space(components, x, y):
+    r"""
+    Computes vectors from their components in the tangent planes of the spins.
+
+    Parameters
+    ----------
+    components : (M*2,) :numpy:`ndarray`
+        Components along ``x`` and ``y`` for each spin.
+    x : (M, 3) :numpy:`ndarray`
+        First vectors of the local reference frames.
+    y : (M, 3) :numpy:`ndarray`
+        Second vectors of the local reference frames.
+
+    Returns
+    -------
+    vectors : (M*3,) :numpy:`ndarray`
+        Vectors in the global reference frame.
+    """
+
+    components = np.reshape(components, (-1, 2))
+
+    return (components[:, :1] * x + components[:, 1:] * y).flatten()
+
+
+def _steihaug_cg(gradient, hessian, radius, tolerance):
+    r"""
+    Approximately solves the trust-region subproblem with the truncated conjugate
+    gradient method of Steihaug.
+
+    Parameters
+    ----------
+    gradient : (N,) :numpy:`ndarray`
+        Gradient at the current point.
+    hessian : (N, N) :numpy:`ndarray` or sparse matrix
+        Hessian at the current point.
+    radius : float
+        Radius of the trust region.
+    tolerance : float
+        Tolerance for the residual of the Newton equation.
+
+    Returns
+    -------
+    step : (N,) :numpy:`ndarray`
+        Step with ``np.linalg.norm(step) <= radius``.
+    """
+
+    def to_boundary(step, direction):
+        # Positive root of |step + tau * direction| = radius
+        a = direction @ direction
+        b = 2 * (step @ direction)
+        c = step @ step - radius**2
+        tau = (-b + np.sqrt(b**2 - 4 * a * c)) / (2 * a)
+        return step + tau * direction
+
+    step = np.zeros(gradient.shape, dtype=float)
+    residual = gradient.copy()
+    direction = -residual
+
+    if np.linalg.norm(residual) < tolerance:
+        return step
+
+    for _ in range(2 * len(gradient)):
+        hessian_direction = hessian @ direction
+        curvature = direction @ hessian_direction
+
+        # Negative curvature: go to the boundary along it
+        if curvature <= 0:
+            return to_boundary(step, direction)
+
+        alpha = (residual @ residual) / curvature
+        next_step = step + alpha * direction
+
+        if np.linalg.norm(next_step) >= radius:
+            return to_boundary(step, direction)
+
+        next_residual = residual + alpha * hessian_direction
+
+        if np.linalg.norm(next_residual) < tolerance:
+            return next_step
+
+        beta = (next_residual @ next_residual) / (residual @ residual)
+        direction = -next_residual + beta * direction
+        step = next_step
+        residual = next_residual
+
+    return step
+
+
+def _same_up_to_rotation(first, second, tolerance):
+    r"""
+    Checks whether two sets of spin directions differ only by a global rotation.
+
+    Optimal rotation is found with the Kabsch algorithm.
+
+    Parameters
+    ----------
+
+    first : (M, 3) :numpy:`ndarray`
+        First set of spin directions.
+
+    second : (M, 3) :numpy:`ndarray`
+        Second set of spin directions.
+
+    tolerance : float
+        Maximum allowed distance between the rotated ``first`` and ``second`` for each
+        spin.
 
-    return directions
+    Returns
+    -------
+
+    same : bool
+    """
+
+    u, _, vt = np.linalg.svd(first.T @ second)
+
+    # Proper rotation only
+    if np.linalg.det(u @ vt) < 0:
+        u[:, -1] = -u[:, -1]
+
+    return np.linalg.norm(first @ (u @ vt) - second, axis=1).max() < tolerance
 
 
 class Energy:
@@ -277,16 +540,21 @@ class Energy:
         self.spins = np.array(spinham.magnetic_atoms.spins, dtype=float)
         self.M = spinham.M
 
-        self._parameters = _InteractionParameters()
-
+        specs_list, parameters = [], []
         for (n, p_n, _, alphas), parameter in spinham._parameters._container:
             n = len(alphas)
             alphas = tuple([spinham.map_to_magnetic[alpha] for alpha in alphas])
-            self._parameters.add(
-                specs=(n, p_n, tuple([(0, 0, 0)] * (n - 1)), alphas),
-                parameter=parameter,
-                when_present="sum",
-            )
+            specs_list.append((n, p_n, tuple([(0, 0, 0)] * (n - 1)), alphas))
+            parameters.append(parameter)
+
+        self._parameters = _InteractionParameters()
+        self._parameters.add_many(
+            specs_list=specs_list, parameters=parameters, when_present="sum"
+        )
+
+        # Parameters are stacked by n, so that the energy is computed with a few
+        # vectorized contractions instead of a python loop over the parameters
+        self._compiled = _compile_parameters(self._parameters)
 
         spinham.units = initial_units
         spinham.convention = initial_convention
@@ -299,24 +567,38 @@ class Energy:
         )
 
         if quantum_correction:
-            result += self.E_corr(
-                spin_directions=spin_directions, units=units, _normalize=_normalize
-            )
+            if np.ndim(spin_directions) == 3:
+                result += np.array(
+                    [
+                        self.E_corr(
+                            spin_directions=sd, units=units, _normalize=_normalize
+                        )
+                        for sd in spin_directions
+                    ]
+                )
+            else:
+                result += self.E_corr(
+                    spin_directions=spin_directions, units=units, _normalize=_normalize
+                )
         return result
 
-    def E_0(self, spin_directions, units="meV", _normalize=True) -> float:
+    def E_0(self, spin_directions, units="meV", _normalize=True):
         r"""
         Computes classical energy of the spin Hamiltonian.
 
         Parameters
         ----------
 
-        spin_directions : (M, 3) |array-like|_
+        spin_directions : (M, 3) or (K, M, 3) |array-like|_
             Directions of spin vectors. Only directions of vectors are used, modulus is
             ignored. ``M`` is the amount of magnetic atoms in the Hamiltonian. The order
             of spin directions is the same as the order of magnetic atoms in
             ``spinham.magnetic_atoms.spins``.
 
+            .. versionchanged:: 0.7.0
+
+                Stack of ``K`` spin configurations is accepted.
+
         units : str, default "meV"
             .. versionadded:: 0.3.0
 
@@ -331,9 +613,10 @@ class Energy:
         Returns
         -------
 
-        E_0 : float
+        E_0 : float or (K,) :numpy:`ndarray`
             Classic energy of state with ``spin_directions``. Returned in the units of
-            ``units``.
+            ``units``. If a stack of spin configurations is given, then an array of
+            energies is returned, one for each configuration.
 
 
         Examples
@@ -388,51 +671,128 @@ class Energy:
             >>> # The command above is equivalent to
             >>> energy(sd1), energy(sd2), energy(sd3)
             (-4.5, -4.5, -6.75)
+
+        Energies of several spin configurations can be computed at once
+
+        .. doctest::
+
+            >>> energy.E_0([sd1, sd2, sd3])
+            array([-4.5 , -4.5 , -6.75])
         """
 
         spin_directions = np.array(spin_directions, dtype=float)
 
         if _normalize:
             spin_directions = (
-                spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+                spin_directions
+                / np.linalg.norm(spin_directions, axis=-1)[..., np.newaxis]
             )
         spins = spin_directions * self.spins[:, np.newaxis]
 
-        energy = 0
+        # Leading dimension of the stack (if any) is kept by "..."
+        energy = np.zeros(spins.shape[:-2], dtype=float)
 
-        for specs, parameter in self._parameters._container:
-            n, _, _, alphas = specs
+        if 1 in self._compiled:
+            alphas, tensors = self._compiled[1]
+            energy += np.einsum("ti,...ti->...", tensors, spins[..., alphas[:, 0], :])
 
-            if n == 1:
-                energy += parameter @ spins[alphas[0]]
-            elif n == 2:
-                energy += spins[alphas[0]] @ parameter @ spins[alphas[1]]
-            elif n == 3:
-                energy += np.einsum(
-                    "iju,i,j,u",
-                    parameter,
-                    spins[alphas[0]],
-                    spins[alphas[1]],
-                    spins[alphas[2]],
-                )
-            elif n == 4:
-                energy += np.einsum(
-                    "ijuv,i,j,u,v",
-                    parameter,
-                    spins[alphas[0]],
-                    spins[alphas[1]],
-                    spins[alphas[2]],
-                    spins[alphas[3]],
-                )
-            else:
-                raise ValueError(f"Unsupported n={n} in energy calculation.")
+        if 2 in self._compiled:
+            alphas, tensors = self._compiled[2]
+            energy += np.einsum(
+                "tij,...ti,...tj->...",
+                tensors,
+                spins[..., alphas[:, 0], :],
+                spins[..., alphas[:, 1], :],
+            )
+
+        if 3 in self._compiled:
+            alphas, tensors = self._compiled[3]
+            energy += np.einsum(
+                "tiju,...ti,...tj,...tu->...",
+                tensors,
+                spins[..., alphas[:, 0], :],
+                spins[..., alphas[:, 1], :],
+                spins[..., alphas[:, 2], :],
+            )
+
+        if 4 in self._compiled:
+            alphas, tensors = self._compiled[4]
+            energy += np.einsum(
+                "tijuv,...ti,...tj,...tu,...tv->...",
+                tensors,
+                spins[..., alphas[:, 0], :],
+                spins[..., alphas[:, 1], :],
+                spins[..., alphas[:, 2], :],
+                spins[..., alphas[:, 3], :],
+            )
 
         # Convert units if necessary
         if units != "meV":
             units = _validated_units(units=units, supported_units=_ENERGY_UNITS)
             energy = energy * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
 
-        return float(energy)
+        if energy.ndim == 0:
+            return float(energy)
+
+        return energy
+
+    def _spin_gradient(self, spins, return_energy=False):
+        r"""
+        Computes derivatives of the classical energy with respect to the components of
+        the spin vectors directly from the compiled parameters.
+
+        Parameters
+        ----------
+
+        spins : (..., M, 3) :numpy:`ndarray`
+            Spin vectors (not normalized, i.e. directions multiplied by the spin
+            values).
+
+        return_energy : bool, default False
+            Whether to return the classical energy as well. It is obtained from the
+            effective fields at no additional cost.
+
+        Returns
+        -------
+
+        energy : (...) :numpy:`ndarray`
+            Classical energy. Returned only if ``return_energy=True``. Units are meV.
+
+        gradient : (..., M, 3) :numpy:`ndarray`
+            Derivatives :math:`\partial E^{(0)} / \partial S_{\alpha}^i`. Units are meV.
+        """
+
+        energy = np.zeros(spins.shape[:-2], dtype=float)
+        gradient = np.zeros(spins.shape, dtype=float)
+
+        for n, (alphas, tensors) in self._compiled.items():
+            indices = "ijuv"[:n]
+
+            # Each of the n spins of the term is differentiated in turn, the
+            # contraction with the remaining n-1 spins is the effective field
+            for k in range(n):
+                others = [m for m in range(n) if m != k]
+
+                subscripts = [f"t{indices}"] + [f"...t{indices[m]}" for m in others]
+
+                field = np.einsum(
+                    ",".join(subscripts) + f"->...t{indices[k]}",
+                    tensors,
+                    *[spins[..., alphas[:, m], :] for m in others],
+                )
+
+                np.add.at(gradient, (Ellipsis, alphas[:, k], slice(None)), field)
+
+                # Contraction of the field with the spin it acts on gives the energy
+                if return_energy and k == 0:
+                    energy += np.einsum(
+                        "...ti,...ti->...", field, spins[..., alphas[:, 0], :]
+                    )
+
+        if return_energy:
+            return energy, gradient
+
+        return gradient
 
     def E_corr(self, spin_directions, units="mev", _normalize=True) -> float:
         r"""
@@ -571,12 +931,16 @@ class Energy:
         Parameters
         ----------
 
-        spin_directions : (M, 3) |array-like|_
+        spin_directions : (M, 3) or (K, M, 3) |array-like|_
             Directions of spin vectors. Only directions of vectors are used,
             modulus is ignored. ``M`` is the amount of magnetic atoms in the
             Hamiltonian. The order of spin directions is the same as the order
             of magnetic atoms in ``spinham.magnetic_atoms.spins``.
 
+            .. versionchanged:: 0.7.0
+
+                Stack of ``K`` spin configurations is accepted.
+
         units : str, default "meV"
             .. versionadded:: 0.3.0
 
@@ -597,11 +961,16 @@ class Energy:
                 This option is experimental. Will be improved and tested in future
                 releases. Use with caution.
 
+            .. versionchanged:: 0.7.0
+
+                Gradient of :py:func:`.Energy.E_corr` is computed analytically.
+
         Returns
         -------
 
-        gradient : (M, 3) :numpy:`ndarray`
-            Gradient of energy.
+        gradient : (M, 3) or (K, M, 3) :numpy:`ndarray`
+            Gradient of energy. If a stack of spin configurations is given, then a
+            stack of gradients is returned.
 
             .. code-block:: python
 
@@ -616,35 +985,21 @@ class Energy:
 
         if _normalize:
             spin_directions = (
-                spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+                spin_directions
+                / np.linalg.norm(spin_directions, axis=-1)[..., np.newaxis]
             )
 
-        gradient = np.zeros((self.M, 3), dtype=float)
-
-        for _, alphas, parameter in _InteractionParametersIterator(
-            _renormalized_parameters(
-                parameters=self._parameters,
-                convention=self.convention,
-                spin_directions=spin_directions,
-                spin_values=self.spins,
-            ),
-            n=1,
-            p_n=1,
-        ):
-            gradient[alphas[0]] = parameter * self.spins[alphas[0]]
+        # dE / dz = S * dE / dS
+        gradient = (
+            self._spin_gradient(spins=spin_directions * self.spins[:, np.newaxis])
+            * self.spins[:, np.newaxis]
+        )
 
-        if quantum_correction:
-            sd = spin_directions.copy()
-            h = 1e-6
-            for alpha in range(self.M):
-                for i in range(3):
-                    sd[alpha][i] += h
-                    energy_plus = self.E_corr(spin_directions=sd, _normalize=False)
-                    sd[alpha][i] -= 2 * h
-                    energy_minus = self.E_corr(spin_directions=sd, _normalize=False)
-                    sd[alpha][i] += h
-
-                    gradient[alpha][i] += (energy_plus - energy_minus) / 2 / h
+        if quantum_correction and spin_directions.ndim == 3:
+            for k in range(len(spin_directions)):
+                gradient[k] += self._E_corr_gradient(spin_directions=spin_directions[k])
+        elif quantum_correction:
+            gradient += self._E_corr_gradient(spin_directions=spin_directions)
 
         # Convert units if necessary
         if units != "meV":
@@ -653,6 +1008,256 @@ class Energy:
 
         return gradient
 
+    def _on_site_parameters(self, spins, positions_size, backward=None):
+        r"""
+        Computes renormalized on-site parameters with ``positions_size`` spin operators
+        directly from the compiled parameters or back-propagates derivatives through
+        them.
+
+        Parameters
+        ----------
+
+        spins : (M, 3) :numpy:`ndarray`
+            Spin vectors (directions multiplied by the spin values).
+
+        positions_size : int
+            Amount of spin operators of the renormalized parameter. 2, 3 or 4.
+
+        backward : (M, 3, ..., 3) :numpy:`ndarray`, optional
+            Derivatives of some scalar with respect to the renormalized on-site
+            parameters.
+
+        Returns
+        -------
+
+        parameters : (M, 3, ..., 3) :numpy:`ndarray`
+            Renormalized on-site parameters if ``backward`` is not given.
+
+        gradient : (M, 3) :numpy:`ndarray`
+            Derivatives of the scalar with respect to the components of ``spins``, if
+            ``backward`` is given.
+        """
+
+        if backward is None:
+            result = np.zeros((self.M,) + (3,) * positions_size, dtype=float)
+        else:
+            result = np.zeros((self.M, 3), dtype=backward.dtype)
+
+        for n, (alphas, tensors) in self._compiled.items():
+            indices = "ijuv"[:n]
+
+            positions_list = [
+                positions
+                for positions in _ON_SITE_POSITIONS.get(n, []) + [tuple(range(n))]
+                if len(positions) == positions_size
+            ]
+
+            for positions in positions_list:
+                mask = (alphas[:, positions] == alphas[:, [positions[0]]]).all(axis=1)
+
+                if not mask.any():
+                    continue
+
+                sites = alphas[mask, positions[0]]
+                kept = "".join([indices[m] for m in positions])
+                contracted = [m for m in range(n) if m not in positions]
+
+                if backward is None:
+                    subscripts = [f"t{indices}"] + [
+                        f"t{indices[m]}" for m in contracted
+                    ]
+                    np.add.at(
+                        result,
+                        sites,
+                        np.einsum(
+                            ",".join(subscripts) + f"->t{kept}",
+                            tensors[mask],
+                            *[spins[alphas[mask, m]] for m in contracted],
+                        ),
+                    )
+                    continue
+
+                for k in contracted:
+                    others = [m for m in contracted if m != k]
+                    subscripts = [f"t{indices}", f"t{kept}"] + [
+                        f"t{indices[m]}" for m in others
+                    ]
+                    np.add.at(
+                        result,
+                        alphas[mask, k],
+                        np.einsum(
+                            ",".join(subscripts) + f"->t{indices[k]}",
+                            tensors[mask],
+                            backward[sites],
+                            *[spins[alphas[mask, m]] for m in others],
+                        ),
+                    )
+
+        return result
+
+    def _E_corr_gradient(self, spin_directions):
+        r"""
+        Computes derivatives of the quantum correction with respect to the components
+        of the spin directional vectors.
+
+        Derivatives of eqs. S.36b-d in supplementary material of |paper-2026|_ are
+        computed analytically. Products of the local reference frame vectors enter
+        the expressions only as
+
+        .. math::
+
+            p_{\alpha}^{i*}p_{\alpha}^j
+            =
+            \delta^{ij}
+            -
+            z_{\alpha}^iz_{\alpha}^j
+            +
+            i\varepsilon^{ijk}z_{\alpha}^k
+
+        thus the gradient does not depend on the choice of the local reference
+        frames.
+
+        Parameters
+        ----------
+
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Directions of spin vectors. Used as is, without normalization.
+
+        Returns
+        -------
+
+        gradient : (M, 3) :numpy:`ndarray`
+            Gradient of :math:`E^{(2)}`. Units are meV.
+        """
+
+        v = spin_directions
+        r = np.linalg.norm(v, axis=1)
+        spins = v / r[:, np.newaxis] * self.spins[:, np.newaxis]
+
+        # Q[a, i, j] = p_a^{i*} p_a^j and its derivatives dQ[a, m, i, j] with respect
+        # to v[a, m]. Frames are scaled with the length of v, as in E_corr with
+        # _normalize=False
+        eye = np.eye(3, dtype=float)
+        epsilon_v = np.einsum("ijk,ak->aij", _LEVI_CIVITA, v)
+
+        Q = (
+            r[:, np.newaxis, np.newaxis] ** 2 * eye
+            - np.einsum("ai,aj->aij", v, v)
+            + 1j * r[:, np.newaxis, np.newaxis] * epsilon_v
+        )
+        dQ = (
+            2 * np.einsum("am,ij->amij", v, eye)
+            - np.einsum("im,aj->amij", eye, v)
+            - np.einsum("ai,jm->amij", v, eye)
+            + 1j * np.einsum("am,aij->amij", v / r[:, np.newaxis], epsilon_v)
+            + 1j * np.einsum("a,ijm->amij", r, _LEVI_CIVITA)
+        )
+
+        gradient = np.zeros((self.M, 3), dtype=complex)
+        spin_gradient = np.zeros((self.M, 3), dtype=complex)
+
+        # S.36b
+        A2 = self._on_site_parameters(spins=spins, positions_size=2)
+        B2 = 0.5 * self.spins[:, np.newaxis, np.newaxis] * Q
+
+        gradient += 0.5 * self.spins[:, np.newaxis] * np.einsum("aij,amij->am", A2, dQ)
+        spin_gradient += self._on_site_parameters(
+            spins=spins, positions_size=2, backward=B2
+        )
+
+        # S.36c
+        A3 = self._on_site_parameters(spins=spins, positions_size=3)
+        B3 = (
+            -0.5
+            * self.spins[:, np.newaxis, np.newaxis, np.newaxis]
+            * np.einsum("aik,aj->aijk", Q, v)
+        )
+
+        gradient -= (
+            0.5
+            * self.spins[:, np.newaxis]
+            * (
+                np.einsum("aijk,amik,aj->am", A3, dQ, v)
+                + np.einsum("aimk,aik->am", A3, Q)
+            )
+        )
+        spin_gradient += self._on_site_parameters(
+            spins=spins, positions_size=3, backward=B3
+        )
+
+        # S.36d (first term)
+        A4 = self._on_site_parameters(spins=spins, positions_size=4)
+        c_1 = np.where(np.round(2 * self.spins) > 1, self.spins - 0.5, 0)
+        c_2 = 0.5 * self.spins
+
+        gradient += (
+            0.5
+            * self.spins[:, np.newaxis]
+            * (
+                np.einsum("aijkl,amil,aj,ak->am", A4, dQ, v, v)
+                + np.einsum("aimkl,ail,ak->am", A4, Q, v)
+                + np.einsum("aijml,ail,aj->am", A4, Q, v)
+                + c_1[:, np.newaxis]
+                * (
+                    np.einsum("aijkl,amil,ajk->am", A4, dQ, Q)
+                    + np.einsum("aijkl,ail,amjk->am", A4, Q, dQ)
+                )
+                + c_2[:, np.newaxis]
+                * (
+                    np.einsum("aijkl,amil,akj->am", A4, dQ, Q)
+                    + np.einsum("aijkl,ail,amkj->am", A4, Q, dQ)
+                )
+            )
+        )
+
+        # S.36d (second term)
+        if 4 in self._compiled:
+            alphas, tensors = self._compiled[4]
+
+            # With all nus equal to (0, 0, 0), p_n = 3 means two distinct pairs of
+            # alphas
+            all_equal = (alphas == alphas[:, [0]]).all(axis=1)
+            pairs = (
+                (alphas[:, 0] == alphas[:, 1]) & (alphas[:, 2] == alphas[:, 3])
+                | (alphas[:, 0] == alphas[:, 2]) & (alphas[:, 1] == alphas[:, 3])
+                | (alphas[:, 0] == alphas[:, 3]) & (alphas[:, 1] == alphas[:, 2])
+            )
+            mask = pairs & ~all_equal
+
+            alpha_1 = alphas[mask, 0]
+            alpha_2 = alphas[mask, 2]
+            factor = 0.75 * self.spins[alpha_1] * self.spins[alpha_2]
+
+            np.add.at(
+                gradient,
+                alpha_1,
+                factor[:, np.newaxis]
+                * np.einsum(
+                    "tijkl,tmij,tkl->tm", tensors[mask], dQ[alpha_1], Q[alpha_2]
+                ),
+            )
+            np.add.at(
+                gradient,
+                alpha_2,
+                factor[:, np.newaxis]
+                * np.einsum(
+                    "tijkl,tij,tmkl->tm", tensors[mask], Q[alpha_1], dQ[alpha_2]
+                ),
+            )
+
+        # Renormalized parameters depend on the normalized spin directions
+        z = v / r[:, np.newaxis]
+        gradient += (
+            self.spins[:, np.newaxis]
+            / r[:, np.newaxis]
+            * (
+                spin_gradient
+                - z * np.einsum("ai,ai->a", z, spin_gradient)[:, np.newaxis]
+            )
+        )
+
+        return gradient.real
+
     def torque(
         self, spin_directions, units="meV", _normalize=True, quantum_correction=False
     ):
@@ -662,12 +1267,16 @@ class Energy:
         Parameters
         ----------
 
-        spin_directions : (M, 3) |array-like|_
+        spin_directions : (M, 3) or (K, M, 3) |array-like|_
             Directions of spin vectors. Only directions of vectors are used,
             modulus is ignored. ``M`` is the amount of magnetic atoms in the
             Hamiltonian. The order of spin directions is the same as the order
             of magnetic atoms in ``spinham.magnetic_atoms.spins``.
 
+            .. versionchanged:: 0.7.0
+
+                Stack of ``K`` spin configurations is accepted.
+
         units : str, default "meV"
             .. versionadded:: 0.3.0
 
@@ -690,7 +1299,9 @@ class Energy:
         Returns
         -------
 
-        torque : (M, 3) :numpy:`ndarray`
+        torque : (M, 3) or (K, M, 3) :numpy:`ndarray`
+            Torque on each spin. If a stack of spin configurations is given, then a
+            stack of torques is returned.
 
             .. code-block:: python
 
@@ -706,40 +1317,359 @@ class Energy:
             ),
         )
 
-    def _zoom(
-        self,
-        reference_sd,
-        search_direction,
-        phi_0,
-        der_0,
-        alpha_lo,
-        alpha_hi,
-        c1=_C1,
-        c2=_C2,
-        quantum_correction=False,
-    ):
-        sd_lo = _rotate_sd(
-            reference_sd=reference_sd, rotation=alpha_lo * search_direction
-        )
-        sd_hi = _rotate_sd(
-            reference_sd=reference_sd, rotation=alpha_hi * search_direction
-        )
+    def hessian(self, spin_directions, units="meV", _normalize=True, sparse=None):
+        r"""
+        Computes Hessian of the classical energy (:math:`E^{(0)}`) in the tangent
+        space of the spin directions.
 
-        phi_lo = self(spin_directions=sd_lo, quantum_correction=quantum_correction)
-        phi_hi = self(spin_directions=sd_hi, quantum_correction=quantum_correction)
+        .. versionadded:: 0.7.0
 
-        der_lo = (
-            self.torque(
-                spin_directions=sd_lo, quantum_correction=quantum_correction
-            ).flatten()
-            @ search_direction
-        )
-        der_hi = (
-            self.torque(
-                spin_directions=sd_hi, quantum_correction=quantum_correction
-            ).flatten()
-            @ search_direction
+        Each spin direction :math:`\boldsymbol{z}_{\alpha}` is varied as
+
+        .. math::
+
+            \boldsymbol{z}_{\alpha}
+            \rightarrow
+            \boldsymbol{z}_{\alpha}
+            +
+            u_{\alpha}\boldsymbol{x}_{\alpha}
+            +
+            v_{\alpha}\boldsymbol{y}_{\alpha}
+            +
+            \mathcal{O}(u_{\alpha}^2, v_{\alpha}^2)
+
+        along the great circles of the unit sphere, where
+        :math:`\boldsymbol{x}_{\alpha}` and :math:`\boldsymbol{y}_{\alpha}` are the
+        vectors of the local reference frame (see :py:func:`.span_local_rfs`). Hessian
+        is the matrix of the second derivatives with respect to
+        :math:`(u_1, v_1, u_2, v_2, ..., u_M, v_M)`.
+
+        Parameters
+        ----------
+
+        spin_directions : (M, 3) |array-like|_
+            Directions of spin vectors. Only directions of vectors are used,
+            modulus is ignored. ``M`` is the amount of magnetic atoms in the
+            Hamiltonian. The order of spin directions is the same as the order
+            of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+
+        units : str, default "meV"
+            Units of energy. See :ref:`user-guide_usage_units_energy` for the full
+            list of supported units.
+
+        _normalize : bool, default True
+            Whether to normalize the spin_directions or use the provided vectors as is.
+            This parameter is technical and we do not recommend to use it at all.
+
+        sparse : bool, optional
+            Whether to return a sparse matrix. Requires |scipy|_. By default, sparse
+            matrix is returned if ``M > 1000`` and |scipy|_ is available.
+
+        Returns
+        -------
+
+        hessian : (2M, 2M) :numpy:`ndarray` or :py:class:`scipy.sparse.csr_array`
+            Hessian of the classical energy. Eigenvalues are non-negative at the local
+            minima of the energy. Global rotations of the spins produce zero
+            eigenvalues for the isotropic Hamiltonians.
+
+        Raises
+        ------
+
+        ImportError
+            If ``sparse=True`` and |scipy|_ is not available.
+        """
+
+        if sparse is None:
+            sparse = SCIPY_AVAILABLE and self.M > _SPARSE_HESSIAN_M
+
+        if sparse and not SCIPY_AVAILABLE:
+            raise ImportError("Sparse Hessian requires scipy, please install it.")
+
+        spin_directions = np.array(spin_directions, dtype=float)
+
+        if _normalize:
+            spin_directions = (
+                spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+            )
+
+        spins = spin_directions * self.spins[:, np.newaxis]
+
+        x, y, _ = span_local_rfs(directional_vectors=spin_directions, hybridize=False)
+        # frames[alpha] = [x_alpha, y_alpha] scaled by the spin value, as
+        # d^2 E / dz dz = S * d^2 E / dS dS * S
+        frames = np.stack((x, y), axis=1) * self.spins[:, np.newaxis, np.newaxis]
+
+        rows = []
+        columns = []
+        data = []
+
+        for n, (alphas, tensors) in self._compiled.items():
+            indices = "ijuv"[:n]
+
+            # Each ordered pair of spins of the term is differentiated
+            for first in range(n):
+                for second in range(n):
+                    if first == second:
+                        continue
+
+                    others = [m for m in range(n) if m not in [first, second]]
+                    subscripts = [
+                        f"t{indices}",
+                        f"tm{indices[first]}",
+                        f"tn{indices[second]}",
+                    ] + [f"t{indices[m]}" for m in others]
+
+                    data.append(
+                        np.einsum(
+                            ",".join(subscripts) + "->tmn",
+                            tensors,
+                            frames[alphas[:, first]],
+                            frames[alphas[:, second]],
+                            *[spins[alphas[:, m]] for m in others],
+                        ).flatten()
+                    )
+                    # Indices of the (2, 2) blocks, flattened in the same order
+                    rows.append(
+                        (2 * alphas[:, first, np.newaxis] + [0, 0, 1, 1]).flatten()
+                    )
+                    columns.append(
+                        (2 * alphas[:, second, np.newaxis] + [0, 1, 0, 1]).flatten()
+                    )
+
+        # Curvature of the sphere
+        gradient = self._spin_gradient(spins=spins) * self.spins[:, np.newaxis]
+        rows.append(np.arange(2 * self.M))
+        columns.append(np.arange(2 * self.M))
+        data.append(-np.repeat(np.einsum("ai,ai->a", spin_directions, gradient), 2))
+
+        rows = np.concatenate(rows)
+        columns = np.concatenate(columns)
+        data = np.concatenate(data)
+
+        # Convert units if necessary
+        if units != "meV":
+            units = _validated_units(units=units, supported_units=_ENERGY_UNITS)
+            data = data * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
+
+        if sparse:
+            return coo_array(
+                (data, (rows, columns)), shape=(2 * self.M, 2 * self.M)
+            ).tocsr()
+
+        hessian = np.zeros((2 * self.M, 2 * self.M), dtype=float)
+        np.add.at(hessian, (rows, columns), data)
+
+        return hessian
+
+    def is_stable(self, spin_directions, energy_tolerance=1e-8):
+        r"""
+        Checks whether the spin directions describe a classically stable state, i.e. a
+        local minimum of the classical energy (:math:`E^{(0)}`).
+
+        .. versionadded:: 0.7.0
+
+        All eigenvalues of the :py:meth:`.Energy.hessian` have to be non-negative. It
+        is a cheap check before the calculation of the magnon energies, as the magnon
+        energies of the unstable state are imaginary or negative. It is meaningful only
+        if ``spin_directions`` describe an equilibrium (torque is zero).
+
+        Parameters
+        ----------
+
+        spin_directions : (M, 3) |array-like|_
+            Directions of spin vectors. Only directions of vectors are used,
+            modulus is ignored. ``M`` is the amount of magnetic atoms in the
+            Hamiltonian. The order of spin directions is the same as the order
+            of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+
+        energy_tolerance : float, default 1e-8
+            Numerical accuracy for comparing eigenvalues of the Hessian to zero. In the
+            units of meV.
+
+        Returns
+        -------
+
+        result : bool
+            ``True`` if the smallest eigenvalue of the Hessian is larger than
+            ``-energy_tolerance``. ``False`` otherwise.
+        """
+
+        hessian = self.hessian(spin_directions=spin_directions)
+
+        if isinstance(hessian, np.ndarray):
+            lowest = np.linalg.eigvalsh(hessian)[0]
+        else:
+            lowest = eigsh(hessian, k=1, which="SA", return_eigenvectors=False)[0]
+
+        return bool(lowest > -energy_tolerance)
+
+    def energy_and_torque(
+        self, spin_directions, units="meV", _normalize=True, quantum_correction=False
+    ):
+        r"""
+        Computes energy and torque on each spin in one pass.
+
+        .. versionadded:: 0.7.0
+
+        Spin vectors are prepared and the parameters are traversed only once, thus it
+        is faster than the separate calls of :py:meth:`.Energy.__call__` and
+        :py:meth:`.Energy.torque`.
+
+        Parameters
+        ----------
+
+        spin_directions : (M, 3) or (K, M, 3) |array-like|_
+            Directions of spin vectors. Only directions of vectors are used,
+            modulus is ignored. ``M`` is the amount of magnetic atoms in the
+            Hamiltonian. The order of spin directions is the same as the order
+            of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+
+        units : str, default "meV"
+            Units of energy. See :ref:`user-guide_usage_units_energy` for the full
+            list of supported units.
+
+        _normalize : bool, default True
+            Whether to normalize the spin_directions or use the provided vectors as is.
+            This parameter is technical and we do not recommend to use it at all.
+
+        quantum_correction : bool, default False
+            Whether to include quantum correction to the energy and torque. If
+            ``True``, then computes :py:func:`.Energy.E_0` + :py:func:`.Energy.E_corr`.
+            If ``False``, then computes :py:func:`.Energy.E_0` only.
+
+            .. warning::
+                This option is experimental. Will be improved and tested in future
+                releases. Use with caution.
+
+        Returns
+        -------
+
+        energy : float or (K,) :numpy:`ndarray`
+            Energy of the state with ``spin_directions``. Same as
+            :py:meth:`.Energy.__call__`.
+
+        torque : (M, 3) or (K, M, 3) :numpy:`ndarray`
+            Torque on each spin. Same as :py:meth:`.Energy.torque`.
+        """
+
+        initial_directions = np.array(spin_directions, dtype=float)
+        spin_directions = initial_directions
+
+        if _normalize:
+            spin_directions = (
+                spin_directions
+                / np.linalg.norm(spin_directions, axis=-1)[..., np.newaxis]
+            )
+
+        energy, gradient = self._spin_gradient(
+            spins=spin_directions * self.spins[:, np.newaxis], return_energy=True
+        )
+        gradient *= self.spins[:, np.newaxis]
+
+        if quantum_correction:
+            for index in np.ndindex(spin_directions.shape[:-2]):
+                energy[index] += self.E_corr(
+                    spin_directions=spin_directions[index], _normalize=False
+                )
+                gradient[index] += self._E_corr_gradient(
+                    spin_directions=spin_directions[index]
+                )
+
+        # Convert units if necessary
+        if units != "meV":
+            units = _validated_units(units=units, supported_units=_ENERGY_UNITS)
+            energy = energy * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
+            gradient = gradient * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
+
+        if energy.ndim == 0:
+            energy = float(energy)
+
+        return energy, np.cross(initial_directions, gradient)
+
+    def _trial_point(
+        self, reference_sd, search_direction, alpha, cache, quantum_correction=False
+    ):
+        r"""
+        Evaluates energy and torque at the trial point of the line search.
+
+        Parameters
+        ----------
+
+        reference_sd : (M, 3) :numpy:`ndarray`
+            Reference direction of the spin vectors.
+
+        search_direction : (M*3,) :numpy:`ndarray`
+            Search direction.
+
+        alpha : float
+            Step along the search direction.
+
+        cache : dict
+            Results of the previous evaluations, keyed on the rotation. Has to be
+            emptied when ``reference_sd`` changes.
+
+        quantum_correction : bool, default False
+            Whether to include quantum correction.
+
+        Returns
+        -------
+
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Rotated directions of the spin vectors.
+
+        energy : float
+            Energy at the trial point.
+
+        torque : (M*3,) :numpy:`ndarray`
+            Torque at the trial point.
+        """
+
+        rotation = alpha * search_direction
+        key = rotation.tobytes()
+
+        if key not in cache:
+            spin_directions = _rotate_sd(reference_sd=reference_sd, rotation=rotation)
+            energy, torque = self.energy_and_torque(
+                spin_directions=spin_directions, quantum_correction=quantum_correction
+            )
+            cache[key] = (spin_directions, energy, torque.flatten())
+
+        return cache[key]
+
+    def _zoom(
+        self,
+        reference_sd,
+        search_direction,
+        phi_0,
+        der_0,
+        alpha_lo,
+        alpha_hi,
+        c1=_C1,
+        c2=_C2,
+        quantum_correction=False,
+        cache=None,
+    ):
+        if cache is None:
+            cache = {}
+
+        _, phi_lo, torque_lo = self._trial_point(
+            reference_sd=reference_sd,
+            search_direction=search_direction,
+            alpha=alpha_lo,
+            cache=cache,
+            quantum_correction=quantum_correction,
         )
+        _, phi_hi, torque_hi = self._trial_point(
+            reference_sd=reference_sd,
+            search_direction=search_direction,
+            alpha=alpha_hi,
+            cache=cache,
+            quantum_correction=quantum_correction,
+        )
+
+        der_lo = torque_lo @ search_direction
+        der_hi = torque_hi @ search_direction
 
         trial_steps = 0
         phi_min = None
@@ -753,11 +1683,14 @@ class Energy:
                 der_l=der_lo,
                 der_h=der_hi,
             )
-            # Evaluate \phi(\alpha_i)
-            sd_j = _rotate_sd(
-                reference_sd=reference_sd, rotation=alpha_j * search_direction
+            # Evaluate \phi(\alpha_i) and \phi^{\prime}(\alpha_i)
+            _, phi_j, torque_j = self._trial_point(
+                reference_sd=reference_sd,
+                search_direction=search_direction,
+                alpha=alpha_j,
+                cache=cache,
+                quantum_correction=quantum_correction,
             )
-            phi_j = self(spin_directions=sd_j, quantum_correction=quantum_correction)
 
             # Safeguard
             if phi_min is None:
@@ -770,13 +1703,7 @@ class Energy:
             if trial_steps > 10:
                 return alpha_j
 
-            # Evaluate \phi^{\prime}(\alpha_i)
-            der_j = (
-                self.torque(
-                    spin_directions=sd_j, quantum_correction=quantum_correction
-                ).flatten()
-                @ search_direction
-            )
+            der_j = torque_j @ search_direction
 
             if phi_j > phi_0 + c1 * alpha_j * der_0 or phi_j >= phi_lo:
                 alpha_hi = alpha_j
@@ -804,16 +1731,20 @@ class Energy:
         alpha_max=2.0,
         max_iterations=10000,
         quantum_correction=False,
+        cache=None,
     ):
+        if cache is None:
+            cache = {}
+
         # First check if step alpha=1 is good to go:
-        sd_1 = _rotate_sd(reference_sd=reference_sd, rotation=search_direction)
-        phi_1 = self(spin_directions=sd_1, quantum_correction=quantum_correction)
-        der_1 = (
-            self.torque(
-                spin_directions=sd_1, quantum_correction=quantum_correction
-            ).flatten()
-            @ search_direction
+        _, phi_1, torque_1 = self._trial_point(
+            reference_sd=reference_sd,
+            search_direction=search_direction,
+            alpha=1.0,
+            cache=cache,
+            quantum_correction=quantum_correction,
         )
+        der_1 = torque_1 @ search_direction
 
         if phi_1 <= phi_0 + c1 * der_0 and abs(der_1) <= c2 * abs(der_0):
             return 1.0
@@ -824,16 +1755,14 @@ class Energy:
         phi_prev = phi_0
         der_prev = der_0
 
-        sd_max = _rotate_sd(
-            reference_sd=reference_sd, rotation=alpha_max * search_direction
-        )
-        phi_max = self(spin_directions=sd_max, quantum_correction=quantum_correction)
-        der_max = (
-            self.torque(
-                spin_directions=sd_max, quantum_correction=quantum_correction
-            ).flatten()
-            @ search_direction
+        _, phi_max, torque_max = self._trial_point(
+            reference_sd=reference_sd,
+            search_direction=search_direction,
+            alpha=alpha_max,
+            cache=cache,
+            quantum_correction=quantum_correction,
         )
+        der_max = torque_max @ search_direction
 
         alpha_i = _cubic_interpolation(
             alpha_l=alpha_prev,
@@ -845,11 +1774,14 @@ class Energy:
         )
 
         for i in range(1, max_iterations):
-            # Evaluate \phi(\alpha_i)
-            sd_i = _rotate_sd(
-                reference_sd=reference_sd, rotation=alpha_i * search_direction
+            # Evaluate \phi(\alpha_i) and \phi^{\prime}(\alpha_i)
+            _, phi_i, torque_i = self._trial_point(
+                reference_sd=reference_sd,
+                search_direction=search_direction,
+                alpha=alpha_i,
+                cache=cache,
+                quantum_correction=quantum_correction,
             )
-            phi_i = self(spin_directions=sd_i, quantum_correction=quantum_correction)
 
             if phi_i > phi_0 + c1 * alpha_i * der_0 or (i > 1 and phi_i >= phi_prev):
                 return self._zoom(
@@ -860,15 +1792,10 @@ class Energy:
                     alpha_lo=alpha_prev,
                     alpha_hi=alpha_i,
                     quantum_correction=quantum_correction,
+                    cache=cache,
                 )
 
-            # Evaluate \phi^{\prime}(\alpha_i)
-            der_i = (
-                self.torque(
-                    spin_directions=sd_i, quantum_correction=quantum_correction
-                ).flatten()
-                @ search_direction
-            )
+            der_i = torque_i @ search_direction
 
             if abs(der_i) <= -c2 * der_0:
                 return alpha_i
@@ -882,6 +1809,7 @@ class Energy:
                     alpha_lo=alpha_i,
                     alpha_hi=alpha_prev,
                     quantum_correction=quantum_correction,
+                    cache=cache,
                 )
 
             # Choose alpha_{i+1}
@@ -905,6 +1833,122 @@ class Energy:
             f"Line search did not converge in {max_iterations} iterations."
         )
 
+    def _trust_newton(
+        self, initial_sd, tolerance, initial_radius=0.5, max_radius=np.pi, eta=0.1
+    ):
+        r"""
+        Minimizes classical energy with the trust-region Newton method.
+
+        Parameters
+        ----------
+
+        initial_sd : (M, 3) :numpy:`ndarray`
+            Normalized initial directions of the spin vectors.
+
+        tolerance : (2,) :numpy:`ndarray`
+            Energy and torque tolerances.
+
+        initial_radius : float, default 0.5
+            Initial radius of the trust region (in radians).
+
+        max_radius : float, default np.pi
+            Maximum radius of the trust region (in radians).
+
+        eta : float, default 0.1
+            Step is accepted if the ratio of the actual and predicted energy reductions
+            is larger than ``eta``.
+
+        Yields
+        ------
+
+        step_counter : int
+            Number of the accepted step.
+
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Spin directions after the step.
+
+        energy : float
+            Energy after the step.
+
+        delta : (2,) :numpy:`ndarray`
+            Change of energy and maximum torque after the step.
+        """
+
+        sd_k = initial_sd
+        energy_k, torque_k = self.energy_and_torque(spin_directions=sd_k)
+
+        radius = initial_radius
+        step_counter = 1
+
+        while True:
+            # Model of the energy is built once per accepted point. Torque is
+            # z x gradient, thus its components along y and -x are the components of
+            # the gradient along x and y.
+            x, y, z = span_local_rfs(directional_vectors=sd_k, hybridize=False)
+            gradient = _to_tangent_space(torque_k, y, -x)
+            hessian = self.hessian(spin_directions=sd_k, _normalize=False)
+
+            gradient_norm = np.linalg.norm(gradient)
+
+            # Only the radius changes for the rejected steps
+            while True:
+                step = _steihaug_cg(
+                    gradient=gradient,
+                    hessian=hessian,
+                    radius=radius,
+                    tolerance=min(0.5, gradient_norm) * gradient_norm,
+                )
+                step_norm = np.linalg.norm(step)
+                predicted = -(gradient @ step + 0.5 * step @ (hessian @ step))
+
+                # Move along the great circles: rotation axis is z x displacement
+                displacement = np.reshape(step, (self.M, 2))
+                displacement = displacement[:, :1] * x + displacement[:, 1:] * y
+                sd_next = _rotate_sd(
+                    reference_sd=sd_k, rotation=np.cross(z, displacement).flatten()
+                )
+                energy_next, torque_next = self.energy_and_torque(
+                    spin_directions=sd_next
+                )
+
+                # Reductions below the numerical noise are accepted as they are
+                if abs(predicted) <= 10 * np.finfo(float).eps * max(1, abs(energy_k)):
+                    rho = 1
+                else:
+                    rho = (energy_k - energy_next) / predicted
+
+                if rho < 0.25:
+                    radius = 0.25 * radius
+                elif rho > 0.75 and step_norm > 0.99 * radius:
+                    radius = min(2 * radius, max_radius)
+
+                if rho > eta:
+                    break
+
+                if radius < np.finfo(float).eps:
+                    raise RuntimeError(
+                        "Trust region of the trust-newton optimizer collapsed. Try a "
+                        "different initial guess (i.e. re-run magnopy-optimize-sd or "
+                        "energy.optimize())."
+                    )
+
+            delta = np.array(
+                [
+                    abs(energy_next - energy_k),
+                    np.linalg.norm(torque_next, axis=1).max(),
+                ]
+            )
+
+            yield step_counter, sd_next, energy_next, delta
+
+            if (delta < tolerance).all():
+                return
+
+            sd_k = sd_next
+            energy_k = energy_next
+            torque_k = torque_next
+            step_counter += 1
+
     def optimize(
         self,
         initial_guess=None,
@@ -912,6 +1956,9 @@ class Energy:
         torque_tolerance=1e-5,
         quiet=False,
         quantum_correction=False,
+        optimizer="bfgs",
+        history_length=10,
+        tangent_space=False,
     ):
         r"""
         Optimizes classical energy by varying the directions of spins in the unit cell.
@@ -940,23 +1987,88 @@ class Energy:
                 This option is experimental. Will be improved and tested in future
                 releases. Use with caution.
 
+        optimizer : str, default "bfgs"
+            .. versionadded:: 0.7.0
+
+            Optimization method. Case-insensitive. Supported methods are
+
+            * "bfgs" - quasi-Newton method with the dense approximation of the inverse
+              Hessian. Memory and time per step scale as :math:`\mathcal{O}(M^2)`.
+            * "lbfgs" - limited-memory version of "bfgs". The inverse Hessian is
+              approximated with the last ``history_length`` steps. Memory and time per
+              step scale as :math:`\mathcal{O}(M)`. Recommended for large supercells.
+            * "trust-newton" - trust-region Newton method in the tangent space with the
+              analytic :py:meth:`.Energy.hessian`. Converges quadratically near the
+              minimum and handles degenerate minima. Does not support
+              ``quantum_correction``.
+
+        history_length : int, default 10
+            .. versionadded:: 0.7.0
+
+            Amount of previous steps that are kept by the "lbfgs" optimizer. Ignored by
+            other optimizers.
+
+        tangent_space : bool, default False
+            .. versionadded:: 0.7.0
+
+            Whether to optimize in the 2M-dimensional tangent space of the spin
+            directions. By default the step is parametrized by 3M components of the
+            rotation vectors, one of three components of each rotation does not change
+            the spin. In the tangent space each spin has only two degrees of freedom,
+            given in its local reference frame (see :py:func:`.span_local_rfs`). Local
+            reference frames are rotated together with the spins. It usually reduces the
+            amount of iterations for non-collinear and frustrated systems.
+
         Returns
         -------
 
         optimized_directions : (M, 3) :numpy:`ndarray`
             Optimized direction of the spin vectors.
 
+        Raises
+        ------
+
+        ValueError
+            If ``optimizer`` is not supported or ``history_length < 1``.
+
+        ValueError
+            If ``optimizer="trust-newton"`` and ``quantum_correction=True``.
+
         See Also
         --------
 
         optimize_generator
         """
 
+        optimizer = str(optimizer).lower()
+        if optimizer not in ["bfgs", "lbfgs", "trust-newton"]:
+            raise ValueError(
+                'Supported optimizers are "bfgs", "lbfgs" and "trust-newton", '
+                f'got "{optimizer}".'
+            )
+
+        if optimizer == "trust-newton" and quantum_correction:
+            raise ValueError(
+                'Optimizer "trust-newton" does not support quantum correction.'
+            )
+
+        if optimizer == "lbfgs" and (
+            not isinstance(history_length, int) or history_length < 1
+        ):
+            raise ValueError(
+                f"Expected positive integer for history_length, got {history_length}."
+            )
+
         if initial_guess is None:
             initial_guess = np.random.uniform(low=-1, high=1, size=(self.M, 3))
 
         sd_k = initial_guess / np.linalg.norm(initial_guess, axis=1)[:, np.newaxis]
 
+        if tangent_space:
+            frame_x, frame_y, _ = span_local_rfs(
+                directional_vectors=sd_k, hybridize=False
+            )
+
         if not quiet:
             n_energy = max(-(int(log10(energy_tolerance)) - 2), 12)
             n_torque = max(-(int(log10(torque_tolerance)) - 2), 6)
@@ -987,14 +2099,41 @@ class Energy:
 
         tolerance = np.array([energy_tolerance, torque_tolerance], dtype=float)
 
+        if optimizer == "trust-newton":
+            for step_counter, sd_next, energy_next, delta in self._trust_newton(
+                initial_sd=sd_k, tolerance=tolerance
+            ):
+                if not quiet:
+                    print(
+                        f"{step_counter:<4}   "
+                        f"{energy_next:>11.7f}   "
+                        f"{delta[0]:>{n_energy + 4}.{n_energy}f}   "
+                        f"{delta[1]:>{n_torque + 4}.{n_torque}f}"
+                    )
+
+            if not quiet:
+                print("─" * (33 + n_energy + n_torque))
+            return sd_next
+
         delta = 2 * tolerance
 
-        hessinv_k = np.eye(3 * self.M, dtype=float)
+        # Dimension of the optimization space
+        N = 2 * self.M if tangent_space else 3 * self.M
+
+        if optimizer == "bfgs":
+            hessinv_k = np.eye(N, dtype=float)
+        else:
+            s_history = deque(maxlen=history_length)
+            y_history = deque(maxlen=history_length)
 
-        energy_k = self(spin_directions=sd_k, quantum_correction=quantum_correction)
-        gradient_k = self.torque(
+        energy_k, torque_k = self.energy_and_torque(
             spin_directions=sd_k, quantum_correction=quantum_correction
-        ).flatten()
+        )
+
+        if tangent_space:
+            gradient_k = _to_tangent_space(torque_k, frame_x, frame_y)
+        else:
+            gradient_k = torque_k.flatten()
 
         first_iteration = True
         step_counter = 1
@@ -1003,34 +2142,57 @@ class Energy:
         max_curv_fails = 10
 
         while (delta >= tolerance).any():
-            search_direction = -hessinv_k @ gradient_k
+            if optimizer == "bfgs":
+                search_direction = -hessinv_k @ gradient_k
+            else:
+                search_direction = _lbfgs_direction(
+                    gradient=gradient_k, s_history=s_history, y_history=y_history
+                )
+
+            # Line search is done with the rotation vectors
+            if tangent_space:
+                rotation = _from_tangent_space(search_direction, frame_x, frame_y)
+            else:
+                rotation = search_direction
+
+            # Trial points of the line search are reused for the next step
+            cache = {}
 
             alpha_k = self._line_search(
                 reference_sd=sd_k,
-                search_direction=search_direction,
+                search_direction=rotation,
                 phi_0=energy_k,
                 der_0=gradient_k @ search_direction,
                 quantum_correction=quantum_correction,
+                cache=cache,
             )
 
             s_k = alpha_k * search_direction
 
-            sd_next = _rotate_sd(reference_sd=sd_k, rotation=s_k)
-
-            energy_next = self(
-                spin_directions=sd_next, quantum_correction=quantum_correction
+            sd_next, energy_next, torque_next = self._trial_point(
+                reference_sd=sd_k,
+                search_direction=rotation,
+                alpha=alpha_k,
+                cache=cache,
+                quantum_correction=quantum_correction,
             )
-            gradient_next = self.torque(
-                spin_directions=sd_next, quantum_correction=quantum_correction
-            ).flatten()
+
+            if tangent_space:
+                # Local reference frames are rotated together with the spins, thus
+                # components of the tangent vectors are comparable between the steps
+                frame_x = _rotate_sd(reference_sd=frame_x, rotation=alpha_k * rotation)
+                frame_y = _rotate_sd(reference_sd=frame_y, rotation=alpha_k * rotation)
+                gradient_next = _to_tangent_space(
+                    np.reshape(torque_next, (self.M, 3)), frame_x, frame_y
+                )
+            else:
+                gradient_next = torque_next
 
             delta = np.array(
                 [
                     abs(energy_next - energy_k),
                     # Pay attention to the np.reshape keywords
-                    np.linalg.norm(
-                        np.reshape(gradient_next, (self.M, 3)), axis=1
-                    ).max(),
+                    np.linalg.norm(np.reshape(torque_next, (self.M, 3)), axis=1).max(),
                 ]
             )
 
@@ -1048,40 +2210,64 @@ class Energy:
             y_k = gradient_next - gradient_k
             # Curvature safeguard: avoid divide-by-zero / non-finite ys
             ys = float(y_k @ s_k)
-            EYE = np.eye(hessinv_k.shape[0], dtype=float)
 
-            if (not np.isfinite(ys)) or (abs(ys) < 1e-12):
-                # Degenerate case: skip the inverse-BFGS update (or reset H if preferred)
-                curv_fail_run += 1
-                if curv_fail_run > max_curv_fails:
-                    raise RuntimeError(
-                        f"BFGS curvature failure repeated {curv_fail_run} times: "
-                        f"s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. "
-                        "Try a different initial guess (i.e. re-run magnopy-optimize-sd or energy.optimize())."
+            if optimizer == "lbfgs":
+                # Pairs with non-positive curvature would spoil the descent direction
+                if (not np.isfinite(ys)) or ys < 1e-12:
+                    curv_fail_run += 1
+                    if curv_fail_run > max_curv_fails:
+                        raise RuntimeError(
+                            f"L-BFGS curvature failure repeated {curv_fail_run} times: "
+                            f"s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. "
+                            "Try a different initial guess (i.e. re-run magnopy-optimize-sd or energy.optimize())."
+                        )
+                    # Reset history:
+                    s_history.clear()
+                    y_history.clear()
+                    warnings.warn(
+                        f"L-BFGS curvature failure repeated {curv_fail_run} times: s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. History was reset.",
+                        RuntimeWarning,
+                        stacklevel=2,
                     )
-                # Reset hessian:
-                hessinv_k = EYE
-                warnings.warn(
-                    f"BFGS curvature failure repeated {curv_fail_run} times: s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. Hessian was reset.",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
+                else:
+                    curv_fail_run = 0
+                    s_history.append(s_k)
+                    y_history.append(y_k)
             else:
-                curv_fail_run = 0
-                rho_k = 1.0 / ys
-                OUTER = np.outer(y_k, s_k)
-
-                # Safe initial scaling of H^{-1}
-                if first_iteration:
-                    first_iteration = False
-                    denom = float(y_k @ y_k)
-                    if np.isfinite(denom) and denom > 0.0:
-                        hessinv_k = (ys / denom) * hessinv_k
-
-                # Stable inverse-BFGS update
-                hessinv_k = (EYE - rho_k * OUTER.T) @ hessinv_k @ (
-                    EYE - rho_k * OUTER
-                ) + rho_k * np.outer(s_k, s_k)
+                EYE = np.eye(hessinv_k.shape[0], dtype=float)
+
+                if (not np.isfinite(ys)) or (abs(ys) < 1e-12):
+                    # Degenerate case: skip the inverse-BFGS update (or reset H if preferred)
+                    curv_fail_run += 1
+                    if curv_fail_run > max_curv_fails:
+                        raise RuntimeError(
+                            f"BFGS curvature failure repeated {curv_fail_run} times: "
+                            f"s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. "
+                            "Try a different initial guess (i.e. re-run magnopy-optimize-sd or energy.optimize())."
+                        )
+                    # Reset hessian:
+                    hessinv_k = EYE
+                    warnings.warn(
+                        f"BFGS curvature failure repeated {curv_fail_run} times: s^T y={ys}, ||s||={np.linalg.norm(s_k)}, ||y||={np.linalg.norm(y_k)}. Hessian was reset.",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+                else:
+                    curv_fail_run = 0
+                    rho_k = 1.0 / ys
+                    OUTER = np.outer(y_k, s_k)
+
+                    # Safe initial scaling of H^{-1}
+                    if first_iteration:
+                        first_iteration = False
+                        denom = float(y_k @ y_k)
+                        if np.isfinite(denom) and denom > 0.0:
+                            hessinv_k = (ys / denom) * hessinv_k
+
+                    # Stable inverse-BFGS update
+                    hessinv_k = (EYE - rho_k * OUTER.T) @ hessinv_k @ (
+                        EYE - rho_k * OUTER
+                    ) + rho_k * np.outer(s_k, s_k)
 
             sd_k = sd_next
             energy_k = energy_next
@@ -1094,6 +2280,236 @@ class Energy:
             print("─" * (33 + n_energy + n_torque))
         return sd_next
 
+    def _optimize_start(self, seed, initial_guess=None, **kwargs):
+        r"""
+        Runs one start of :py:meth:`.Energy.optimize_multistart`.
+
+        Parameters
+        ----------
+
+        seed : :py:class:`numpy.random.SeedSequence`
+            Seed of the random initial guess. Ignored if ``initial_guess`` is given.
+
+        initial_guess : (M, 3) |array-like|_, optional
+            Initial guess for the direction of the spin vectors.
+
+        **kwargs
+            Passed to :py:meth:`.Energy.optimize`.
+
+        Returns
+        -------
+
+        result : tuple or None
+            ``(energy, spin_directions)`` of the found minimum or ``None`` if the
+            optimization failed.
+        """
+
+        if initial_guess is None:
+            initial_guess = np.random.default_rng(seed).uniform(
+                low=-1, high=1, size=(self.M, 3)
+            )
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                spin_directions = self.optimize(
+                    initial_guess=initial_guess, quiet=True, **kwargs
+                )
+        except RuntimeError:
+            return None
+
+        energy = self(
+            spin_directions=spin_directions,
+            _normalize=False,
+            quantum_correction=kwargs["quantum_correction"],
+        )
+
+        return energy, spin_directions
+
+    def optimize_multistart(
+        self,
+        n_starts=10,
+        number_processors=None,
+        number_threads=None,
+        seed=None,
+        rotation_tolerance=1e-3,
+        initial_guess=None,
+        energy_tolerance=1e-5,
+        torque_tolerance=1e-5,
+        quiet=False,
+        quantum_correction=False,
+        optimizer="bfgs",
+        history_length=10,
+        tangent_space=False,
+    ):
+        r"""
+        Optimizes classical energy starting from many random initial guesses.
+
+        .. versionadded:: 0.7.0
+
+        Each start is an independent run of :py:meth:`.Energy.optimize`. Starts are
+        distributed over a pool of processes. Found states are grouped into distinct
+        local minima: two states are the same minimum if their energies differ by less
+        than ``10 * energy_tolerance`` and one of them is mapped onto the other by a
+        global rotation of all spins.
+
+        Parameters
+        ----------
+
+        n_starts : int, default 10
+            Amount of starts.
+
+        number_processors : int, optional
+            By default Magnopy uses all available processes. Pass
+            ``number_processors=1`` to run in serial.
+
+        number_threads : int, optional
+            Total number of threads, that can be used by Magnopy. Each process uses at
+            most ``number_threads // number_processors`` threads for BLAS (requires
+            |threadpoolctl|_). By default it is equal to the number of available
+            processors.
+
+        seed : int, optional
+            Seed for the random initial guesses. Pass it to reproduce the run.
+
+        rotation_tolerance : float, default 1e-3
+            Maximum distance between the spin directions of two states (after the
+            optimal global rotation), that are considered to be the same minimum.
+
+        initial_guess : (M, 3) or (3,) |array-like|_, optional
+            Initial guess for the first start. Other starts use random initial guesses.
+
+        energy_tolerance : float, default 1e-5
+            See :py:meth:`.Energy.optimize`.
+
+        torque_tolerance : float, default 1e-5
+            See :py:meth:`.Energy.optimize`.
+
+        quiet : bool, default False
+            Whether to suppress the summary of the found minima. Individual runs are
+            always quiet.
+
+        quantum_correction : bool, default False
+            See :py:meth:`.Energy.optimize`.
+
+        optimizer : str, default "bfgs"
+            See :py:meth:`.Energy.optimize`.
+
+        history_length : int, default 10
+            See :py:meth:`.Energy.optimize`.
+
+        tangent_space : bool, default False
+            See :py:meth:`.Energy.optimize`.
+
+        Returns
+        -------
+
+        optimized_directions : (M, 3) :numpy:`ndarray`
+            Spin directions of the minimum with the lowest energy.
+
+        minima : list of tuple
+            Distinct local minima sorted by energy. Each element is
+            ``(energy, spin_directions, count)``, where ``count`` is the amount of starts
+            that converged to this minimum. Energy is in meV.
+
+        Raises
+        ------
+
+        ValueError
+            If ``n_starts`` is not a positive integer.
+
+        RuntimeError
+            If all starts failed.
+
+        See Also
+        --------
+
+        optimize
+
+        Notes
+        -----
+
+        When using this method in your Python scripts make sure to safeguard your
+        script with the ``if __name__ == "__main__":``. See
+        :py:func:`.multiprocess_over_k` for details.
+        """
+
+        if not isinstance(n_starts, int) or n_starts < 1:
+            raise ValueError(f"Expected positive integer for n_starts, got {n_starts}.")
+
+        kwargs = dict(
+            energy_tolerance=energy_tolerance,
+            torque_tolerance=torque_tolerance,
+            quantum_correction=quantum_correction,
+            optimizer=optimizer,
+            history_length=history_length,
+            tangent_space=tangent_space,
+        )
+
+        seeds = np.random.SeedSequence(seed).spawn(n_starts)
+        initial_guesses = [initial_guess] + [None] * (n_starts - 1)
+
+        number_processors, blas_threads = _get_thread_layout(
+            number_processors=number_processors, number_threads=number_threads
+        )
+        number_processors = min(number_processors, n_starts)
+
+        if number_processors == 1:
+            with _limit_blas_threads(blas_threads):
+                results = [
+                    self._optimize_start(seed=seed, initial_guess=guess, **kwargs)
+                    for seed, guess in zip(seeds, initial_guesses)
+                ]
+        else:
+            with Pool(
+                number_processors,
+                initializer=_initialize_energy_worker,
+                initargs=(self, blas_threads),
+            ) as p:
+                results = p.starmap(
+                    _optimize_start,
+                    [
+                        (seed, guess, kwargs)
+                        for seed, guess in zip(seeds, initial_guesses)
+                    ],
+                )
+
+        results = sorted(
+            [result for result in results if result is not None], key=lambda x: x[0]
+        )
+
+        if len(results) == 0:
+            raise RuntimeError(
+                f"All {n_starts} starts of the optimization failed. Try a different "
+                "optimizer or tolerance parameters."
+            )
+
+        minima = []
+        for energy, spin_directions in results:
+            for i, (minimum_energy, minimum_sd, count) in enumerate(minima):
+                if abs(energy - minimum_energy) < 10 * energy_tolerance and (
+                    _same_up_to_rotation(
+                        first=spin_directions,
+                        second=minimum_sd,
+                        tolerance=rotation_tolerance,
+                    )
+                ):
+                    minima[i] = (minimum_energy, minimum_sd, count + 1)
+                    break
+            else:
+                minima.append((energy, spin_directions, 1))
+
+        if not quiet:
+            print(
+                f"Found {len(minima)} distinct local minima in {n_starts} starts "
+                f"({n_starts - len(results)} failed)."
+            )
+            print(f"{'Rank':<4}   {'Energy, meV':>15}   {'Count':>5}")
+            for rank, (energy, _, count) in enumerate(minima):
+                print(f"{rank + 1:<4}   {energy:>15.7f}   {count:>5}")
+
+        return minima[0][1], minima
+
 
 # Populate __all__ with objects defined in this file
 __all__ = list(set(dir()) - old_dir)
@@ -0,0 +1,361 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import wulfric
+
+from magnopy._lswt import LSWT
+
+try:
+    import spglib
+
+    SPGLIB_AVAILABLE = True
+except ImportError:
+    SPGLIB_AVAILABLE = False
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+
+def _validated_kmesh(kmesh):
+    r"""
+    Returns the sizes of the mesh as a tuple of three positive integers.
+
+    Raises
+    ------
+
+    ValueError
+        If ``kmesh`` is not three positive integers.
+    """
+
+    try:
+        kmesh = tuple(int(n) for n in kmesh)
+    except (TypeError, ValueError):
+        raise ValueError(f"Expected three positive integers for kmesh, got {kmesh}.")
+
+    if len(kmesh) != 3 or min(kmesh) < 1:
+        raise ValueError(f"Expected three positive integers for kmesh, got {kmesh}.")
+
+    return kmesh
+
+
+def get_kmesh(kmesh):
+    r"""
+    Returns the points of the uniform |MP|_ mesh of k-points.
+
+    .. versionadded:: 0.7.0
+
+    Mesh is centered at the :math:`\Gamma` point, the points are
+
+    .. math::
+
+        \boldsymbol{k}_{i_1 i_2 i_3}
+        =
+        \dfrac{i_1}{n_1}\boldsymbol{b}_1
+        +
+        \dfrac{i_2}{n_2}\boldsymbol{b}_2
+        +
+        \dfrac{i_3}{n_3}\boldsymbol{b}_3,
+        \qquad
+        i_j = 0, \dots, n_j - 1.
+
+    Parameters
+    ----------
+
+    kmesh : (3, ) tuple of int
+        Sizes of the mesh :math:`(n_1, n_2, n_3)`.
+
+    Returns
+    -------
+
+    kpoints : (n_1 n_2 n_3, 3) :numpy:`ndarray`
+        Relative coordinates of the k-points. Index :math:`i_3` runs the fastest.
+
+    Raises
+    ------
+
+    ValueError
+        If ``kmesh`` is not three positive integers.
+
+    See Also
+    --------
+
+    get_irreducible_kmesh
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import magnopy
+        >>> magnopy.get_kmesh((2, 1, 2))
+        array([[0. , 0. , 0. ],
+               [0. , 0. , 0.5],
+               [0.5, 0. , 0. ],
+               [0.5, 0. , 0.5]])
+    """
+
+    kmesh = _validated_kmesh(kmesh)
+
+    addresses = np.indices(kmesh).reshape((3, -1)).T
+
+    return addresses / np.array(kmesh, dtype=float)
+
+
+def _get_kpoint_operations(spinham, spin_directions, spglib_symprec):
+    r"""
+    Returns the point operations, that leave the magnon energies invariant.
+
+    Operations are the rotational parts of the magnetic space group of the crystal,
+    where the magnetic moments are given by the spin vectors. Antiunitary operations
+    (combined with time reversal) map :math:`\boldsymbol{k}` to
+    :math:`-\boldsymbol{k}`, thus their rotations are multiplied by :math:`-1`.
+
+    Returns
+    -------
+
+    rotations : (n, 3, 3) :numpy:`ndarray`
+        Rotations with respect to the real space basis vectors (integers).
+    """
+
+    cell = np.array(spinham.cell, dtype=float)
+
+    magmoms = np.zeros((len(spinham.atoms.names), 3), dtype=float)
+    spin_directions = np.array(spin_directions, dtype=float)
+    spin_directions = (
+        spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+    )
+    for alpha, index in enumerate(spinham.map_to_all):
+        magmoms[index] = spin_directions[alpha] * spinham.magnetic_atoms.spins[alpha]
+
+    dataset = spglib.get_magnetic_symmetry(
+        (
+            cell,
+            np.array(spinham.atoms.positions, dtype=float),
+            wulfric.get_spglib_types(atoms=spinham.atoms),
+            magmoms,
+        ),
+        symprec=spglib_symprec,
+    )
+
+    if dataset is None:
+        return np.eye(3, dtype=int)[np.newaxis]
+
+    magnetic_field = np.array(spinham.magnetic_field, dtype=float)
+
+    rotations = []
+    for rotation, time_reversal in zip(dataset["rotations"], dataset["time_reversals"]):
+        sign = -1 if time_reversal else 1
+
+        # External magnetic field (axial vector) has to be invariant as well
+        cartesian = cell.T @ rotation @ np.linalg.inv(cell.T)
+        transformed = sign * np.linalg.det(cartesian) * cartesian @ magnetic_field
+        if not np.allclose(transformed, magnetic_field):
+            continue
+
+        rotations.append(sign * rotation)
+
+    return np.unique(np.array(rotations, dtype=int), axis=0)
+
+
+def _verified_operations(lswt, rotations, n_kpoints=3, tolerance=1e-8):
+    r"""
+    Keeps only the operations, that leave the magnon energies invariant.
+
+    Parameters of the spin Hamiltonian might have lower symmetry, than the crystal
+    structure. Each operation is tested by the comparison of the magnon energies at the
+    few random k-points.
+
+    Parameters
+    ----------
+
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+
+    rotations : (n, 3, 3) :numpy:`ndarray`
+        Rotations with respect to the real space basis vectors.
+
+    n_kpoints : int, default 3
+        Number of random k-points.
+
+    tolerance : float, default 1e-8
+        Tolerance for the comparison of the energies.
+
+    Returns
+    -------
+
+    rotations : (n', 3, 3) :numpy:`ndarray`
+        Operations, that passed the test.
+    """
+
+    kpoints = np.random.default_rng(0).uniform(size=(n_kpoints, 3))
+
+    # For the relative coordinates of k operation acts as k -> R^T k
+    transformed = np.einsum("nji,kj->nki", rotations, kpoints).reshape((-1, 3))
+
+    reference = lswt.omega(k=kpoints, relative=True)
+    omegas = lswt.omega(k=transformed, relative=True).reshape(
+        (len(rotations), n_kpoints, -1)
+    )
+
+    passed = [
+        np.allclose(
+            omegas[i], reference, rtol=tolerance, atol=tolerance, equal_nan=True
+        )
+        for i in range(len(rotations))
+    ]
+
+    return rotations[passed]
+
+
+def get_irreducible_kmesh(spinham, spin_directions, kmesh, spglib_symprec=1e-5):
+    r"""
+    Reduces the uniform |MP|_ mesh of k-points to its irreducible part.
+
+    .. versionadded:: 0.7.0
+
+    Two k-points are equivalent, if they are related by an operation of the magnetic
+    space group of the crystal. Spin vectors of the ground state are used as the
+    magnetic moments, therefore only the symmetries of the ground state are used.
+    Operations, that are combined with time reversal, relate :math:`\boldsymbol{k}`
+    and :math:`-R\boldsymbol{k}`. Symmetry is found by |spglib|_.
+
+    Parameters
+    ----------
+
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian. Its cell and all atoms (including non-magnetic ones) define
+        the crystal.
+
+    spin_directions : (M, 3) |array-like|_
+        Directions of the spins of the ground state. Magnitude of the vectors is
+        ignored.
+
+    kmesh : (3, ) tuple of int
+        Sizes of the mesh :math:`(n_1, n_2, n_3)`. See :py:func:`.get_kmesh`.
+
+    spglib_symprec : float, default 1e-5
+        Tolerance parameter for the symmetry search by |spglib|_.
+
+    Returns
+    -------
+
+    kpoints : (N_ir, 3) :numpy:`ndarray`
+        Relative coordinates of the irreducible k-points.
+
+    weights : (N_ir, ) :numpy:`ndarray`
+        Number of k-points of the full mesh, that are equivalent to each irreducible
+        k-point. ``weights.sum()`` is equal to :math:`n_1 n_2 n_3`.
+
+    mapping : (n_1 n_2 n_3, ) :numpy:`ndarray`
+        Index of the irreducible k-point for each k-point of the full mesh (in the
+        order of :py:func:`.get_kmesh`). Use ``values[mapping]`` to unfold the values,
+        that are computed for the irreducible k-points, to the full mesh.
+
+    Raises
+    ------
+
+    ValueError
+        If ``kmesh`` is not three positive integers.
+
+    ImportError
+        If |spglib|_ is not available.
+
+    See Also
+    --------
+
+    get_kmesh
+
+    Notes
+    -----
+
+    Parameters of the spin Hamiltonian might have lower symmetry, than the crystal
+    structure. Therefore, each operation is verified by the comparison of the magnon
+    energies at few random k-points and only the operations, that pass the test, are
+    used.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import magnopy
+        >>> spinham = magnopy.examples.cubic_ferro_nn()
+        >>> kpoints, weights, mapping = magnopy.get_irreducible_kmesh(
+        ...     spinham=spinham, spin_directions=[[0, 0, 1]], kmesh=(4, 4, 4)
+        ... )
+        >>> len(kpoints), int(weights.sum())
+        (18, 64)
+    """
+
+    if not SPGLIB_AVAILABLE:
+        raise ImportError(
+            "spglib is not available. You can install spglib with 'pip install spglib'"
+        )
+
+    kmesh = _validated_kmesh(kmesh)
+
+    rotations = _get_kpoint_operations(
+        spinham=spinham,
+        spin_directions=spin_directions,
+        spglib_symprec=spglib_symprec,
+    )
+
+    rotations = _verified_operations(
+        lswt=LSWT(spinham=spinham, spin_directions=spin_directions),
+        rotations=rotations,
+    )
+
+    spglib_mapping, _ = spglib.get_stabilized_reciprocal_mesh(
+        mesh=kmesh, rotations=rotations, is_time_reversal=False
+    )
+
+    # Convert from the order of spglib (first index runs the fastest)
+    addresses = np.indices(kmesh).reshape((3, -1)).T
+    spglib_mapping = np.array(spglib_mapping)[
+        addresses[:, 0]
+        + addresses[:, 1] * kmesh[0]
+        + addresses[:, 2] * kmesh[0] * kmesh[1]
+    ]
+
+    representatives, mapping, weights = np.unique(
+        spglib_mapping, return_inverse=True, return_counts=True
+    )
+
+    # spglib chooses representatives among the grid points, that are all in the list
+    full_index = np.empty(len(addresses), dtype=int)
+    full_index[
+        addresses[:, 0]
+        + addresses[:, 1] * kmesh[0]
+        + addresses[:, 2] * kmesh[0] * kmesh[1]
+    ] = np.arange(len(addresses))
+
+    kpoints = get_kmesh(kmesh)[full_index[representatives]]
+
+    return kpoints, weights, mapping.reshape(-1)
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
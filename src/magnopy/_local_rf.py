@@ -116,52 +116,13 @@ def span_local_rf(direction_vector, hybridize=False, _normalize=True):
 
     """
 
-    dv = np.array(direction_vector, dtype=float)
-
-    if np.allclose(dv, np.zeros(3)):
-        raise ValueError("Zero vector.")
-
-    scale = np.linalg.norm(dv)
-    dv /= scale
-
-    if np.allclose(dv, [0, 0, 1]):
-        x_alpha = np.array([1, 0, 0], dtype=float)
-        y_alpha = np.array([0, 1, 0], dtype=float)
-    elif np.allclose(dv, [0, 0, -1]):
-        x_alpha = np.array([0, -1, 0], dtype=float)
-        y_alpha = np.array([-1, 0, 0], dtype=float)
-    else:
-        z_dir = [0, 0, 1]
-
-        sin_rot_angle = np.linalg.norm(np.cross(z_dir, dv))
-        cos_rot_angle = np.dot(z_dir, dv)
-        # direction_vector and z_dir are unit vectors
-        ux, uy, uz = np.cross(z_dir, dv) / sin_rot_angle
-
-        x_alpha = np.array(
-            [
-                ux**2 * (1 - cos_rot_angle) + cos_rot_angle,
-                ux * uy * (1 - cos_rot_angle) + uz * sin_rot_angle,
-                ux * uz * (1 - cos_rot_angle) - uy * sin_rot_angle,
-            ]
-        )
-
-        y_alpha = np.array(
-            [
-                ux * uy * (1 - cos_rot_angle) - uz * sin_rot_angle,
-                uy**2 * (1 - cos_rot_angle) + cos_rot_angle,
-                uy * uz * (1 - cos_rot_angle) + ux * sin_rot_angle,
-            ]
-        )
-
-    if not _normalize:
-        x_alpha *= scale
-        y_alpha *= scale
-        dv *= scale
+    x_alpha, y_alpha, z_alpha = span_local_rfs(
+        directional_vectors=[direction_vector], hybridize=False, _normalize=_normalize
+    )
 
     if hybridize:
-        return x_alpha + 1j * y_alpha, dv
-    return x_alpha, y_alpha, dv
+        return x_alpha[0] + 1j * y_alpha[0], z_alpha[0]
+    return x_alpha[0], y_alpha[0], z_alpha[0]
 
 
 def span_local_rfs(directional_vectors, hybridize=False, _normalize=True):
@@ -218,23 +179,52 @@ def span_local_rfs(directional_vectors, hybridize=False, _normalize=True):
                [ 0.57735027,  0.57735027,  0.57735027]])
     """
 
-    results = []
+    dv = np.array(directional_vectors, dtype=float)
 
-    for directional_vector in directional_vectors:
-        results.append(
-            span_local_rf(
-                direction_vector=directional_vector,
-                hybridize=hybridize,
-                _normalize=_normalize,
-            )
-        )
+    if dv.ndim != 2 or dv.shape[1] != 3:
+        raise ValueError(f"Expected an array of the shape (M, 3), got {dv.shape}.")
 
-    results = np.array(results)
+    if np.isclose(dv, 0).all(axis=1).any():
+        raise ValueError("Zero vector.")
+
+    scales = np.linalg.norm(dv, axis=1)[:, np.newaxis]
+    dv /= scales
+
+    # Rotation of the global reference frame around the axis z x dv. For the unit
+    # vectors (1 - cos) / sin^2 = 1 / (1 + cos), the former is used in the southern
+    # hemisphere to avoid the cancellation in 1 + cos.
+    dx, dy, cos_rot_angle = dv.T
+    north = np.isclose(dv, [0, 0, 1]).all(axis=1)
+    south = np.isclose(dv, [0, 0, -1]).all(axis=1)
+    sin_squared = dx**2 + dy**2
+    factor = np.divide(
+        1, 1 + cos_rot_angle, out=np.zeros(len(dv)), where=cos_rot_angle >= 0
+    )
+    factor = np.divide(
+        1 - cos_rot_angle, sin_squared, out=factor, where=(cos_rot_angle < 0) & ~south
+    )
+
+    x_alphas = np.stack(
+        (cos_rot_angle + dy**2 * factor, -dx * dy * factor, -dx), axis=1
+    )
+    y_alphas = np.stack(
+        (-dx * dy * factor, cos_rot_angle + dx**2 * factor, -dy), axis=1
+    )
+
+    x_alphas[north] = [1, 0, 0]
+    y_alphas[north] = [0, 1, 0]
+    x_alphas[south] = [0, -1, 0]
+    y_alphas[south] = [-1, 0, 0]
+
+    if not _normalize:
+        x_alphas *= scales
+        y_alphas *= scales
+        dv *= scales
 
     if hybridize:
-        return results[:, 0], results[:, 1]
+        return x_alphas + 1j * y_alphas, dv
 
-    return results[:, 0], results[:, 1], results[:, 2]
+    return x_alphas, y_alphas, dv
 
 
 # Populate __all__ with objects defined in this file
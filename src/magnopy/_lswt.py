@@ -21,8 +21,7 @@
 
 import numpy as np
 
-from magnopy._diagonalization import solve_via_colpa
-from magnopy._exceptions import ColpaFailed
+from magnopy._diagonalization import solve_via_colpa_batched
 from magnopy._local_rf import span_local_rfs
 
 from magnopy._data_validation import _validated_units
@@ -36,6 +35,102 @@ old_dir = set(dir())
 old_dir.add("old_dir")
 
 
+def _validated_kpoints(k):
+    r"""
+    Brings one k-point or a list of k-points to the (N, 3) form.
+
+    Parameters
+    ----------
+
+    k : (3,) or (N, 3) |array-like|_
+        One reciprocal vector or a list of them.
+
+    Returns
+    -------
+
+    k : (N, 3) :numpy:`ndarray`
+        Reciprocal vectors.
+
+    single_k : bool
+        Whether one k-point was given (``N = 1`` then).
+
+    Raises
+    ------
+
+    ValueError
+        If the shape of ``k`` is neither (3,) nor (N, 3).
+    """
+
+    k = np.array(k, dtype=float)
+
+    single_k = k.ndim == 1
+
+    k = np.atleast_2d(k)
+
+    if k.ndim != 2 or k.shape[1] != 3:
+        raise ValueError(f"Expected k of the shape (3,) or (N, 3), got {k.shape}.")
+
+    return k, single_k
+
+
+def _diagonalize_gdms(GDM, energies_only=False):
+    r"""
+    Diagonalizes a set of grand dynamical matrices with the fallbacks for the
+    Goldstone modes and negative-defined matrices.
+
+    Parameters
+    ----------
+
+    GDM : (N, 2M, 2M) :numpy:`ndarray`
+        Grand dynamical matrices.
+
+    energies_only : bool, default False
+        Whether to skip the computation of the transformation matrices.
+
+    Returns
+    -------
+
+    E : (N, 2M) :numpy:`ndarray`
+        Eigenvalues, NaNs if all attempts failed. Data type is complex.
+
+    G : (N, 2M, 2M) :numpy:`ndarray` or None
+        Transformation matrices, NaNs if all attempts failed. ``None`` if
+        ``energies_only=True``.
+    """
+
+    def solve(matrices):
+        if energies_only:
+            E, failed = solve_via_colpa_batched(matrices, energies_only=True)
+            return E, None, failed
+        return solve_via_colpa_batched(matrices)
+
+    # Diagonalize via Colpa's method
+    E, G, failed = solve(GDM)
+    E = E.astype(complex)
+
+    # Try to diagonalize with suspected Goldstone mode
+    if np.any(failed):
+        indices = np.nonzero(failed)[0]
+        E_f, G_f, failed[indices] = solve(
+            GDM[indices] + (1e-10) * np.eye(GDM.shape[1], dtype=float)
+        )
+        E[indices] = E_f
+        if G is not None:
+            G[indices] = G_f
+
+    # Try to diagonalize for the negative GDMs. NaNs are left if it still fails
+    # Note: solve_via_colpa_batched will return positive eigenvalues,
+    # so we need to negate them back
+    if np.any(failed):
+        indices = np.nonzero(failed)[0]
+        E_f, G_f, failed[indices] = solve(-GDM[indices])
+        E[indices] = -E_f
+        if G is not None:
+            G[indices] = G_f
+
+    return E, G
+
+
 class LSWT:
     r"""
     Linear Spin Wave theory.
@@ -132,9 +227,7 @@ class LSWT:
         spinham.units = initial_units
         spinham.convention = initial_convention
 
-        for i, ((n, p_n, nus, alphas), _) in enumerate(self._parameters._container):
-            alphas = tuple(spinham.map_to_magnetic[alpha] for alpha in alphas)
-            self._parameters._container[i][0] = (n, p_n, nus, alphas)
+        self._parameters._map_alphas(mapping=spinham.map_to_magnetic)
 
         self._parameters = _renormalized_parameters(
             parameters=self._parameters,
@@ -171,6 +264,90 @@ class LSWT:
                 * (self.p[alphas[0]] @ parameter @ self.p[alphas[1]])
             )
 
+        # Dense copies of the lattice sums, used for the evaluation over many k-points
+        self._nus = np.array(list(self.A2), dtype=float).reshape((-1, 3))
+        self._A2 = np.array([self.A2[nu] for nu in self.A2], dtype=complex).reshape(
+            (-1, self.M, self.M)
+        )
+        self._B2 = np.array([self.B2[nu] for nu in self.B2], dtype=complex).reshape(
+            (-1, self.M, self.M)
+        )
+
+    def _get_compiled(self):
+        r"""
+        Returns the arrays, that are sufficient to compute the grand dynamical matrix
+        and to diagonalize it.
+
+        Returns
+        -------
+
+        compiled : dict
+            Keys are ``"nus"``, ``"A1"``, ``"A2"``, ``"B2"`` and ``"cell"``, values are
+            :numpy:`ndarray`.
+        """
+
+        return dict(
+            nus=self._nus,
+            A1=self.A1,
+            A2=self._A2,
+            B2=self._B2,
+            cell=np.array(self.cell, dtype=float),
+        )
+
+    @classmethod
+    def _from_compiled(cls, nus, A1, A2, B2, cell):
+        r"""
+        Creates a light-weight instance from the output of :py:meth:`.LSWT._get_compiled`.
+
+        Only the methods that depend on the k-point (:py:meth:`.LSWT.A`,
+        :py:meth:`.LSWT.B`, :py:meth:`.LSWT.GDM`, :py:meth:`.LSWT.diagonalize`, ...) are
+        functional for such an instance. The arrays are not copied.
+        """
+
+        lswt = cls.__new__(cls)
+        lswt._nus = nus
+        lswt.A1 = A1
+        lswt._A2 = A2
+        lswt._B2 = B2
+        lswt.cell = cell
+        lswt.M = len(A1)
+
+        return lswt
+
+    def _get_exponents(self, k, relative=False):
+        r"""
+        Computes phase factors for every pair of k-point and bond vector.
+
+        Parameters
+        ----------
+
+        k : (N, 3) :numpy:`ndarray`
+            Reciprocal vectors.
+
+        relative : bool, default False
+            Whether ``k`` is given relative to the reciprocal unit cell.
+
+        Returns
+        -------
+
+        exponents : (N, n_nu) :numpy:`ndarray`
+            :math:`e^{i\boldsymbol{k}\boldsymbol{\nu}}`, the order of bond vectors is
+            the same as in ``self._nus``.
+        """
+
+        if relative:
+            phases = 2 * np.pi * (k @ self._nus.T)
+        else:
+            phases = k @ (self._nus @ self.cell).T
+
+        return np.exp(1j * phases)
+
+    def _lattice_sum(self, matrices, exponents):
+        # Sum_nu matrices[nu] * exponents[:, nu] as a single matrix product
+        return (exponents @ matrices.reshape((len(matrices), self.M**2))).reshape(
+            (len(exponents), self.M, self.M)
+        )
+
     def E_2(self, units="meV") -> float:
         r"""
         Computes the correction to the ground state energy that arises from the LSWT.
@@ -293,8 +470,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -311,8 +490,9 @@ class LSWT:
         Returns
         -------
 
-        A : (M, M) :numpy:`ndarray`
-            :math:`A_{\alpha\beta}(\boldsymbol{k})`.
+        A : (M, M) or (N, M, M) :numpy:`ndarray`
+            :math:`A_{\alpha\beta}(\boldsymbol{k})`. If a list of reciprocal vectors
+            is given, then ``A[i]`` corresponds to ``k[i]``.
 
         Notes
         -----
@@ -367,18 +547,14 @@ class LSWT:
             array([[1.+0.j]])
         """
 
-        k = np.array(k)
+        k, single_k = _validated_kpoints(k)
 
-        result = np.zeros((self.M, self.M), dtype=complex)
+        result = self._lattice_sum(
+            self._A2, self._get_exponents(k=k, relative=relative)
+        ) - np.diag(self.A1)
 
-        for nu in self.A2:
-            if relative:
-                phase = 2 * np.pi * (k @ nu)
-            else:
-                phase = k @ (nu @ self.cell)
-            result = result + self.A2[nu] * np.exp(1j * phase)
-
-        result = result - np.diag(self.A1)
+        if single_k:
+            result = result[0]
 
         # Convert units if necessary
         if units != "meV":
@@ -394,8 +570,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector.
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -412,8 +590,9 @@ class LSWT:
         Returns
         -------
 
-        B : (M, M) :numpy:`ndarray`
-            :math:`B_{\alpha\beta}(\boldsymbol{k})`.
+        B : (M, M) or (N, M, M) :numpy:`ndarray`
+            :math:`B_{\alpha\beta}(\boldsymbol{k})`. If a list of reciprocal vectors
+            is given, then ``B[i]`` corresponds to ``k[i]``.
 
         Notes
         -----
@@ -468,16 +647,14 @@ class LSWT:
             array([[0.+0.j]])
         """
 
-        k = np.array(k)
+        k, single_k = _validated_kpoints(k)
 
-        result = np.zeros((self.M, self.M), dtype=complex)
+        result = self._lattice_sum(
+            self._B2, self._get_exponents(k=k, relative=relative)
+        )
 
-        for nu in self.B2:
-            if relative:
-                phase = 2 * np.pi * (k @ nu)
-            else:
-                phase = k @ (nu @ self.cell)
-            result = result + self.B2[nu] * np.exp(1j * phase)
+        if single_k:
+            result = result[0]
 
         # Convert units if necessary
         if units != "meV":
@@ -493,8 +670,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector.
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -511,8 +690,9 @@ class LSWT:
         Returns
         -------
 
-        gdm : (2M, 2M) :numpy:`ndarray`
-            Gran dynamical matrix.
+        gdm : (2M, 2M) or (N, 2M, 2M) :numpy:`ndarray`
+            Grand dynamical matrix. If a list of reciprocal vectors is given, then
+            ``gdm[i]`` corresponds to ``k[i]``.
 
         Notes
         -----
@@ -578,28 +758,172 @@ class LSWT:
                    [0.+0.j, 1.-0.j]])
         """
 
-        k = np.array(k, dtype=float)
+        k, single_k = _validated_kpoints(k)
+
+        # exp(-ik nu) is a complex conjugate of exp(ik nu)
+        exponents = self._get_exponents(k=k, relative=relative)
 
-        A = self.A(k=k, relative=relative, units=units)
-        A_m = self.A(k=-k, relative=relative, units=units)
+        M = self.M
+        gdm = np.empty((len(k), 2 * M, 2 * M), dtype=complex)
 
-        B = self.B(k=k, relative=relative, units=units)
+        B = self._lattice_sum(self._B2, exponents)
+        gdm[:, :M, :M] = self._lattice_sum(self._A2, exponents) - np.diag(self.A1)
+        gdm[:, :M, M:] = B
+        gdm[:, M:, :M] = np.conjugate(np.transpose(B, (0, 2, 1)))
+        gdm[:, M:, M:] = np.conjugate(
+            self._lattice_sum(self._A2, np.conjugate(exponents))
+        ) - np.diag(self.A1)
+
+        # Convert units if necessary
+        if units != "meV":
+            units = _validated_units(units=units, supported_units=_ENERGY_UNITS)
+            gdm = gdm * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
 
-        left = np.concatenate((A, np.conjugate(B).T), axis=0)
-        right = np.concatenate((B, np.conjugate(A_m)), axis=0)
-        gdm = np.concatenate((left, right), axis=1)
+        if single_k:
+            gdm = gdm[0]
 
         return gdm
 
-    def diagonalize(self, k, relative=False, units="meV"):
+    def _fft_on_grid(self, matrices, grid):
+        r"""
+        Computes lattice sums of the matrices on the uniform grid of k-points via fast
+        Fourier transform.
+
+        Parameters
+        ----------
+
+        matrices : (n_nu, M, M) :numpy:`ndarray`
+            Matrices for each bond vector of ``self._nus``.
+
+        grid : (3, ) tuple of int
+            Sizes of the grid.
+
+        Returns
+        -------
+
+        lattice_sums : (n_1, n_2, n_3, M, M) :numpy:`ndarray`
+        """
+
+        nus = np.rint(self._nus).astype(int)
+
+        # Bonds, that are equivalent on the grid, are summed together
+        real_space = np.zeros(grid + (self.M, self.M), dtype=complex)
+        np.add.at(
+            real_space,
+            (nus[:, 0] % grid[0], nus[:, 1] % grid[1], nus[:, 2] % grid[2]),
+            matrices,
+        )
+
+        # Sum over exp(+ik nu), thus inverse transform without normalization
+        return np.fft.ifftn(real_space, axes=(0, 1, 2), norm="forward")
+
+    def gdm_on_grid(self, n1, n2, n3, units="meV"):
+        r"""
+        Computes grand dynamical matrices for all k-points of the uniform grid.
+
+        .. versionadded:: 0.7.0
+
+        Real-space matrices :math:`\boldsymbol{A}_2(\boldsymbol{\nu})` and
+        :math:`\boldsymbol{B}_2(\boldsymbol{\nu})` are placed on the grid of the size
+        :math:`n_1 \times n_2 \times n_3` and all :math:`M \times M` channels are
+        transformed by one fast Fourier transform. The cost is
+        :math:`\mathcal{O}(N\log N)` instead of :math:`\mathcal{O}(N n_{\nu})` for
+        :py:meth:`.LSWT.GDM`, where :math:`N = n_1 n_2 n_3`.
+
+        Parameters
+        ----------
+
+        n1 : int
+            Number of k-points along the first reciprocal lattice vector.
+
+        n2 : int
+            Number of k-points along the second reciprocal lattice vector.
+
+        n3 : int
+            Number of k-points along the third reciprocal lattice vector.
+
+        units : str, default "meV"
+            Units of energy. See :ref:`user-guide_usage_units_energy` for the full
+            list of supported units.
+
+        Returns
+        -------
+
+        gdms : (N, 2M, 2M) :numpy:`ndarray`
+            Grand dynamical matrices for the k-points of the grid in the order of
+            :py:func:`.get_kmesh`. Same as
+            ``lswt.GDM(k=magnopy.get_kmesh((n1, n2, n3)), relative=True)``.
+
+        Raises
+        ------
+
+        ValueError
+            If ``n1``, ``n2`` or ``n3`` are not positive integers.
+
+        See Also
+        --------
+
+        LSWT.GDM
+        get_kmesh
+        solve_via_colpa_batched
+
+        Examples
+        --------
+
+        Output can be diagonalized at once, for example for the density of states
+
+        .. doctest::
+
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+            >>> gdms = lswt.gdm_on_grid(4, 4, 4)
+            >>> gdms.shape
+            (64, 2, 2)
+            >>> E, failed = magnopy.solve_via_colpa_batched(
+            ...     gdms[1:], energies_only=True
+            ... )
+        """
+
+        grid = (n1, n2, n3)
+        if not all(isinstance(n, (int, np.integer)) and n > 0 for n in grid):
+            raise ValueError(
+                f"Expected three positive integers for the grid, got {grid}."
+            )
+
+        M = self.M
+        A = self._fft_on_grid(self._A2, grid)
+        B = self._fft_on_grid(self._B2, grid)
+
+        # Values at -k
+        minus_k = np.ix_(-np.arange(n1) % n1, -np.arange(n2) % n2, -np.arange(n3) % n3)
+
+        gdm = np.empty(grid + (2 * M, 2 * M), dtype=complex)
+        gdm[..., :M, :M] = A - np.diag(self.A1)
+        gdm[..., :M, M:] = B
+        gdm[..., M:, :M] = np.conjugate(np.swapaxes(B, -1, -2))
+        gdm[..., M:, M:] = np.conjugate(A[minus_k]) - np.diag(self.A1)
+
+        gdm = gdm.reshape((-1, 2 * M, 2 * M))
+
+        # Convert units if necessary
+        if units != "meV":
+            units = _validated_units(units=units, supported_units=_ENERGY_UNITS)
+            gdm = gdm * _ENERGY_UNITS["mev"] / _ENERGY_UNITS[units]
+
+        return gdm
+
+    def diagonalize(self, k, relative=False, units="meV", energies_only=False):
         r"""
         Diagonalizes the Hamiltonian for the given ``k`` point.
 
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector.
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -612,20 +936,27 @@ class LSWT:
             Units of energy. See :ref:`user-guide_usage_units_magnon-energy` for the
             full list of supported units.
 
+        energies_only : bool, default False
+            .. versionadded:: 0.7.0
+
+            If ``True``, then the transformation matrix is not computed and only
+            ``omegas`` and ``delta`` are returned. It saves both time and memory.
+
         Returns
         -------
 
-        omegas : (M, ) :numpy:`ndarray`
+        omegas : (M, ) or (N, M) :numpy:`ndarray`
             Array of omegas. Note, that data type is complex. If the ground state is
             correct, then the complex part should be zero.
 
-        delta : float
+        delta : float or (N, ) :numpy:`ndarray`
             Constant energy term that results from diagonalization. Note, that data type
             is complex. If the ground state is correct, then the complex part should be
             zero.
 
-        G : (M, 2M) :numpy:`ndarray`
-            Transformation matrix from the original boson operators.
+        G : (M, 2M) or (N, M, 2M) :numpy:`ndarray`
+            Transformation matrix from the original boson operators. Not returned if
+            ``energies_only=True``.
 
             .. math::
 
@@ -645,6 +976,10 @@ class LSWT:
                     a^{\dagger}_M(-\boldsymbol{k}) \\
                 \end{pmatrix}
 
+        If a list of reciprocal vectors is given, then ``omegas[i]``, ``delta[i]`` and
+        ``G[i]`` correspond to ``k[i]``. If the diagonalization fails for some
+        k-point, then the corresponding values are NaNs.
+
         See Also
         --------
 
@@ -664,31 +999,11 @@ class LSWT:
             (array([2.+0.j]), 0j, array([[1.+0.j, 0.+0.j]]))
         """
 
-        GDM = self.GDM(np.array(k, dtype=float), relative=relative)
-
-        # Diagonalize via Colpa's method
-        try:
-            E, G = solve_via_colpa(GDM)
-        except ColpaFailed:
-            # Try to diagonalize with suspected Goldstone mode
-            try:
-                E, G = solve_via_colpa(
-                    GDM + (1e-10) * np.eye(GDM.shape[0], dtype=float),
-                )
-            # Return NaNs if it still fails
-            except ColpaFailed:
-                # Try to diagonalize for the negative GDMs
-                # Note: solve_via_colpa will return positive eigenvalues,
-                # so we need to negate them back
-                try:
-                    E, G = solve_via_colpa(-GDM)
-                    E = -E
-                except ColpaFailed:
-                    return (
-                        [np.nan for _ in range(self.M)],
-                        np.nan,
-                        [[np.nan for _ in range(2 * self.M)] for _ in range(self.M)],
-                    )
+        k, single_k = _validated_kpoints(k)
+
+        GDM = self.GDM(k, relative=relative)
+
+        E, G = _diagonalize_gdms(GDM, energies_only=energies_only)
 
         # Convert units if necessary
         if units != "meV":
@@ -697,14 +1012,22 @@ class LSWT:
             E = E * tmp_factor
 
         # Factor of two explained in the paper (TODO: add doi after publication)
-        energies = E[: self.M] * 2
-        transformation_matrices = G[: self.M]
+        energies = E[:, : self.M] * 2
+        # Delta term
+        deltas = 0.5 * (np.sum(E[:, self.M :], axis=1) - np.sum(E[:, : self.M], axis=1))
 
-        return (
-            energies,  # energies (M)
-            complex(0.5 * (np.sum(E[self.M :]) - np.sum(E[: self.M]))),  # delta term
-            transformation_matrices,  # transformation matrix (M x 2M)
-        )
+        if energies_only:
+            if single_k:
+                return energies[0], complex(deltas[0])
+            return energies, deltas
+
+        # Transformation matrix (M x 2M)
+        transformation_matrices = G[:, : self.M]
+
+        if single_k:
+            return energies[0], complex(deltas[0]), transformation_matrices[0]
+
+        return energies, deltas, transformation_matrices
 
     def omega(self, k, relative=False, units="meV"):
         r"""
@@ -713,8 +1036,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector.
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -730,7 +1055,7 @@ class LSWT:
 
         Returns
         -------
-        omegas : (M, ) :numpy:`ndarray`
+        omegas : (M, ) or (N, M) :numpy:`ndarray`
             Array of omegas. Note, that data type is complex. If the ground state is correct,
             then the complex part should be zero.
 
@@ -752,7 +1077,9 @@ class LSWT:
             array([2.+0.j])
         """
 
-        return self.diagonalize(k=k, relative=relative, units=units)[0]
+        return self.diagonalize(
+            k=k, relative=relative, units=units, energies_only=True
+        )[0]
 
     def delta(self, k, relative=False, units="meV"):
         r"""
@@ -765,8 +1092,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector.
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -783,7 +1112,7 @@ class LSWT:
         Returns
         -------
 
-        delta : float
+        delta : float or (N, ) :numpy:`ndarray`
             Constant energy term that results from diagonalization. Note, that data type is complex. If the ground state is correct,
             then the complex part should be zero.
 
@@ -804,7 +1133,9 @@ class LSWT:
             >>> lswt.delta(k=[0, 0, 0.5], relative=True)
             0j
         """
-        return self.diagonalize(k=k, relative=relative, units=units)[1]
+        return self.diagonalize(
+            k=k, relative=relative, units=units, energies_only=True
+        )[1]
 
     def G(self, k, relative=False):
         r"""
@@ -821,8 +1152,10 @@ class LSWT:
         Parameters
         ----------
 
-        k : (3,) |array-like|_
-            Reciprocal vector
+        k : (3,) or (N, 3) |array-like|_
+            Reciprocal vector or a list of reciprocal vectors.
+
+            .. versionchanged:: 0.7.0 Accepts a list of reciprocal vectors.
 
         relative : bool, default False
             If ``relative=True``, then ``k`` is interpreted as given relative to the
@@ -832,7 +1165,7 @@ class LSWT:
         Returns
         -------
 
-        G : (M, 2M) :numpy:`ndarray`
+        G : (M, 2M) or (N, M, 2M) :numpy:`ndarray`
             Transformation matrix from the original boson operators.
 
         See Also
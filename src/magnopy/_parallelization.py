@@ -19,15 +19,149 @@
 # ================================ END LICENSE =================================
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
 from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from magnopy._lswt import LSWT
+
+try:
+    from threadpoolctl import threadpool_limits
+
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
 
 # Save local scope at this moment
 old_dir = set(dir())
 old_dir.add("old_dir")
 
 
+# Maximum amount of elements in the stack of grand dynamical matrices, that is
+# diagonalized at once.
+_MAX_BLOCK_ELEMENTS = 2**22
+
+# Amount of k-blocks per process, that keeps the processes evenly loaded.
+_BLOCKS_PER_PROCESS = 4
+
+# State of the worker process, filled by the initializers of the pools.
+_WORKER = {}
+
+
+def _get_thread_layout(number_processors=None, number_threads=None):
+    r"""
+    Distributes the budget of threads between the workers and their BLAS libraries.
+
+    Parameters
+    ----------
+
+    number_processors : int, optional
+        Number of workers (processes or threads). By default it is equal to the
+        ``number_threads``. It is never larger than ``number_threads``.
+
+    number_threads : int, optional
+        Total number of threads, that can be used by Magnopy. By default it is equal to
+        the number of available processors.
+
+    Returns
+    -------
+
+    number_processors : int
+        Number of workers.
+
+    blas_threads : int
+        Number of threads that can be used by BLAS in each worker.
+
+    Raises
+    ------
+
+    ValueError
+        If ``number_processors`` or ``number_threads`` are not positive.
+    """
+
+    if number_threads is None:
+        number_threads = os.cpu_count() or 1
+
+    if number_processors is None:
+        number_processors = number_threads
+
+    if number_processors < 1 or number_threads < 1:
+        raise ValueError(
+            "Expected positive number of processors and threads, got "
+            f"number_processors={number_processors}, number_threads={number_threads}."
+        )
+
+    # One thread per worker at least, thus more workers would oversubscribe the budget
+    number_processors = min(number_processors, number_threads)
+
+    return number_processors, number_threads // number_processors
+
+
+def _limit_blas_threads(blas_threads):
+    r"""
+    Limits the number of threads of BLAS and OpenMP in the current process.
+
+    Parameters
+    ----------
+
+    blas_threads : int
+        Maximum number of threads.
+
+    Returns
+    -------
+
+    limiter : context manager
+        Restores the original limits on exit. Does nothing if |threadpoolctl|_ is not
+        available.
+    """
+
+    if THREADPOOLCTL_AVAILABLE:
+        return threadpool_limits(limits=blas_threads)
+
+    return nullcontext()
+
+
+def _initialize_worker(blas_threads):
+    r"""
+    Initializer of the worker process. Limits the number of BLAS threads.
+    """
+
+    _WORKER["blas_limiter"] = _limit_blas_threads(blas_threads)
+
+
+def _initialize_energy_worker(energy, blas_threads):
+    r"""
+    Initializer of the worker process for :py:meth:`.Energy.optimize_multistart`.
+    Receives the energy once per process and limits the number of BLAS threads.
+    """
+
+    _initialize_worker(blas_threads)
+
+    _WORKER["energy"] = energy
+
+
+def _optimize_start(seed, initial_guess, kwargs):
+    r"""
+    Runs one start of :py:meth:`.Energy.optimize_multistart` in the worker process.
+    """
+
+    return _WORKER["energy"]._optimize_start(
+        seed=seed, initial_guess=initial_guess, **kwargs
+    )
+
+
 def multiprocess_over_k(
-    kpoints, function, relative=False, units="meV", number_processors=None
+    kpoints,
+    function,
+    relative=False,
+    units="meV",
+    number_processors=None,
+    number_threads=None,
 ):
     r"""
     Parallelizes calculation over the kpoints using |multiprocessing|_ module.
@@ -60,6 +194,14 @@ def multiprocess_over_k(
         By default Magnopy uses all available processes. Pass ``number_processors=1`` to
         run in serial.
 
+    number_threads : int, optional
+        .. versionadded:: 0.7.0
+
+        Total number of threads, that can be used by Magnopy. Each process uses at most
+        ``number_threads // number_processors`` threads for BLAS (requires
+        |threadpoolctl|_). The number of processes is reduced to ``number_threads`` if
+        it is larger. By default it is equal to the number of available processors.
+
     Returns
     -------
 
@@ -88,18 +230,634 @@ def multiprocess_over_k(
     |multiprocessing|_ docs.
     """
 
-    relative = [relative for _ in kpoints]
-    units = [units for _ in kpoints]
+    number_processors, blas_threads = _get_thread_layout(
+        number_processors=number_processors, number_threads=number_threads
+    )
 
     if number_processors == 1:
-        results = list(map(function, kpoints, relative, units))
+        with _limit_blas_threads(blas_threads):
+            results = list(map(function, kpoints, repeat(relative), repeat(units)))
     else:
-        with Pool(number_processors) as p:
-            results = p.starmap(function, zip(kpoints, relative, units))
+        with Pool(
+            number_processors, initializer=_initialize_worker, initargs=(blas_threads,)
+        ) as p:
+            results = p.starmap(function, zip(kpoints, repeat(relative), repeat(units)))
 
     return results
 
 
+def _get_blocks(N, M, number_processors):
+    r"""
+    Splits N kpoints into contiguous blocks.
+
+    Parameters
+    ----------
+
+    N : int
+        Amount of kpoints.
+
+    M : int
+        Amount of spins in the unit cell.
+
+    number_processors : int
+        Amount of processes, that share the blocks.
+
+    Returns
+    -------
+
+    blocks : list of tuple of int
+        List of ``(start, stop)`` pairs.
+    """
+
+    size = max(1, _MAX_BLOCK_ELEMENTS // (2 * M) ** 2)
+    size = min(size, -(-N // (_BLOCKS_PER_PROCESS * number_processors)))
+    size = max(1, size)
+
+    return [(start, min(start + size, N)) for start in range(0, N, size)]
+
+
+def _get_k_layout(N, M, chunk_size=None, number_processors=None, number_threads=None):
+    r"""
+    Splits N kpoints into chunks and blocks and distributes the budget of threads
+    between the workers, that process them.
+
+    Parameters
+    ----------
+
+    N : int
+        Amount of kpoints.
+
+    M : int
+        Amount of spins in the unit cell.
+
+    chunk_size : int, optional
+        Number of kpoints in one chunk. By default all kpoints are processed as one
+        chunk.
+
+    number_processors : int, optional
+        See :py:func:`._get_thread_layout`.
+
+    number_threads : int, optional
+        See :py:func:`._get_thread_layout`.
+
+    Returns
+    -------
+
+    chunks : list of list of tuple of int
+        For each chunk the list of ``(start, stop)`` pairs of its blocks.
+
+    number_processors : int
+        Number of workers, that are actually started. Equal to one for the serial run.
+
+    blas_threads : int
+        Number of threads that can be used by BLAS in each worker.
+
+    Raises
+    ------
+
+    ValueError
+        If ``chunk_size``, ``number_processors`` or ``number_threads`` are not
+        positive.
+    """
+
+    if chunk_size is None:
+        chunk_size = max(1, N)
+
+    if chunk_size < 1:
+        raise ValueError(f"Expected positive size of the chunk, got {chunk_size}.")
+
+    number_processors, _ = _get_thread_layout(
+        number_processors=number_processors, number_threads=number_threads
+    )
+
+    chunks = [
+        [
+            (start + block_start, start + block_stop)
+            for block_start, block_stop in _get_blocks(
+                N=min(chunk_size, N - start), M=M, number_processors=number_processors
+            )
+        ]
+        for start in range(0, N, chunk_size)
+    ]
+
+    # Chunks are never larger than the first one, thus there is no need for more
+    # workers, than the amount of blocks in it. The budget of threads is distributed
+    # between the remaining workers, i.e. serial run uses all of it for BLAS.
+    if len(chunks) > 0:
+        number_processors = min(number_processors, len(chunks[0]))
+    else:
+        number_processors = 1
+
+    return (
+        chunks,
+        *_get_thread_layout(
+            number_processors=number_processors, number_threads=number_threads
+        ),
+    )
+
+
+def _share_array(array, handles):
+    r"""
+    Copies an array into a new block of shared memory.
+
+    Parameters
+    ----------
+
+    array : :numpy:`ndarray`
+        Array to be shared.
+
+    handles : list
+        Created :py:class:`multiprocessing.shared_memory.SharedMemory` is appended to
+        this list.
+
+    Returns
+    -------
+
+    spec : tuple
+        ``(name, shape, dtype)`` that is sufficient to attach to the shared array.
+    """
+
+    array = np.ascontiguousarray(array)
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    handles.append(shm)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+
+    return shm.name, array.shape, array.dtype.str
+
+
+def _attach_array(spec, handles):
+    r"""
+    Attaches to the array that was shared by :py:func:`._share_array`.
+
+    Parameters
+    ----------
+
+    spec : tuple
+        ``(name, shape, dtype)`` of the shared array.
+
+    handles : list
+        Attached :py:class:`multiprocessing.shared_memory.SharedMemory` is appended
+        to this list.
+
+    Returns
+    -------
+
+    array : :numpy:`ndarray`
+        Array, that uses shared memory as its buffer.
+    """
+
+    name, shape, dtype = spec
+    shm = SharedMemory(name=name)
+    handles.append(shm)
+
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _shared_view(spec, handles):
+    r"""
+    Returns the array, that was shared by the current process with
+    :py:func:`._share_array`.
+
+    Parameters
+    ----------
+
+    spec : tuple
+        ``(name, shape, dtype)`` of the shared array.
+
+    handles : list
+        List of :py:class:`multiprocessing.shared_memory.SharedMemory`, that contains
+        the shared array.
+
+    Returns
+    -------
+
+    array : :numpy:`ndarray`
+        Array, that uses shared memory as its buffer.
+    """
+
+    name, shape, dtype = spec
+    for shm in handles:
+        if shm.name == name:
+            return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    raise ValueError(f"Shared memory block {name} is not found.")
+
+
+def _initialize_lswt_worker(
+    compiled, kpoints, omegas, deltas, G, relative, units, blas_threads
+):
+    r"""
+    Initializer of the worker process. Attaches to the shared arrays once per process
+    and limits the number of BLAS threads.
+    """
+
+    _initialize_worker(blas_threads)
+
+    handles = []
+
+    _WORKER["lswt"] = LSWT._from_compiled(
+        **{key: _attach_array(compiled[key], handles) for key in compiled}
+    )
+    _WORKER["kpoints"] = _attach_array(kpoints, handles)
+    _WORKER["omegas"] = _attach_array(omegas, handles)
+    _WORKER["deltas"] = _attach_array(deltas, handles)
+    if G is None:
+        _WORKER["G"] = None
+    else:
+        _WORKER["G"] = _attach_array(G, handles)
+    _WORKER["relative"] = relative
+    _WORKER["units"] = units
+    _WORKER["handles"] = handles
+
+
+def _diagonalize_block(start, stop, offset):
+    r"""
+    Diagonalizes one block of kpoints and writes the result into the shared output
+    arrays of the worker process. Output arrays hold one chunk of kpoints, that starts
+    at ``offset``.
+    """
+
+    if _WORKER["G"] is None:
+        G = None
+    else:
+        G = _WORKER["G"][start - offset : stop - offset]
+
+    _diagonalize_block_in_place(
+        lswt=_WORKER["lswt"],
+        kpoints=_WORKER["kpoints"][start:stop],
+        omegas=_WORKER["omegas"][start - offset : stop - offset],
+        deltas=_WORKER["deltas"][start - offset : stop - offset],
+        G=G,
+        relative=_WORKER["relative"],
+        units=_WORKER["units"],
+    )
+
+
+def _diagonalize_block_in_place(lswt, kpoints, omegas, deltas, G, relative, units):
+    r"""
+    Diagonalizes one block of kpoints and writes the result into the given output
+    arrays. Transformation matrices are computed only if ``G`` is not ``None``.
+    """
+
+    if G is None:
+        omegas[:], deltas[:] = lswt.diagonalize(
+            k=kpoints, relative=relative, units=units, energies_only=True
+        )
+    else:
+        omegas[:], deltas[:], G[:] = lswt.diagonalize(
+            k=kpoints, relative=relative, units=units
+        )
+
+
+def _validated_backend(backend):
+    r"""
+    Checks that the parallelization backend is supported.
+
+    Raises
+    ------
+
+    ValueError
+        If ``backend`` is not supported.
+    """
+
+    if backend not in ["processes", "threads"]:
+        raise ValueError(
+            f'Supported backends are "processes" and "threads", got "{backend}".'
+        )
+
+    return backend
+
+
+def _validated_kpoints_list(kpoints):
+    r"""
+    Returns kpoints as an array of the shape (N, 3).
+
+    Raises
+    ------
+
+    ValueError
+        If shape of ``kpoints`` is not (N, 3).
+    """
+
+    kpoints = np.array(kpoints, dtype=float)
+    if kpoints.ndim != 2 or kpoints.shape[1] != 3:
+        raise ValueError(
+            f"Expected a list of kpoints of the shape (N, 3), got {kpoints.shape}."
+        )
+
+    return kpoints
+
+
+def _dispersion_over_k_chunks(
+    lswt,
+    kpoints,
+    omegas,
+    deltas,
+    G=None,
+    chunk_size=None,
+    relative=False,
+    units="meV",
+    number_processors=None,
+    backend="processes",
+    number_threads=None,
+    layout=None,
+):
+    r"""
+    Computes the data of :py:func:`.dispersion_over_k` chunk by chunk and writes it into
+    the given output arrays.
+
+    Output arrays can be of any kind, that supports assignment to the slices, for
+    example memory-mapped arrays. The pool of workers is created only once, while the
+    memory, that is used by the workers, is proportional to the size of one chunk.
+
+    Parameters
+    ----------
+
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+
+    kpoints : (N, 3) :numpy:`ndarray`
+        List of the kpoints.
+
+    omegas : (N, M) array
+        Output array for the energies of the magnon modes.
+
+    deltas : (N, ) array
+        Output array for the constant energy terms.
+
+    G : (N, M, 2M) array, optional
+        Output array for the transformation matrices. If ``None``, then transformation
+        matrices are not computed.
+
+    chunk_size : int, optional
+        Number of kpoints in one chunk. By default all kpoints are processed as one
+        chunk.
+
+    relative : bool, default False
+        See :py:func:`.dispersion_over_k`.
+
+    units : str, default "meV"
+        See :py:func:`.dispersion_over_k`.
+
+    number_processors : int, optional
+        See :py:func:`.dispersion_over_k`.
+
+    backend : str, default "processes"
+        See :py:func:`.dispersion_over_k`.
+
+    number_threads : int, optional
+        See :py:func:`.dispersion_over_k`.
+
+    layout : tuple, optional
+        Layout of the calculation as returned by :py:func:`._get_k_layout`. If given,
+        then ``chunk_size``, ``number_processors`` and ``number_threads`` are ignored.
+        Use it to report the layout, that is actually used.
+
+    Yields
+    ------
+
+    start : int
+        Index of the first kpoint of the chunk, that is written to the output arrays.
+
+    stop : int
+        Index of the kpoint after the last one in the chunk.
+    """
+
+    _validated_backend(backend)
+
+    if layout is None:
+        layout = _get_k_layout(
+            N=len(kpoints),
+            M=lswt.M,
+            chunk_size=chunk_size,
+            number_processors=number_processors,
+            number_threads=number_threads,
+        )
+
+    chunks, number_processors, blas_threads = layout
+
+    if len(chunks) == 0:
+        return
+
+    if number_processors == 1:
+        with _limit_blas_threads(blas_threads):
+            for blocks in chunks:
+                for block_start, block_stop in blocks:
+                    _diagonalize_block_in_place(
+                        lswt=lswt,
+                        kpoints=kpoints[block_start:block_stop],
+                        omegas=omegas[block_start:block_stop],
+                        deltas=deltas[block_start:block_stop],
+                        G=None if G is None else G[block_start:block_stop],
+                        relative=relative,
+                        units=units,
+                    )
+                yield blocks[0][0], blocks[-1][1]
+
+        return
+
+    if backend == "threads":
+        # BLAS threads are shared by all threads of the process
+        with (
+            _limit_blas_threads(blas_threads),
+            ThreadPoolExecutor(number_processors) as executor,
+        ):
+            for blocks in chunks:
+                futures = [
+                    executor.submit(
+                        _diagonalize_block_in_place,
+                        lswt=lswt,
+                        kpoints=kpoints[block_start:block_stop],
+                        omegas=omegas[block_start:block_stop],
+                        deltas=deltas[block_start:block_stop],
+                        G=None if G is None else G[block_start:block_stop],
+                        relative=relative,
+                        units=units,
+                    )
+                    for block_start, block_stop in blocks
+                ]
+                # Propagate the exceptions
+                for future in futures:
+                    future.result()
+
+                yield blocks[0][0], blocks[-1][1]
+
+        return
+
+    size = chunks[0][-1][1] - chunks[0][0][0]
+    handles = []
+    try:
+        compiled = {
+            key: _share_array(array, handles)
+            for key, array in lswt._get_compiled().items()
+        }
+        kpoints_spec = _share_array(kpoints, handles)
+        omegas_spec = _share_array(np.empty((size, lswt.M), dtype=complex), handles)
+        deltas_spec = _share_array(np.empty(size, dtype=complex), handles)
+        if G is None:
+            G_spec = None
+        else:
+            G_spec = _share_array(
+                np.empty((size, lswt.M, 2 * lswt.M), dtype=complex), handles
+            )
+
+        with Pool(
+            number_processors,
+            initializer=_initialize_lswt_worker,
+            initargs=(
+                compiled,
+                kpoints_spec,
+                omegas_spec,
+                deltas_spec,
+                G_spec,
+                relative,
+                units,
+                blas_threads,
+            ),
+        ) as p:
+            for blocks in chunks:
+                start, stop = blocks[0][0], blocks[-1][1]
+                p.starmap(
+                    _diagonalize_block,
+                    [
+                        (block_start, block_stop, start)
+                        for block_start, block_stop in blocks
+                    ],
+                )
+
+                for output, spec in [
+                    (omegas, omegas_spec),
+                    (deltas, deltas_spec),
+                    (G, G_spec),
+                ]:
+                    if output is not None:
+                        output[start:stop] = _shared_view(spec, handles)[: stop - start]
+
+                yield start, stop
+    finally:
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+
+def dispersion_over_k(
+    lswt,
+    kpoints,
+    relative=False,
+    units="meV",
+    number_processors=None,
+    backend="processes",
+    number_threads=None,
+):
+    r"""
+    Computes magnon energies and corrections to the ground state energy for the list of
+    kpoints in parallel.
+
+    .. versionadded:: 0.7.0
+
+    Each process receives the arrays of ``lswt``, that are needed for the calculation,
+    only once via |multiprocessing-shared-memory|_. Then the processes diagonalize
+    contiguous blocks of kpoints and write the results directly into the shared
+    output arrays. Therefore, the cost of the communication between processes does not
+    depend on the size of the spin Hamiltonian.
+
+    Parameters
+    ----------
+
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+
+    kpoints : (N, 3) |array-like|_
+        List of the kpoints.
+
+    relative : bool, default False
+        If ``relative=True``, then ``k`` is interpreted as given relative to the
+        reciprocal unit cell. Otherwise it is interpreted as given in absolute
+        coordinates.
+
+    units : str, default "meV"
+        Units of energy. See :py:attr:`.SpinHamiltonian.units` for the list of
+        supported units.
+
+    number_processors : int, optional
+        By default Magnopy uses all available processes. Pass ``number_processors=1`` to
+        run in serial.
+
+    backend : str, default "processes"
+        Either ``"processes"`` or ``"threads"``. With ``"threads"`` the blocks of
+        kpoints are processed by the pool of threads that share one instance of
+        :py:class:`.LSWT`. Most of the work is done by LAPACK, that releases the GIL,
+        thus threads run in parallel. Threads are started without the overhead of new
+        processes and do not require safeguarding of the main module (see Notes).
+
+    number_threads : int, optional
+        Total number of threads, that can be used by Magnopy. Each process (or thread)
+        uses at most ``number_threads // number_processors`` threads for BLAS (requires
+        |threadpoolctl|_), thus the processors are not oversubscribed. The number of
+        processes (or threads) is reduced to ``number_threads`` if it is larger. By
+        default it is equal to the number of available processors.
+
+    Returns
+    -------
+
+    omegas : (N, M) :numpy:`ndarray`
+        Energies of the magnon modes for each kpoint. Same as
+        :py:meth:`.LSWT.omega`.
+
+    deltas : (N, ) :numpy:`ndarray`
+        Constant energy terms for each kpoint. Same as :py:meth:`.LSWT.delta`.
+
+    See Also
+    --------
+
+    LSWT.diagonalize
+    multiprocess_over_k
+
+    Notes
+    -----
+
+    When using this function of Magnopy with ``backend="processes"`` in your Python
+    scripts make sure to safeguard your script with the
+
+    .. code-block:: python
+
+        import magnopy
+
+        # Import more stuff
+        # or
+        # Define your functions, classes
+
+        if __name__ == "__main__":
+
+            # Write your executable code here
+
+    For more information refer to the  "Safe importing of main module" section in
+    |multiprocessing|_ docs.
+    """
+
+    _validated_backend(backend)
+
+    kpoints = _validated_kpoints_list(kpoints)
+
+    omegas = np.empty((len(kpoints), lswt.M), dtype=complex)
+    deltas = np.empty(len(kpoints), dtype=complex)
+
+    for _ in _dispersion_over_k_chunks(
+        lswt=lswt,
+        kpoints=kpoints,
+        omegas=omegas,
+        deltas=deltas,
+        relative=relative,
+        units=units,
+        number_processors=number_processors,
+        backend=backend,
+        number_threads=number_threads,
+    ):
+        pass
+
+    return omegas, deltas
+
+
 # Populate __all__ with objects defined in this file
 __all__ = list(set(dir()) - old_dir)
 # Remove all semi-private objects
@@ -77,9 +77,7 @@ def is_eigenstate(spinham, spin_directions, energy_tolerance=1e-8):
     parameters = spinham._parameters.copy()
     spinham.convention = initial_convention
 
-    for i, ((n, p_n, nus, alphas), _) in enumerate(parameters._container):
-        alphas = tuple(spinham.map_to_magnetic[alpha] for alpha in alphas)
-        parameters._container[i][0] = (n, p_n, nus, alphas)
+    parameters._map_alphas(mapping=spinham.map_to_magnetic)
 
     renormalized_parameters = _renormalized_parameters(
         parameters=parameters,
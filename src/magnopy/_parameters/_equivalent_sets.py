@@ -18,531 +18,251 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 # ================================ END LICENSE =================================
 
+from itertools import permutations
+
 import numpy as np
 
-from magnopy._parameters._interaction_parameters import _get_specs
-from magnopy._parameters._interaction_parameters import _InteractionParameters
+from magnopy._parameters._interaction_parameters import (
+    _get_specs,
+    _group_starts,
+    _InteractionParameters,
+    _sorting_order,
+)
 
 # Save local scope at this moment
 old_dir = set(dir())
 old_dir.add("old_dir")
 
 
-def _minus(nu):
-    return tuple([-_ for _ in nu])
-
-
 def _diff(nu1, nu2):
     return tuple([nu1[_] - nu2[_] for _ in range(3)])
 
 
-def _get_equivalent_2_2(nus, alphas, parameter=None):
-    """
-    See S.21 of SI of paper-2026
-    """
-    nu_2 = nus[0]
-    alpha_1 = alphas[0]
-    alpha_2 = alphas[1]
-
-    if ((0, 0, 0), alpha_1) == (nu_2, alpha_2):
-        raise ValueError("Invalid indices for (1+1) case.")
-
-    versions_nus = [
-        (nu_2,),
-        (_minus(nu_2),),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_2),
-        (alpha_2, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 2
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy()),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
-
-    return parameters
+# Names of the cases in S.21-S.27 of SI of paper-2026
+_CASES = {
+    (2, 2): "1+1",
+    (3, 2): "2+1",
+    (3, 3): "1+1+1",
+    (4, 2): "3+1+0+0",
+    (4, 3): "2+2+0+0",
+    (4, 4): "2+1+1+0",
+    (4, 5): "1+1+1+1",
+}
+
+# Orders of the spin operators in the equivalent parameters, relative to the
+# canonical form of the parameter (S.21-S.27 of SI of paper-2026).
+_VERSIONS = {
+    (2, 2): list(permutations(range(2))),
+    (3, 2): [(0, 1, 2), (0, 2, 1), (2, 0, 1)],
+    (3, 3): list(permutations(range(3))),
+    (4, 2): [(0, 1, 2, 3), (0, 1, 3, 2), (0, 3, 1, 2), (3, 0, 1, 2)],
+    (4, 3): [
+        (0, 1, 2, 3),
+        (0, 2, 1, 3),
+        (0, 2, 3, 1),
+        (2, 0, 1, 3),
+        (2, 0, 3, 1),
+        (2, 3, 0, 1),
+    ],
+    (4, 4): [
+        (0, 1, 2, 3),
+        (0, 1, 3, 2),
+        (0, 2, 1, 3),
+        (0, 3, 1, 2),
+        (0, 2, 3, 1),
+        (0, 3, 2, 1),
+        (2, 0, 1, 3),
+        (3, 0, 1, 2),
+        (2, 0, 3, 1),
+        (3, 0, 2, 1),
+        (2, 3, 0, 1),
+        (3, 2, 0, 1),
+    ],
+    (4, 5): list(permutations(range(4))),
+}
+
+# Orders of the spin operators, that bring the parameter to the canonical form, by the
+# coincidence pattern. i-th element of the pattern is the index of the first spin
+# operator, that has the same atom and unit cell as the i-th one.
+_CANONICAL_ORDERS = {
+    (2, 2): {(0, 1): (0, 1)},
+    (3, 2): {(0, 0, 2): (0, 1, 2), (0, 1, 0): (0, 2, 1), (0, 1, 1): (1, 2, 0)},
+    (3, 3): {(0, 1, 2): (0, 1, 2)},
+    (4, 2): {
+        (0, 0, 0, 3): (0, 1, 2, 3),
+        (0, 0, 2, 0): (0, 1, 3, 2),
+        (0, 1, 0, 0): (0, 2, 3, 1),
+        (0, 1, 1, 1): (1, 2, 3, 0),
+    },
+    (4, 3): {
+        (0, 0, 2, 2): (0, 1, 2, 3),
+        (0, 1, 0, 1): (0, 2, 1, 3),
+        (0, 1, 1, 0): (0, 3, 1, 2),
+    },
+    (4, 4): {
+        (0, 0, 2, 3): (0, 1, 2, 3),
+        (0, 1, 0, 3): (0, 2, 1, 3),
+        (0, 1, 2, 0): (0, 3, 1, 2),
+        (0, 1, 1, 3): (1, 2, 0, 3),
+        (0, 1, 2, 1): (1, 3, 0, 2),
+        (0, 1, 2, 2): (2, 3, 0, 1),
+    },
+    (4, 5): {(0, 1, 2, 3): (0, 1, 2, 3)},
+}
+
+# {(n, p_n, pattern): orders of the spin operators in all equivalent parameters}.
+# Tensor of the equivalent parameter is np.transpose(parameter, order).
+_EQUIVALENCE_TABLES = {
+    (n, p_n, pattern): [tuple([canonical[i] for i in version]) for version in versions]
+    for (n, p_n), versions in _VERSIONS.items()
+    for pattern, canonical in _CANONICAL_ORDERS[(n, p_n)].items()
+}
 
 
-def _get_equivalent_3_2(nus, alphas, parameter=None):
+def _get_equivalent(n, p_n, nus, alphas, parameter=None):
     """
-    See S.22 of SI of paper-2026
+    Computes equivalent parameters of one parameter.
+
+    Parameters
+    ----------
+    n : int
+    p_n : int
+    nus : tuple
+        ``(nu_2, ..., nu_n)``.
+    alphas : tuple
+        ``(alpha_1, ..., alpha_n)``.
+    parameter : (3, ..., 3) :numpy:`ndarray`, optional
+
+    Returns
+    -------
+    parameters : list of tuple
+        ``(nus, alphas, parameter)`` of all equivalent parameters, sorted in descending
+        order by the indices.
+
+    Raises
+    ------
+    ValueError
+        If n and p_n are not supported or do not agree with the indices.
     """
-    r1 = ((0, 0, 0), alphas[0])
-    r2 = (nus[0], alphas[1])
-    r3 = (nus[1], alphas[2])
-    if r1 == r2 and r1 != r3:
-        nu_2 = nus[1]
-        alpha_1 = alphas[0]
-        alpha_2 = alphas[2]
-    elif r1 == r3 and r1 != r2:
-        nu_2 = nus[0]
-        alpha_1 = alphas[0]
-        alpha_2 = alphas[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 2, 1))
-    elif r2 == r3 and r2 != r1:
-        nu_2 = _minus(nus[0])
-        alpha_1 = alphas[1]
-        alpha_2 = alphas[0]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (1, 2, 0))
-    else:
-        raise ValueError("Invalid indices for (2+1) case.")
-
-    versions_nus = [
-        ((0, 0, 0), nu_2),
-        (nu_2, (0, 0, 0)),
-        (_minus(nu_2), _minus(nu_2)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_1, alpha_2),
-        (alpha_1, alpha_2, alpha_1),
-        (alpha_2, alpha_1, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 3
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 2, 1)),
-            np.transpose(parameter.copy(), (2, 0, 1)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
 
-    return parameters
+    if p_n == 1 and 1 <= n <= 4:
+        return [(nus, alphas, parameter)]
 
+    if (n, p_n) not in _CASES:
+        raise ValueError("Invalid n and p_n values.")
 
-def _get_equivalent_3_3(nus, alphas, parameter=None):
-    """
-    See S.23 of SI of paper-2026
-    """
+    all_nus = [(0, 0, 0)] + list(nus)
+    sites = list(zip(all_nus, alphas))
+    pattern = tuple(
+        [next(j for j in range(i + 1) if sites[j] == sites[i]) for i in range(n)]
+    )
+
+    if (n, p_n, pattern) not in _EQUIVALENCE_TABLES:
+        raise ValueError(f"Invalid indices for ({_CASES[(n, p_n)]}) case.")
+
+    parameters = []
+    for order in _EQUIVALENCE_TABLES[(n, p_n, pattern)]:
+        parameters.append(
+            (
+                tuple([_diff(all_nus[i], all_nus[order[0]]) for i in order[1:]]),
+                tuple([alphas[i] for i in order]),
+                None if parameter is None else np.transpose(parameter, order).copy(),
+            )
+        )
 
-    nu_2 = nus[0]
-    nu_3 = nus[1]
-    alpha_1 = alphas[0]
-    alpha_2 = alphas[1]
-    alpha_3 = alphas[2]
-
-    r1 = ((0, 0, 0), alpha_1)
-    r2 = (nu_2, alpha_2)
-    r3 = (nu_3, alpha_3)
-    if r1 == r2 or r1 == r3 or r2 == r3:
-        raise ValueError("Invalid indices for (1+1+1) case.")
-
-    versions_nus = [
-        (nu_2, nu_3),
-        (nu_3, nu_2),
-        (_minus(nu_2), _diff(nu_3, nu_2)),
-        (_diff(nu_3, nu_2), _minus(nu_2)),
-        (_minus(nu_3), _diff(nu_2, nu_3)),
-        (_diff(nu_2, nu_3), _minus(nu_3)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_2, alpha_3),
-        (alpha_1, alpha_3, alpha_2),
-        (alpha_2, alpha_1, alpha_3),
-        (alpha_2, alpha_3, alpha_1),
-        (alpha_3, alpha_1, alpha_2),
-        (alpha_3, alpha_2, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 6
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 2, 1)),
-            np.transpose(parameter.copy(), (1, 0, 2)),
-            np.transpose(parameter.copy(), (1, 2, 0)),
-            np.transpose(parameter.copy(), (2, 0, 1)),
-            np.transpose(parameter.copy(), (2, 1, 0)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
     parameters.sort(key=lambda x: x[:-1], reverse=True)
 
     return parameters
 
 
-def _get_equivalent_4_2(nus, alphas, parameter=None):
+def _get_equivalent_block(block):
     """
-    See S.24 of SI of paper-2026
+    Computes equivalent parameters of all parameters of the block.
+
+    Parameters
+    ----------
+    block : :py:class:`._ParametersBlock`
+        Non-empty block of the parameters.
+
+    Returns
+    -------
+    keys : (T, V, 4 * n - 3) :numpy:`ndarray`
+        Keys (see :py:meth:`._ParametersBlock.keys`) of V equivalent parameters for
+        each of T parameters. Equivalent parameters are not sorted.
+    tensors : (T, V, 3, ..., 3) :numpy:`ndarray`
+        Tensors of the equivalent parameters.
+
+    Raises
+    ------
+    ValueError
+        If some indices do not agree with n and p_n of the block.
     """
-    r1 = ((0, 0, 0), alphas[0])
-    r2 = (nus[0], alphas[1])
-    r3 = (nus[1], alphas[2])
-    r4 = (nus[2], alphas[3])
-    if r1 == r2 and r1 == r3 and r1 != r4:
-        nu_2 = r4[0]
-        alpha_1 = r1[1]
-        alpha_2 = r4[1]
-    elif r1 == r2 and r1 == r4 and r1 != r3:
-        nu_2 = r3[0]
-        alpha_1 = r1[1]
-        alpha_2 = r3[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 1, 3, 2))
-    elif r1 == r3 and r1 == r4 and r1 != r2:
-        nu_2 = r2[0]
-        alpha_1 = r1[1]
-        alpha_2 = r2[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 2, 3, 1))
-    elif r2 == r3 and r2 == r4 and r1 != r2:
-        nu_2 = _minus(r2[0])
-        alpha_1 = r2[1]
-        alpha_2 = r1[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (1, 2, 3, 0))
-    else:
-        raise ValueError("Invalid indices for (3+1+0+0) case.")
-
-    versions_nus = [
-        ((0, 0, 0), (0, 0, 0), nu_2),
-        ((0, 0, 0), nu_2, (0, 0, 0)),
-        (nu_2, (0, 0, 0), (0, 0, 0)),
-        (_minus(nu_2), _minus(nu_2), _minus(nu_2)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_1, alpha_1, alpha_2),
-        (alpha_1, alpha_1, alpha_2, alpha_1),
-        (alpha_1, alpha_2, alpha_1, alpha_1),
-        (alpha_2, alpha_1, alpha_1, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 4
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 1, 3, 2)),
-            np.transpose(parameter.copy(), (0, 3, 1, 2)),
-            np.transpose(parameter.copy(), (3, 0, 1, 2)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
 
-    return parameters
+    n, p_n, T = block.n, block.p_n, len(block)
 
+    if p_n == 1:
+        return block.keys()[:, np.newaxis], block.tensors[:, np.newaxis]
 
-def _get_equivalent_4_3(nus, alphas, parameter=None):
-    """
-    See S.25 of SI of paper-2026
-    """
-    r1 = ((0, 0, 0), alphas[0])
-    r2 = (nus[0], alphas[1])
-    r3 = (nus[1], alphas[2])
-    r4 = (nus[2], alphas[3])
-    if r1 == r2 and r3 == r4 and r2 != r3:
-        nu_2 = r3[0]
-        alpha_1 = r1[1]
-        alpha_2 = r3[1]
-    elif r1 == r3 and r2 == r4 and r1 != r2:
-        nu_2 = r2[0]
-        alpha_1 = r1[1]
-        alpha_2 = r2[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 2, 1, 3))
-    elif r1 == r4 and r2 == r3 and r1 != r2:
-        nu_2 = r2[0]
-        alpha_1 = r1[1]
-        alpha_2 = r2[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 3, 1, 2))
-    else:
-        raise ValueError("Invalid indices for (2+2+0+0) case.")
-
-    versions_nus = [
-        ((0, 0, 0), nu_2, nu_2),
-        (nu_2, (0, 0, 0), nu_2),
-        (nu_2, nu_2, (0, 0, 0)),
-        (_minus(nu_2), _minus(nu_2), (0, 0, 0)),
-        (_minus(nu_2), (0, 0, 0), _minus(nu_2)),
-        ((0, 0, 0), _minus(nu_2), _minus(nu_2)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_1, alpha_2, alpha_2),
-        (alpha_1, alpha_2, alpha_1, alpha_2),
-        (alpha_1, alpha_2, alpha_2, alpha_1),
-        (alpha_2, alpha_1, alpha_1, alpha_2),
-        (alpha_2, alpha_1, alpha_2, alpha_1),
-        (alpha_2, alpha_2, alpha_1, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 6
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 2, 1, 3)),
-            np.transpose(parameter.copy(), (0, 2, 3, 1)),
-            np.transpose(parameter.copy(), (2, 0, 1, 3)),
-            np.transpose(parameter.copy(), (2, 0, 3, 1)),
-            np.transpose(parameter.copy(), (2, 3, 0, 1)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
+    all_nus = np.concatenate((np.zeros((T, 1, 3), dtype=int), block.nus), axis=1)
+    sites = np.concatenate((block.alphas[:, :, np.newaxis], all_nus), axis=2)
+    equal = (sites[:, :, np.newaxis] == sites[:, np.newaxis, :]).all(axis=3)
+    # Index of the first True in each row
+    patterns, inverse = np.unique(np.argmax(equal, axis=2), axis=0, return_inverse=True)
+    inverse = inverse.reshape(T)
 
-    return parameters
+    V = len(_VERSIONS[(n, p_n)])
+    orders = np.empty((T, V, n), dtype=int)
+    tensors = np.empty((T, V) + (3,) * n, dtype=float)
 
+    for i, pattern in enumerate(patterns.tolist()):
+        if (n, p_n, tuple(pattern)) not in _EQUIVALENCE_TABLES:
+            raise ValueError(f"Invalid indices for ({_CASES[(n, p_n)]}) case.")
 
-def _get_equivalent_4_4(nus, alphas, parameter=None):
-    """
-    See S.26 of SI of paper-2026
-    """
-    r1 = ((0, 0, 0), alphas[0])
-    r2 = (nus[0], alphas[1])
-    r3 = (nus[1], alphas[2])
-    r4 = (nus[2], alphas[3])
-    if r1 == r2 and r1 != r3 and r1 != r4 and r3 != r4:
-        nu_2 = r3[0]
-        nu_3 = r4[0]
-        alpha_1 = r1[1]
-        alpha_2 = r3[1]
-        alpha_3 = r4[1]
-    elif r1 == r3 and r1 != r2 and r1 != r4 and r2 != r4:
-        nu_2 = r2[0]
-        nu_3 = r4[0]
-        alpha_1 = r1[1]
-        alpha_2 = r2[1]
-        alpha_3 = r4[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 2, 1, 3))
-    elif r1 == r4 and r1 != r2 and r1 != r3 and r2 != r3:
-        nu_2 = r2[0]
-        nu_3 = r3[0]
-        alpha_1 = r1[1]
-        alpha_2 = r2[1]
-        alpha_3 = r3[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (0, 3, 1, 2))
-    elif r2 == r3 and r2 != r1 and r2 != r4 and r1 != r4:
-        nu_2 = _minus(r2[0])
-        nu_3 = _diff(r4[0], r2[0])
-        alpha_1 = r2[1]
-        alpha_2 = r1[1]
-        alpha_3 = r4[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (1, 2, 0, 3))
-    elif r2 == r4 and r2 != r1 and r2 != r3 and r1 != r3:
-        nu_2 = _minus(r2[0])
-        nu_3 = _diff(r3[0], r2[0])
-        alpha_1 = r2[1]
-        alpha_2 = r1[1]
-        alpha_3 = r3[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (1, 3, 0, 2))
-    elif r3 == r4 and r3 != r1 and r3 != r2 and r1 != r2:
-        nu_2 = _minus(r3[0])
-        nu_3 = _diff(r2[0], r3[0])
-        alpha_1 = r3[1]
-        alpha_2 = r1[1]
-        alpha_3 = r2[1]
-        if parameter is not None:
-            parameter = np.transpose(parameter, (2, 3, 0, 1))
-    else:
-        raise ValueError("Invalid indices for (2+1+1+0) case.")
-
-    versions_nus = [
-        ((0, 0, 0), nu_2, nu_3),
-        ((0, 0, 0), nu_3, nu_2),
-        (nu_2, (0, 0, 0), nu_3),
-        (nu_3, (0, 0, 0), nu_2),
-        (nu_2, nu_3, (0, 0, 0)),
-        (nu_3, nu_2, (0, 0, 0)),
-        (_minus(nu_2), _minus(nu_2), _diff(nu_3, nu_2)),
-        (_minus(nu_3), _minus(nu_3), _diff(nu_2, nu_3)),
-        (_minus(nu_2), _diff(nu_3, nu_2), _minus(nu_2)),
-        (_minus(nu_3), _diff(nu_2, nu_3), _minus(nu_3)),
-        (_diff(nu_3, nu_2), _minus(nu_2), _minus(nu_2)),
-        (_diff(nu_2, nu_3), _minus(nu_3), _minus(nu_3)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_1, alpha_2, alpha_3),
-        (alpha_1, alpha_1, alpha_3, alpha_2),
-        (alpha_1, alpha_2, alpha_1, alpha_3),
-        (alpha_1, alpha_3, alpha_1, alpha_2),
-        (alpha_1, alpha_2, alpha_3, alpha_1),
-        (alpha_1, alpha_3, alpha_2, alpha_1),
-        (alpha_2, alpha_1, alpha_1, alpha_3),
-        (alpha_3, alpha_1, alpha_1, alpha_2),
-        (alpha_2, alpha_1, alpha_3, alpha_1),
-        (alpha_3, alpha_1, alpha_2, alpha_1),
-        (alpha_2, alpha_3, alpha_1, alpha_1),
-        (alpha_3, alpha_2, alpha_1, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 12
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 1, 3, 2)),
-            np.transpose(parameter.copy(), (0, 2, 1, 3)),
-            np.transpose(parameter.copy(), (0, 3, 1, 2)),
-            np.transpose(parameter.copy(), (0, 2, 3, 1)),
-            np.transpose(parameter.copy(), (0, 3, 2, 1)),
-            np.transpose(parameter.copy(), (2, 0, 1, 3)),
-            np.transpose(parameter.copy(), (3, 0, 1, 2)),
-            np.transpose(parameter.copy(), (2, 0, 3, 1)),
-            np.transpose(parameter.copy(), (3, 0, 2, 1)),
-            np.transpose(parameter.copy(), (2, 3, 0, 1)),
-            np.transpose(parameter.copy(), (3, 2, 0, 1)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
+        mask = inverse == i
+        table = _EQUIVALENCE_TABLES[(n, p_n, tuple(pattern))]
+        orders[mask] = table
+        for v, order in enumerate(table):
+            tensors[mask, v] = np.transpose(
+                block.tensors[mask], (0,) + tuple([1 + _ for _ in order])
+            )
 
-    return parameters
+    nus = np.take_along_axis(all_nus[:, np.newaxis], orders[..., np.newaxis], axis=2)
+    alphas = np.take_along_axis(block.alphas[:, np.newaxis], orders, axis=2)
 
+    keys = np.concatenate(
+        (
+            (nus[:, :, 1:] - nus[:, :, :1]).reshape((T, V, 3 * (n - 1))),
+            alphas,
+        ),
+        axis=2,
+    )
 
-def _get_equivalent_4_5(nus, alphas, parameter=None):
-    """
-    See S.27 of SI of paper-2026
+    return keys, tensors
+
+
+def _representatives(keys):
     """
-    nu_2 = nus[0]
-    nu_3 = nus[1]
-    nu_4 = nus[2]
-    alpha_1 = alphas[0]
-    alpha_2 = alphas[1]
-    alpha_3 = alphas[2]
-    alpha_4 = alphas[3]
-
-    r1 = ((0, 0, 0), alpha_1)
-    r2 = (nu_2, alpha_2)
-    r3 = (nu_3, alpha_3)
-    r4 = (nu_4, alpha_4)
-    if r1 == r2 or r1 == r3 or r1 == r4 or r2 == r3 or r2 == r4 or r3 == r4:
-        raise ValueError("Invalid indices for (1+1+1+1) case.")
-
-    versions_nus = [
-        (nu_2, nu_3, nu_4),
-        (nu_2, nu_4, nu_3),
-        (nu_3, nu_2, nu_4),
-        (nu_3, nu_4, nu_2),
-        (nu_4, nu_2, nu_3),
-        (nu_4, nu_3, nu_2),
-        (_minus(nu_2), _diff(nu_3, nu_2), _diff(nu_4, nu_2)),
-        (_minus(nu_2), _diff(nu_4, nu_2), _diff(nu_3, nu_2)),
-        (_diff(nu_3, nu_2), _minus(nu_2), _diff(nu_4, nu_2)),
-        (_diff(nu_3, nu_2), _diff(nu_4, nu_2), _minus(nu_2)),
-        (_diff(nu_4, nu_2), _minus(nu_2), _diff(nu_3, nu_2)),
-        (_diff(nu_4, nu_2), _diff(nu_3, nu_2), _minus(nu_2)),
-        (_minus(nu_3), _diff(nu_2, nu_3), _diff(nu_4, nu_3)),
-        (_minus(nu_3), _diff(nu_4, nu_3), _diff(nu_2, nu_3)),
-        (_diff(nu_2, nu_3), _minus(nu_3), _diff(nu_4, nu_3)),
-        (_diff(nu_2, nu_3), _diff(nu_4, nu_3), _minus(nu_3)),
-        (_diff(nu_4, nu_3), _minus(nu_3), _diff(nu_2, nu_3)),
-        (_diff(nu_4, nu_3), _diff(nu_2, nu_3), _minus(nu_3)),
-        (_minus(nu_4), _diff(nu_2, nu_4), _diff(nu_3, nu_4)),
-        (_minus(nu_4), _diff(nu_3, nu_4), _diff(nu_2, nu_4)),
-        (_diff(nu_2, nu_4), _minus(nu_4), _diff(nu_3, nu_4)),
-        (_diff(nu_2, nu_4), _diff(nu_3, nu_4), _minus(nu_4)),
-        (_diff(nu_3, nu_4), _minus(nu_4), _diff(nu_2, nu_4)),
-        (_diff(nu_3, nu_4), _diff(nu_2, nu_4), _minus(nu_4)),
-    ]
-
-    versions_alphas = [
-        (alpha_1, alpha_2, alpha_3, alpha_4),
-        (alpha_1, alpha_2, alpha_4, alpha_3),
-        (alpha_1, alpha_3, alpha_2, alpha_4),
-        (alpha_1, alpha_3, alpha_4, alpha_2),
-        (alpha_1, alpha_4, alpha_2, alpha_3),
-        (alpha_1, alpha_4, alpha_3, alpha_2),
-        (alpha_2, alpha_1, alpha_3, alpha_4),
-        (alpha_2, alpha_1, alpha_4, alpha_3),
-        (alpha_2, alpha_3, alpha_1, alpha_4),
-        (alpha_2, alpha_3, alpha_4, alpha_1),
-        (alpha_2, alpha_4, alpha_1, alpha_3),
-        (alpha_2, alpha_4, alpha_3, alpha_1),
-        (alpha_3, alpha_1, alpha_2, alpha_4),
-        (alpha_3, alpha_1, alpha_4, alpha_2),
-        (alpha_3, alpha_2, alpha_1, alpha_4),
-        (alpha_3, alpha_2, alpha_4, alpha_1),
-        (alpha_3, alpha_4, alpha_1, alpha_2),
-        (alpha_3, alpha_4, alpha_2, alpha_1),
-        (alpha_4, alpha_1, alpha_2, alpha_3),
-        (alpha_4, alpha_1, alpha_3, alpha_2),
-        (alpha_4, alpha_2, alpha_1, alpha_3),
-        (alpha_4, alpha_2, alpha_3, alpha_1),
-        (alpha_4, alpha_3, alpha_1, alpha_2),
-        (alpha_4, alpha_3, alpha_2, alpha_1),
-    ]
-
-    if parameter is None:
-        versions_parameter = [None] * 24
-    else:
-        versions_parameter = [
-            parameter.copy(),
-            np.transpose(parameter.copy(), (0, 1, 3, 2)),
-            np.transpose(parameter.copy(), (0, 2, 1, 3)),
-            np.transpose(parameter.copy(), (0, 2, 3, 1)),
-            np.transpose(parameter.copy(), (0, 3, 1, 2)),
-            np.transpose(parameter.copy(), (0, 3, 2, 1)),
-            np.transpose(parameter.copy(), (1, 0, 2, 3)),
-            np.transpose(parameter.copy(), (1, 0, 3, 2)),
-            np.transpose(parameter.copy(), (1, 2, 0, 3)),
-            np.transpose(parameter.copy(), (1, 2, 3, 0)),
-            np.transpose(parameter.copy(), (1, 3, 0, 2)),
-            np.transpose(parameter.copy(), (1, 3, 2, 0)),
-            np.transpose(parameter.copy(), (2, 0, 1, 3)),
-            np.transpose(parameter.copy(), (2, 0, 3, 1)),
-            np.transpose(parameter.copy(), (2, 1, 0, 3)),
-            np.transpose(parameter.copy(), (2, 1, 3, 0)),
-            np.transpose(parameter.copy(), (2, 3, 0, 1)),
-            np.transpose(parameter.copy(), (2, 3, 1, 0)),
-            np.transpose(parameter.copy(), (3, 0, 1, 2)),
-            np.transpose(parameter.copy(), (3, 0, 2, 1)),
-            np.transpose(parameter.copy(), (3, 1, 0, 2)),
-            np.transpose(parameter.copy(), (3, 1, 2, 0)),
-            np.transpose(parameter.copy(), (3, 2, 0, 1)),
-            np.transpose(parameter.copy(), (3, 2, 1, 0)),
-        ]
-
-    parameters = list(zip(versions_nus, versions_alphas, versions_parameter))
-    parameters.sort(key=lambda x: x[:-1], reverse=True)
+    Finds the first equivalent parameter in the descending order by the indices.
 
-    return parameters
+    Parameters
+    ----------
+    keys : (T, V, K) :numpy:`ndarray`
+        Keys of the equivalent parameters, see :py:func:`._get_equivalent_block`.
+
+    Returns
+    -------
+    indices : (T, ) :numpy:`ndarray`
+        Index of the representative among V equivalent parameters of each parameter.
+    """
 
+    candidates = np.ones(keys.shape[:2], dtype=bool)
+    lowest = np.iinfo(keys.dtype).min
 
-def _get_equivalent(n, p_n, nus, alphas, parameter=None):
+    for column in range(keys.shape[2]):
+        values = np.where(candidates, keys[:, :, column], lowest)
+        candidates &= values == values.max(axis=1, keepdims=True)
 
-    if n == 2 and p_n == 2:
-        return _get_equivalent_2_2(nus, alphas, parameter)
-    elif n == 3 and p_n == 2:
-        return _get_equivalent_3_2(nus, alphas, parameter)
-    elif n == 3 and p_n == 3:
-        return _get_equivalent_3_3(nus, alphas, parameter)
-    elif n == 4 and p_n == 2:
-        return _get_equivalent_4_2(nus, alphas, parameter)
-    elif n == 4 and p_n == 3:
-        return _get_equivalent_4_3(nus, alphas, parameter)
-    elif n == 4 and p_n == 4:
-        return _get_equivalent_4_4(nus, alphas, parameter)
-    elif n == 4 and p_n == 5:
-        return _get_equivalent_4_5(nus, alphas, parameter)
-    elif p_n == 1 and 1 <= n <= 4:
-        return [(nus, alphas, parameter)]
-    else:
-        raise ValueError("Invalid n and p_n values.")
+    return np.argmax(candidates, axis=1)
 
 
 def get_equivalent_parameters(nus, alphas, parameter=None):
@@ -642,38 +362,48 @@ def _get_missing_parameters(parameters, strategy="mean"):
     """
 
     strategy = strategy.lower()
-    counter = {}
+
+    if strategy not in ["zeros", "mean"]:
+        raise ValueError(
+            f'Expected strategy to be either "zeros" or "mean", got {strategy}.'
+        )
+
     missing_parameters = _InteractionParameters()
 
-    for (n, p_n, nus, alphas), parameter in parameters._container:
-        equivalent_set = _get_equivalent(
-            n=n, p_n=p_n, nus=nus, alphas=alphas, parameter=parameter
+    for block in parameters._get_blocks():
+        if len(block) == 0:
+            continue
+
+        keys, _ = _get_equivalent_block(block)
+        T, V, K = keys.shape
+
+        keys = keys.reshape((T * V, K))
+        missing = block.positions(keys) == -1
+
+        if not missing.any():
+            continue
+
+        keys = keys[missing]
+
+        if strategy == "zeros":
+            values = np.zeros((len(keys),) + (3,) * block.n, dtype=float)
+        else:
+            # Mean of the parameters, which have the missing one in their sets
+            values = np.repeat(block.tensors, V, axis=0)[missing]
+
+            order = _sorting_order(keys)
+            keys = keys[order]
+            starts = _group_starts(keys)
+            counts = np.diff(np.append(starts, len(keys)))
+
+            values = np.add.reduceat(values[order], starts, axis=0)
+            values /= counts.reshape((len(starts),) + (1,) * block.n)
+            keys = keys[starts]
+
+        missing_parameters._merge_batch(
+            n=block.n, p_n=block.p_n, keys=keys, tensors=values, when_present="skip"
         )
 
-        for eq_nus, eq_alphas, eq_parameter in equivalent_set:
-            eq_specs = (n, p_n, eq_nus, eq_alphas)
-
-            if eq_specs not in parameters:
-                if strategy == "zeros":
-                    missing_parameters.add(
-                        specs=eq_specs,
-                        parameter=np.zeros_like(parameter, dtype=float),
-                        when_present="skip",
-                    )
-                elif strategy == "mean":
-                    if (eq_nus, eq_alphas) not in counter:
-                        counter[(eq_nus, eq_alphas)] = 0
-                    missing_parameters.add(
-                        specs=eq_specs,
-                        parameter=parameter,
-                        when_present="weighted average",
-                        weights=(counter[(eq_nus, eq_alphas)], 1),
-                    )
-                    counter[(eq_nus, eq_alphas)] += 1
-                else:
-                    raise ValueError(
-                        f'Expected strategy to be either "zeros" or "mean", got {strategy}.'
-                    )
     return missing_parameters
 
 
@@ -691,47 +421,52 @@ def _set_distribution(parameters, strategy="symmetrize"):
     """
 
     strategy = strategy.lower()
-    new_parameters = _InteractionParameters()
 
-    if strategy == "symmetrize":
-        for (n, p_n, nus, alphas), parameter in parameters._container:
-            equivalent_parameters = _get_equivalent(
-                n=n, p_n=p_n, nus=nus, alphas=alphas, parameter=parameter
-            )
+    if strategy not in ["symmetrize", "representative"]:
+        raise ValueError(
+            f'Expected strategy to be either "symmetrize" or "representative" got {strategy}.'
+        )
 
-            degeneracy = len(equivalent_parameters)
+    new_parameters = _InteractionParameters()
 
-            for eq_nus, eq_alphas, eq_parameter in equivalent_parameters:
-                new_parameters.add(
-                    specs=(n, p_n, eq_nus, eq_alphas),
-                    parameter=eq_parameter / degeneracy,
-                    when_present="sum",
-                )
-    elif strategy == "representative":
-        for (n, p_n, nus, alphas), parameter in parameters._container:
-            equivalent_parameters = _get_equivalent(
-                n=n, p_n=p_n, nus=nus, alphas=alphas, parameter=parameter
+    for block in parameters._get_blocks():
+        if len(block) == 0:
+            continue
+
+        n, p_n = block.n, block.p_n
+        keys, tensors = _get_equivalent_block(block)
+        T, V, K = keys.shape
+
+        if strategy == "symmetrize":
+            new_parameters._merge_batch(
+                n=n,
+                p_n=p_n,
+                keys=keys.reshape((T * V, K)),
+                tensors=tensors.reshape((T * V,) + (3,) * n) / V,
+                when_present="sum",
+            )
+        else:
+            rows = np.arange(T)
+            first = _representatives(keys)
+
+            new_parameters._merge_batch(
+                n=n,
+                p_n=p_n,
+                keys=keys[rows, first],
+                tensors=tensors[rows, first],
+                when_present="sum",
             )
 
-            for index, (eq_nus, eq_alphas, eq_parameter) in enumerate(
-                equivalent_parameters
-            ):
-                if index == 0:
-                    new_parameters.add(
-                        specs=(n, p_n, eq_nus, eq_alphas),
-                        parameter=eq_parameter,
-                        when_present="sum",
-                    )
-                else:
-                    new_parameters.add(
-                        specs=(n, p_n, eq_nus, eq_alphas),
-                        parameter=np.zeros_like(eq_parameter, dtype=float),
-                        when_present="skip",
-                    )
-    else:
-        raise ValueError(
-            f'Expected strategy to be either "symmetrize" or "representative" got {strategy}.'
-        )
+            others = np.ones((T, V), dtype=bool)
+            others[rows, first] = False
+            if others.any():
+                new_parameters._merge_batch(
+                    n=n,
+                    p_n=p_n,
+                    keys=keys[others],
+                    tensors=np.zeros((others.sum(),) + (3,) * n, dtype=float),
+                    when_present="skip",
+                )
 
     return new_parameters
 
@@ -18,8 +18,11 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 # ================================ END LICENSE =================================
 
-import numpy as np
 from copy import deepcopy
+from math import prod
+import warnings
+
+import numpy as np
 
 
 def _get_specs(nus, alphas):
@@ -86,92 +89,710 @@ def _get_specs(nus, alphas):
     return (n, p_n, nus[1:], alphas)
 
 
+def _merge_parameters(existing, new, when_present, weights=None):
+    """
+    Merges the value of the parameter, that is already present in the container, with
+    the new one.
+
+    Parameters
+    ----------
+    existing : (3, 3, ..., 3) :numpy:`ndarray`
+        Value of the existing parameter. Might be modified in place.
+
+    new : (3, 3, ..., 3) :numpy:`ndarray`
+        Value of the new parameter.
+
+    when_present : str
+        See :py:meth:`._InteractionParameters.add`.
+
+    weights : tuple, optional
+        See :py:meth:`._InteractionParameters.add`.
+
+    Returns
+    -------
+    parameter : (3, 3, ..., 3) :numpy:`ndarray`
+        Merged value of the parameter.
+
+    Raises
+    ------
+    ValueError
+        If ``when_present`` is set to ``"raise error"`` or is not supported.
+    """
+
+    if when_present == "raise error":
+        raise ValueError("Parameter with such specs is already present.")
+    elif when_present == "replace":
+        return new
+    elif when_present == "sum":
+        existing += new
+        return existing
+    elif when_present == "mean":
+        return (existing + new) / 2
+    elif when_present == "weighted average":
+        if weights is None or len(weights) != 2:
+            raise ValueError(
+                "Weights must be provided as a tuple of two numbers when when_present is set to 'weighted average'."
+            )
+        w_existing, w_new = weights
+        return (w_existing * existing + w_new * new) / (w_existing + w_new)
+    elif when_present == "skip":
+        return existing
+    else:
+        raise ValueError(
+            f"Unsupported value for when_present: {when_present}. Supported values are: 'raise error', 'replace', 'sum', 'mean', 'weighted average', 'skip'."
+        )
+
+
+# Supported combinations of (n, p_n) in the order of the specs
+_BLOCK_KEYS = [
+    (1, 1),
+    (2, 1),
+    (2, 2),
+    (3, 1),
+    (3, 2),
+    (3, 3),
+    (4, 1),
+    (4, 2),
+    (4, 3),
+    (4, 4),
+    (4, 5),
+]
+
+
+def _specs_key(specs):
+    """
+    Integer key of the specs.
+
+    Returns
+    -------
+    key : (3 * (n - 1) + n, ) :numpy:`ndarray`
+        ``(*nu_2, ..., *nu_n, alpha_1, ..., alpha_n)``, same as one row of
+        :py:meth:`._ParametersBlock.keys`.
+    """
+
+    values = [i for nu in specs[2] for i in nu]
+    values.extend(specs[3])
+
+    return np.array(values, dtype=np.int64)
+
+
+def _get_packing(keys):
+    """
+    Mixed radix numeral system, that packs rows of integer keys into single int64
+    numbers.
+
+    Each column is shifted to start from zero and used as a digit of the mixed radix
+    number. Order of the packed numbers is the lexicographical order of the rows.
+
+    Parameters
+    ----------
+    keys : (T, K) :numpy:`ndarray`
+        Integer keys.
+
+    Returns
+    -------
+    packing : tuple of three (K, ) :numpy:`ndarray` or None
+        ``(lows, highs, multipliers)``, where ``lows`` and ``highs`` are the ranges of
+        the columns. ``None`` if the rows do not fit into int64.
+    """
+
+    if keys.shape[0] == 0:
+        # Empty ranges, thus no key is inside
+        return (
+            np.zeros(keys.shape[1], dtype=np.int64),
+            np.full(keys.shape[1], -1, dtype=np.int64),
+            np.ones(keys.shape[1], dtype=np.int64),
+        )
+
+    lows = keys.min(axis=0)
+    highs = keys.max(axis=0)
+
+    # Python integers, as the ranges might not fit into int64
+    sizes = [high - low + 1 for low, high in zip(lows.tolist(), highs.tolist())]
+
+    if prod(sizes) >= 2**63:
+        return None
+
+    multipliers = np.ones(keys.shape[1], dtype=np.int64)
+    multipliers[:-1] = np.cumprod(np.array(sizes[::-1], dtype=np.int64))[:-1][::-1]
+
+    return lows, highs, multipliers
+
+
+def _pack_keys(keys):
+    """
+    Packs rows of integer keys into single int64 numbers, see
+    :py:func:`._get_packing`.
+
+    Parameters
+    ----------
+    keys : (T, K) :numpy:`ndarray`
+        Integer keys.
+
+    Returns
+    -------
+    packed : (T, ) :numpy:`ndarray` or None
+        Packed keys. ``None`` if the rows do not fit into int64.
+    """
+
+    packing = _get_packing(keys)
+
+    if packing is None:
+        return None
+
+    return (keys - packing[0]) @ packing[2]
+
+
+def _find_row(keys, key):
+    """
+    Binary search of the row in the lexicographically sorted integer keys.
+
+    Parameters
+    ----------
+    keys : (T, K) :numpy:`ndarray`
+        Integer keys, sorted lexicographically.
+
+    key : (K, ) :numpy:`ndarray`
+        Row to search for.
+
+    Returns
+    -------
+    index : int
+        Index of the row if it exists, -1 otherwise.
+    """
+
+    start, stop = 0, len(keys)
+    for column, value in enumerate(key.tolist()):
+        values = keys[start:stop, column]
+        start, stop = (
+            start + int(np.searchsorted(values, value, side="left")),
+            start + int(np.searchsorted(values, value, side="right")),
+        )
+        if start == stop:
+            return -1
+
+    return start
+
+
+def _group_starts(keys):
+    """
+    Beginnings of the groups of equal rows in the sorted integer keys.
+
+    Parameters
+    ----------
+    keys : (T, K) :numpy:`ndarray`
+        Integer keys, sorted lexicographically. ``T > 0``.
+
+    Returns
+    -------
+    starts : (G, ) :numpy:`ndarray`
+        Index of the first row of each group.
+    """
+
+    packed = _pack_keys(keys)
+
+    if packed is None:
+        differ = (keys[1:] != keys[:-1]).any(axis=1)
+    else:
+        differ = packed[1:] != packed[:-1]
+
+    return np.flatnonzero(np.concatenate(([True], differ)))
+
+
+def _sorting_order(keys):
+    """
+    Stable order of the rows of integer keys in the lexicographical order.
+
+    Parameters
+    ----------
+    keys : (T, K) :numpy:`ndarray`
+        Integer keys.
+
+    Returns
+    -------
+    order : (T, ) :numpy:`ndarray`
+        Indices of the rows.
+    """
+
+    packed = _pack_keys(keys)
+
+    if packed is None:
+        return np.lexsort(keys.T[::-1])
+
+    return np.argsort(packed, kind="stable")
+
+
+class _ParametersBlock:
+    """
+    Interaction parameters with the same n and p_n, stored as arrays.
+
+    Rows of the arrays are sorted by the specs. Arrays are
+
+    * ``nus`` - (T, n - 1, 3) integers.
+    * ``alphas`` - (T, n) integers.
+    * ``tensors`` - (T, 3, ..., 3) floats with n dimensions of size 3.
+
+    Rows are found by the binary search over their packed keys (see
+    :py:func:`._get_packing`), that are kept along with the rows.
+    """
+
+    def __init__(self, n, p_n, nus=None, alphas=None, tensors=None):
+        self.n = n
+        self.p_n = p_n
+
+        if alphas is None:
+            nus = np.zeros((0, n - 1, 3), dtype=int)
+            alphas = np.zeros((0, n), dtype=int)
+            tensors = np.zeros((0,) + (3,) * n, dtype=float)
+
+        self.nus = nus
+        self.alphas = alphas
+        self.tensors = tensors
+
+        # (packing, sorted keys of the rows), see index()
+        self._index = None
+
+        # Mask of the removed rows, that are dropped at the next compact()
+        self._removed = None
+        self._n_removed = 0
+
+    def __len__(self):
+        return len(self.alphas)
+
+    def specs(self, index):
+        """
+        Specs of the parameter in the given row.
+
+        Returns
+        -------
+        specs : tuple
+            ``(n, p_n, (nu_2, ..., nu_n), (alpha_1, ..., alpha_n))``.
+        """
+
+        return (
+            self.n,
+            self.p_n,
+            tuple(map(tuple, self.nus[index].tolist())),
+            tuple(self.alphas[index].tolist()),
+        )
+
+    def find(self, specs):
+        """
+        Get an index of the row with given specs.
+
+        Returns
+        -------
+        index : int
+            Index of the row if it exists, -1 otherwise.
+        """
+
+        packing, sorted_keys = self.index()
+
+        if packing is None or len(sorted_keys) == 0:
+            return int(self.positions(_specs_key(specs)[np.newaxis])[0])
+
+        # Single key is packed with python integers, that is faster than numpy
+        packed = 0
+        values = [i for nu in specs[2] for i in nu]
+        values.extend(specs[3])
+        for value, low, high, multiplier in zip(
+            values, *[array.tolist() for array in packing]
+        ):
+            if not low <= value <= high:
+                return -1
+            packed += (value - low) * multiplier
+
+        index = int(np.searchsorted(sorted_keys, packed))
+
+        if (
+            index == len(sorted_keys)
+            or sorted_keys[index] != packed
+            or (self._n_removed > 0 and self._removed[index])
+        ):
+            return -1
+
+        return index
+
+    def index(self):
+        """
+        Search index of the rows. It is built at the first call after the change of
+        the keys and is updated by :py:meth:`.take` and :py:meth:`.sort`.
+
+        Returns
+        -------
+        packing : tuple or None
+            Packing of the keys, see :py:func:`._get_packing`. ``None`` if the keys do
+            not fit into int64.
+
+        keys : (T, ) or (T, 3 * (n - 1) + n) :numpy:`ndarray`
+            Sorted packed keys of the rows. Keys as they are if ``packing`` is
+            ``None``.
+        """
+
+        if self._index is None:
+            keys = self.keys()
+            packing = _get_packing(keys)
+
+            if packing is None:
+                self._index = (None, keys)
+            else:
+                self._index = (packing, (keys - packing[0]) @ packing[2])
+
+        return self._index
+
+    def positions(self, keys):
+        """
+        Get indices of the rows with given keys.
+
+        Parameters
+        ----------
+        keys : (T, 4 * n - 3) :numpy:`ndarray`
+            Integer keys, see :py:meth:`._ParametersBlock.keys`.
+
+        Returns
+        -------
+        positions : (T, ) :numpy:`ndarray`
+            Index of the row for each key if it exists, -1 otherwise.
+        """
+
+        packing, sorted_keys = self.index()
+
+        if len(sorted_keys) == 0:
+            return np.full(len(keys), -1, dtype=int)
+
+        if packing is None:
+            positions = np.array(
+                [_find_row(sorted_keys, key) for key in keys], dtype=int
+            )
+        else:
+            lows, highs, multipliers = packing
+            positions = np.full(len(keys), -1, dtype=int)
+
+            # Keys outside of the ranges are not present and might not fit into int64
+            inside = np.flatnonzero(((keys >= lows) & (keys <= highs)).all(axis=1))
+            packed = (keys[inside] - lows) @ multipliers
+
+            found = np.searchsorted(sorted_keys, packed)
+            found[found == len(sorted_keys)] = 0
+            present = sorted_keys[found] == packed
+            positions[inside[present]] = found[present]
+
+        if self._n_removed > 0:
+            positions[(positions != -1) & self._removed[positions]] = -1
+
+        return positions
+
+    def keys(self):
+        """
+        Sorting keys of the rows.
+
+        Returns
+        -------
+        keys : (T, 3 * (n - 1) + n) :numpy:`ndarray`
+            Integer keys, the first column is the most significant one. Lexicographical
+            order of the keys is the order of the specs.
+        """
+
+        return np.concatenate(
+            (self.nus.reshape((len(self), 3 * (self.n - 1))), self.alphas), axis=1
+        )
+
+    def discard(self, index):
+        """
+        Marks the row as removed. Arrays are not changed until :py:meth:`.compact`.
+        """
+
+        if self._removed is None:
+            self._removed = np.zeros(len(self), dtype=bool)
+
+        if not self._removed[index]:
+            self._removed[index] = True
+            self._n_removed += 1
+
+    def compact(self):
+        """
+        Drops the rows, that are marked as removed.
+        """
+
+        if self._removed is not None:
+            removed = np.flatnonzero(self._removed)
+            self._removed = None
+            self._n_removed = 0
+
+            self.nus = np.delete(self.nus, removed, axis=0)
+            self.alphas = np.delete(self.alphas, removed, axis=0)
+            self.tensors = np.delete(self.tensors, removed, axis=0)
+
+            # Ranges of the remaining keys are within the old ones
+            if self._index is not None:
+                self._index = (
+                    self._index[0],
+                    np.delete(self._index[1], removed, axis=0),
+                )
+
+    def take(self, indices):
+        """
+        Keeps only the given rows (index array or boolean mask) in the given order.
+        """
+
+        self.nus = self.nus[indices]
+        self.alphas = self.alphas[indices]
+        self.tensors = self.tensors[indices]
+
+        # Ranges of the remaining keys are within the old ones
+        if self._index is not None:
+            self._index = (self._index[0], self._index[1][indices])
+
+    def sort(self):
+        """
+        Sorts the rows by the specs. Sort is stable.
+        """
+
+        self._index = None
+        packing, keys = self.index()
+
+        if packing is None:
+            order = np.lexsort(keys.T[::-1])
+        else:
+            order = np.argsort(keys, kind="stable")
+
+        self.take(order)
+
+    def extend(self, nus, alphas, tensors):
+        """
+        Adds new rows and sorts the block. New rows shall not be present in the block.
+        """
+
+        self.compact()
+
+        packing, keys = self.index()
+        new_keys = np.concatenate(
+            (nus.reshape((len(nus), 3 * (self.n - 1))), alphas), axis=1
+        )
+
+        # New rows are inserted into their places, if they fit into the packing of
+        # the present ones. Otherwise, the whole block is sorted again.
+        if (
+            packing is not None
+            and (new_keys >= packing[0]).all()
+            and (new_keys <= packing[1]).all()
+        ):
+            packed = (new_keys - packing[0]) @ packing[2]
+            order = np.argsort(packed, kind="stable")
+            packed = packed[order]
+            places = np.searchsorted(keys, packed)
+
+            self.nus = np.insert(self.nus, places, nus[order], axis=0)
+            self.alphas = np.insert(self.alphas, places, alphas[order], axis=0)
+            self.tensors = np.insert(self.tensors, places, tensors[order], axis=0)
+            self._index = (packing, np.insert(keys, places, packed))
+        else:
+            self.nus = np.concatenate((self.nus, nus), axis=0)
+            self.alphas = np.concatenate((self.alphas, alphas), axis=0)
+            self.tensors = np.concatenate((self.tensors, tensors), axis=0)
+            self.sort()
+
+    def summed(self, other):
+        """
+        Merges two blocks. Parameters with the same specs are summed.
+
+        Returns
+        -------
+        block : _ParametersBlock
+            New block.
+        """
+
+        block = _ParametersBlock(
+            n=self.n,
+            p_n=self.p_n,
+            nus=np.concatenate((self.nus, other.nus), axis=0),
+            alphas=np.concatenate((self.alphas, other.alphas), axis=0),
+            tensors=np.concatenate((self.tensors, other.tensors), axis=0),
+        )
+
+        if len(block) == 0:
+            return block
+
+        block.sort()
+
+        starts = _group_starts(block.keys())
+
+        tensors = np.add.reduceat(block.tensors, starts, axis=0)
+        block.take(starts)
+        block.tensors = tensors
+
+        return block
+
+
+class _ContainerEntry:
+    """
+    Writable ``[specs, parameter]`` view of one parameter of the container.
+    """
+
+    __slots__ = ("_block", "_index")
+
+    def __init__(self, block, index):
+        self._block = block
+        self._index = index
+
+    def __getitem__(self, key):
+        if key == 0:
+            return self._block.specs(self._index)
+        if key == 1:
+            return self._block.tensors[self._index]
+        raise IndexError("index is out of range.")
+
+    def __setitem__(self, key, value):
+        if key != 1:
+            raise TypeError("Only the value of the parameter can be changed.")
+        self._block.tensors[self._index] = value
+
+    def __iter__(self):
+        yield self[0]
+        yield self[1]
+
+    def __len__(self):
+        return 2
+
+
+class _ContainerView:
+    """
+    Sequence of ``[specs, parameter]`` pairs of all parameters in the order of the
+    specs. Parameters are views into the arrays of the blocks.
+    """
+
+    def __init__(self, blocks):
+        self._blocks = [block for block in blocks if len(block) > 0]
+        self._length = sum([len(block) for block in self._blocks])
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("index is out of range.")
+
+        for block in self._blocks:
+            if index < len(block):
+                return _ContainerEntry(block=block, index=index)
+            index -= len(block)
+
+    def __iter__(self):
+        for block in self._blocks:
+            for index in range(len(block)):
+                yield [block.specs(index), block.tensors[index]]
+
+
 class _InteractionParameters:
     """
     Interaction parameters of spin Hamiltonian.
 
+    Parameters with the same n and p_n are stored in one block of arrays (see
+    :py:class:`._ParametersBlock`). New parameters are collected in a dictionary and
+    merged into the blocks at once, when the blocks are accessed. Removed parameters
+    are only marked in their blocks and dropped at the same moment.
+
     This class assumes:
 
     * Order of parameters by the specs = [n, p_n, nus, alphas].
     * Only one parameter for each set of alphas & nus.
     * That shape of the parameter's tensor matches n.
     * That n and/or p_n are correct for corresponding alphas and nus.
-    * Keeps track of positions of parameters with different n and p_n in the container via
-      ``_slices`` attribute.
     """
 
     def __init__(self):
-        # Elements of the container are
-        # [(n, p_n, (nu_2, ..., nu_n), (alpha_1, ..., alpha_n)), parameter]
-        self._container = []
-        self._slices = {
-            # (n, p_n): [start, length]
-            (1, 1): [0, 0],
-            (2, 1): [0, 0],
-            (2, 2): [0, 0],
-            (3, 1): [0, 0],
-            (3, 2): [0, 0],
-            (3, 3): [0, 0],
-            (4, 1): [0, 0],
-            (4, 2): [0, 0],
-            (4, 3): [0, 0],
-            (4, 4): [0, 0],
-            (4, 5): [0, 0],
-        }
-
-    def _get_index(self, specs):
-        """
-        Get an index of an interaction parameter in the container if it exists.
+        self._blocks = {key: _ParametersBlock(*key) for key in _BLOCK_KEYS}
+        # {(n, p_n, (nu_2, ..., nu_n), (alpha_1, ..., alpha_n)): parameter}
+        self._pending = {}
+
+    def _flush(self):
+        """
+        Merges pending parameters into the blocks and drops the removed ones.
+        """
+
+        for block in self._blocks.values():
+            block.compact()
+
+        if len(self._pending) == 0:
+            return
+
+        groups = {}
+        for specs, parameter in self._pending.items():
+            groups.setdefault(specs[:2], []).append((specs, parameter))
+
+        for (n, p_n), entries in groups.items():
+            T = len(entries)
+            self._blocks[(n, p_n)].extend(
+                nus=np.array([specs[2] for specs, _ in entries], dtype=int).reshape(
+                    (T, n - 1, 3)
+                ),
+                alphas=np.array([specs[3] for specs, _ in entries], dtype=int).reshape(
+                    (T, n)
+                ),
+                tensors=np.array(
+                    [parameter for _, parameter in entries], dtype=float
+                ).reshape((T,) + (3,) * n),
+            )
+
+        self._pending = {}
+
+    def _get_blocks(self, n=0, p_n=0):
+        """
+        Blocks of the parameters with given n and p_n.
 
         Parameters
         ----------
-        specs : tuple
-            Tuple with the special structure that uniquely defines the spin operators
-            associated with the interaction parameter.
+        n : int, default 0
+            Amount of spins. If ``0``, then blocks with any n are returned.
+        p_n : int, default 0
+            If ``0``, then blocks with any p_n are returned.
 
-            .. code-block:: python
+        Returns
+        -------
+        blocks : list of _ParametersBlock
+            Blocks in the order of the specs.
+        """
 
-                (n, p_n, (nu_2, ..., nu_n), (alpha_1, ..., alpha_n))
+        self._flush()
+
+        return [
+            block
+            for (block_n, block_p_n), block in self._blocks.items()
+            if (n == 0 or block_n == n) and (p_n == 0 or block_p_n == p_n)
+        ]
+
+    @property
+    def _container(self):
+        """
+        List-like view of all parameters as ``[specs, parameter]`` pairs.
 
         Returns
         -------
-        index : int
-            Index of the interaction parameter in the container if it exists, -1 otherwise.
+        container : _ContainerView
         """
 
-        low = 0
-        high = len(self._container) - 1
-        while low <= high:
-            middle = (low + high) // 2
-            if self._container[middle][0] > specs:
-                high = middle - 1
-            elif self._container[middle][0] < specs:
-                low = middle + 1
-            else:
-                return middle
-        return -1
+        return _ContainerView(blocks=self._get_blocks())
 
-    def _update_slices(self, n, p_n, delta):
+    @property
+    def _slices(self):
         """
-        Update tracking of positions of parameters with different n and p_n.
+        Positions of parameters with different n and p_n in the container.
 
-        Parameters
-        ----------
-        n : int
-            n of the parameters to update the tracking for.
-        p_n : int
-            p_n of the parameters to update the tracking for.
-        delta : int
-            How many new parameters were added (positive) or removed (negative) to the
-            (n, p_n) group.
-        """
-        for key in self._slices:
-            # Update the length of the slice for the corresponding n and p_n
-            if (n, p_n) == key:
-                self._slices[key][1] += delta
-            # Update the start for all the following slices
-            elif (n, p_n) < key:
-                self._slices[key][0] += delta
+        Returns
+        -------
+        slices : dict
+            ``{(n, p_n): [start, length]}``.
+        """
+
+        slices = {}
+        start = 0
+        for block in self._get_blocks():
+            slices[(block.n, block.p_n)] = [start, len(block)]
+            start += len(block)
+
+        return slices
 
     def add(self, specs, parameter, when_present="raise error", weights=None):
         """
@@ -217,12 +838,14 @@ class _InteractionParameters:
         ValueError
             If the parameter is already present in the container and ``when_present`` is
             set to ``"raise error"``.
+
+        ValueError
+            If the combination of n and p_n is not supported.
         """
 
         # REMOVE in September 2026
         if when_present == "add":
             when_present = "sum"
-            import warnings
 
             warnings.warn(
                 "Value 'add' for when_present is deprecated in 0.5.0 and will be removed in September 2026. Use 'sum' instead.",
@@ -230,38 +853,182 @@ class _InteractionParameters:
                 stacklevel=2,
             )
 
-        index = self._get_index(specs=specs)
+        if specs[:2] not in self._blocks:
+            raise ValueError(f"Unsupported n and p_n: {specs[:2]}.")
 
         parameter = np.array(parameter, dtype=float)
 
+        if specs in self._pending:
+            self._pending[specs] = _merge_parameters(
+                existing=self._pending[specs],
+                new=parameter,
+                when_present=when_present,
+                weights=weights,
+            )
+            return
+
+        block = self._blocks[specs[:2]]
+        index = block.find(specs=specs)
+
         if index == -1:
-            self._container.append([specs, parameter])
-            self._container.sort(key=lambda x: x[0])
-            self._update_slices(n=specs[0], p_n=specs[1], delta=1)
+            self._pending[specs] = parameter
         else:
-            if when_present == "raise error":
+            block.tensors[index] = _merge_parameters(
+                existing=block.tensors[index],
+                new=parameter,
+                when_present=when_present,
+                weights=weights,
+            )
+
+    def add_many(
+        self, specs_list, parameters, when_present="raise error", weights=None
+    ):
+        """
+        Add a batch of interaction parameters to the container.
+
+        Equivalent to the successive calls of :py:meth:`._InteractionParameters.add`,
+        but the batch is validated before any parameter is added.
+
+        Parameters
+        ----------
+        specs_list : list of tuple
+            Specs of the interaction parameters. See
+            :py:meth:`._InteractionParameters.add`.
+
+        parameters : (T, 3, 3, ..., 3) |array-like|_ or list of (3, 3, ..., 3) |array-like|_
+            Tensors of the interaction parameters.
+
+        when_present : str, default "raise error"
+            Action to take if the parameter is already present in the container or
+            repeats in the batch. See :py:meth:`._InteractionParameters.add`.
+
+        weights : tuple, optional
+            See :py:meth:`._InteractionParameters.add`.
+
+        Raises
+        ------
+        ValueError
+            If lengths of ``specs_list`` and ``parameters`` do not match.
+
+        ValueError
+            If some parameter is already present in the container (or repeats in the
+            batch) and ``when_present`` is set to ``"raise error"``. Container is not
+            changed in that case.
+        """
+
+        if len(specs_list) != len(parameters):
+            raise ValueError(
+                f"Expected the same amount of specs and parameters, got "
+                f"{len(specs_list)} and {len(parameters)}."
+            )
+
+        groups = {}
+        for i, specs in enumerate(specs_list):
+            if specs[:2] not in self._blocks:
+                raise ValueError(f"Unsupported n and p_n: {specs[:2]}.")
+            groups.setdefault(specs[:2], []).append(i)
+
+        if when_present == "raise error":
+            if len(set(specs_list)) != len(specs_list) or any(
+                specs in self for specs in specs_list
+            ):
                 raise ValueError("Parameter with such specs is already present.")
-            elif when_present == "replace":
-                self._container[index][1] = parameter
-            elif when_present == "sum":
-                self._container[index][1] += parameter
-            elif when_present == "mean":
-                self._container[index][1] = (self._container[index][1] + parameter) / 2
-            elif when_present == "weighted average":
-                if weights is None or len(weights) != 2:
-                    raise ValueError(
-                        "Weights must be provided as a tuple of two numbers when when_present is set to 'weighted average'."
-                    )
-                w_existing, w_new = weights
-                self._container[index][1] = (
-                    w_existing * self._container[index][1] + w_new * parameter
-                ) / (w_existing + w_new)
-            elif when_present == "skip":
-                pass
-            else:
-                raise ValueError(
-                    f"Unsupported value for when_present: {when_present}. Supported values are: 'raise error', 'replace', 'sum', 'mean', 'weighted average', 'skip'."
+
+        # Order-dependent merges are done one by one
+        if when_present not in ["raise error", "replace", "sum", "skip"]:
+            for specs, parameter in zip(specs_list, parameters):
+                self.add(
+                    specs=specs,
+                    parameter=parameter,
+                    when_present=when_present,
+                    weights=weights,
                 )
+            return
+
+        self._flush()
+
+        for (n, p_n), indices in groups.items():
+            T = len(indices)
+            nus = np.array([specs_list[j][2] for j in indices], dtype=np.int64)
+            alphas = np.array([specs_list[j][3] for j in indices], dtype=np.int64)
+            self._merge_batch(
+                n=n,
+                p_n=p_n,
+                keys=np.concatenate(
+                    (nus.reshape((T, 3 * (n - 1))), alphas.reshape((T, n))), axis=1
+                ),
+                tensors=np.array([parameters[j] for j in indices], dtype=float).reshape(
+                    (T,) + (3,) * n
+                ),
+                when_present=when_present,
+            )
+
+    def _merge_batch(self, n, p_n, keys, tensors, when_present):
+        """
+        Merges a batch of parameters with the same n and p_n into the container.
+
+        Parameters
+        ----------
+        n : int
+            Amount of spins of the parameters.
+
+        p_n : int
+            p_n of the parameters.
+
+        keys : (T, 4 * n - 3) :numpy:`ndarray`
+            Keys of the new parameters, see :py:meth:`._ParametersBlock.keys`.
+
+        tensors : (T, 3, ..., 3) :numpy:`ndarray`
+            Tensors of the new parameters.
+
+        when_present : str
+            One of ``"raise error"``, ``"replace"``, ``"sum"`` or ``"skip"``.
+
+        Raises
+        ------
+        ValueError
+            If some parameter is already present in the container (or repeats in the
+            batch) and ``when_present`` is set to ``"raise error"``. Container is not
+            changed in that case.
+        """
+
+        block = self._get_blocks(n=n, p_n=p_n)[0]
+
+        # Group repeated parameters of the batch
+        order = _sorting_order(keys)
+        keys = keys[order]
+        tensors = tensors[order]
+        starts = _group_starts(keys)
+
+        if when_present == "sum":
+            tensors = np.add.reduceat(tensors, starts, axis=0)
+        elif when_present == "replace":
+            tensors = tensors[np.append(starts[1:], len(keys)) - 1]
+        else:
+            tensors = tensors[starts]
+        keys = np.ascontiguousarray(keys[starts])
+
+        # Find parameters, that are present in the block
+        positions = block.positions(keys)
+        present = positions != -1
+
+        if when_present == "raise error" and (
+            len(starts) != len(order) or present.any()
+        ):
+            raise ValueError("Parameter with such specs is already present.")
+
+        if when_present == "sum":
+            block.tensors[positions[present]] += tensors[present]
+        elif when_present == "replace":
+            block.tensors[positions[present]] = tensors[present]
+
+        new = ~present
+        if new.any():
+            block.extend(
+                nus=keys[new, : 3 * (n - 1)].reshape((new.sum(), n - 1, 3)),
+                alphas=keys[new, 3 * (n - 1) :],
+                tensors=tensors[new],
+            )
 
     def remove(self, specs):
         """
@@ -278,13 +1045,34 @@ class _InteractionParameters:
                 (n, p_n, (nu_2, ..., nu_n), (alpha_1, ..., alpha_n))
         """
 
-        index = self._get_index(specs=specs)
+        if specs in self._pending:
+            del self._pending[specs]
+        elif specs[:2] in self._blocks:
+            block = self._blocks[specs[:2]]
+            index = block.find(specs=specs)
+            if index != -1:
+                block.discard(index)
+
+    def _map_alphas(self, mapping):
+        """
+        Replaces indices of atoms in all parameters.
+
+        Parameters
+        ----------
+        mapping : (M', ) |array-like|_
+            New index of each atom, i.e. ``alpha -> mapping[alpha]``. Shall not map two
+            atoms, that are present in the parameters, to the same index.
+        """
 
-        if index != -1:
-            del self._container[index]
-            self._update_slices(n=specs[0], p_n=specs[1], delta=-1)
+        mapping = np.array(mapping, dtype=int)
+
+        for block in self._get_blocks():
+            if len(block) > 0:
+                block.alphas = mapping[block.alphas]
+                block.sort()
 
     def copy(self):
+        self._flush()
         return deepcopy(self)
 
     def __add__(self, other):
@@ -307,39 +1095,13 @@ class _InteractionParameters:
                 f"unsupported operand type(s) for +: '{self.__class__.__name__}' and '{other.__class__.__name__}'"
             )
 
-        result = _InteractionParameters()
+        self._flush()
+        other._flush()
 
-        i1 = 0
-        L1 = len(self._container)
-
-        i2 = 0
-        L2 = len(other._container)
-
-        while i1 < L1 or i2 < L2:
-            if i1 >= L1:
-                specs = other._container[i2][0]
-                parameter = other._container[i2][1].copy()
-                i2 += 1
-            elif i2 >= L2:
-                specs = self._container[i1][0]
-                parameter = self._container[i1][1].copy()
-                i1 += 1
-            elif self._container[i1][0] < other._container[i2][0]:
-                specs = self._container[i1][0]
-                parameter = self._container[i1][1].copy()
-                i1 += 1
-            elif self._container[i1][0] > other._container[i2][0]:
-                specs = other._container[i2][0]
-                parameter = other._container[i2][1].copy()
-                i2 += 1
-            else:
-                specs = self._container[i1][0]
-                parameter = self._container[i1][1] + other._container[i2][1]
-                i1 += 1
-                i2 += 1
+        result = _InteractionParameters()
 
-            result._container.append([specs, parameter])
-            result._update_slices(n=specs[0], p_n=specs[1], delta=1)
+        for key in _BLOCK_KEYS:
+            result._blocks[key] = self._blocks[key].summed(other._blocks[key])
 
         return result
 
@@ -364,10 +1126,15 @@ class _InteractionParameters:
             )
 
         result = _InteractionParameters()
-        result._slices = self._slices.copy()
 
-        for specs, parameter in self._container:
-            result._container.append([specs, parameter * number])
+        for block in self._get_blocks():
+            result._blocks[(block.n, block.p_n)] = _ParametersBlock(
+                n=block.n,
+                p_n=block.p_n,
+                nus=block.nus.copy(),
+                alphas=block.alphas.copy(),
+                tensors=block.tensors * number,
+            )
 
         return result
 
@@ -378,10 +1145,18 @@ class _InteractionParameters:
         return self + (-1) * other
 
     def __len__(self):
-        return len(self._container)
+        return len(self._pending) + sum(
+            [len(block) - block._n_removed for block in self._blocks.values()]
+        )
 
     def __contains__(self, specs):
-        return self._get_index(specs=specs) != -1
+        if specs in self._pending:
+            return True
+
+        if specs[:2] not in self._blocks:
+            return False
+
+        return self._blocks[specs[:2]].find(specs=specs) != -1
 
 
 INTEGER_PARTITION = {0: 0, 1: 1, 2: 2, 3: 3, 4: 5}
@@ -410,52 +1185,46 @@ class _InteractionParametersIterator:
         self.n = n
         self.p_n = p_n
 
-        if self.n == 0:
-            self.start = 0
-            self.length = len(self.parameters)
-        elif self.p_n == 0:
-            self.start = self.parameters._slices[(self.n, 1)][0]
-            self.length = sum(
-                [
-                    self.parameters._slices[(n, p_n)][1]
-                    for n, p_n in self.parameters._slices
-                    if n == self.n
-                ]
-            )
-        else:
-            self.start, self.length = self.parameters._slices[(self.n, self.p_n)]
+        self.blocks = self.parameters._get_blocks(n=self.n, p_n=self.p_n)
+        self.length = sum([len(block) for block in self.blocks])
 
         self.index = 0
 
+    def _locate(self, index: int):
+        for block in self.blocks:
+            if index < len(block):
+                return block, index
+            index -= len(block)
+
     def __next__(self):
         if self.index < self.length:
             self.index += 1
-            (_, _, nus, alphas), parameter = self.parameters._container[
-                self.start + self.index - 1
-            ]
-            return nus, alphas, parameter
+            return self[self.index - 1]
         raise StopIteration
 
     def __getitem__(self, index: int):
         if index < 0 or index >= self.length:
             raise IndexError("index is out of range.")
-        (_, _, nus, alphas), parameter = self.parameters._container[self.start + index]
-        return nus, alphas, parameter
+        block, index = self._locate(index)
+        _, _, nus, alphas = block.specs(index)
+        # Copy, so that the returned parameter is not affected by later assignments
+        return nus, alphas, block.tensors[index].copy()
 
     # It is enough to provide the parameter as value, since the sites do not change
     def __setitem__(self, index: int, value):
         if index < 0 or index >= self.length:
             raise IndexError("index is out of range.")
 
+        block, index = self._locate(index)
+
         value = np.array(value)
-        n = self.parameters._container[self.start + index][0][0]
 
-        if len(value.shape) != n or any(_ != 3 for _ in value.shape):
+        if len(value.shape) != block.n or any(_ != 3 for _ in value.shape):
             raise ValueError(
-                f"Expected parameter to be a tensor with {n} components of size 3, got {value.shape}."
+                f"Expected parameter to be a tensor with {block.n} components of size 3, got {value.shape}."
             )
 
-        self.parameters._container[self.start + index][1] = np.array(value)
+        block.tensors[index] = value
 
     def __len__(self):
         return self.length
@@ -19,194 +19,71 @@
 # ================================ END LICENSE =================================
 import numpy as np
 
-from magnopy._parameters._interaction_parameters import (
-    _InteractionParameters,
-    _get_specs,
-)
+from magnopy._parameters._interaction_parameters import _InteractionParameters
 from magnopy._spinham._convention import Convention
 
+# Positions of the spin operators of the n-spin parameter, that are kept in its
+# corrections. Other spin operators are replaced by the classical spin vectors. Order
+# of the positions is the order of indices of the corrected tensor.
+_KEPT_POSITIONS = {
+    1: [(0,)],
+    2: [(0,), (1,), (0, 1)],
+    3: [(0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2)],
+    4: [
+        (0,),
+        (1,),
+        (2,),
+        (3,),
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (1, 2),
+        (1, 3),
+        (2, 3),
+        (0, 1, 2),
+        (0, 1, 3),
+        (0, 3, 2),
+        (3, 1, 2),
+        (0, 1, 2, 3),
+    ],
+}
+
+# p_n of the k-spin parameter by the amount of coinciding pairs of its spin operators
+_P_N_BY_PAIRS = {
+    1: np.array([1]),
+    2: np.array([2, 1]),
+    3: np.array([3, 2, 0, 1]),
+    4: np.array([5, 4, 3, 2, 0, 0, 1]),
+}
+
+
+def _get_p_n(nus, alphas):
+    """
+    Computes p_n for the stack of the parameters.
+
+    Parameters
+    ----------
+    nus : (T, k, 3) :numpy:`ndarray`
+        Unit cell indices of all k spin operators (including the first one).
+    alphas : (T, k) :numpy:`ndarray`
+        Atom indices of all k spin operators.
 
-def _minus(nu):
-    return tuple([-_ for _ in nu])
-
-
-def _diff(nu1, nu2):
-    return tuple([nu1[_] - nu2[_] for _ in range(3)])
-
-
-def _get_corrections_1(nus, alphas, parameter, C1):
-    return [[((0, 0, 0),), alphas, parameter * C1]]
-
-
-def _get_corrections_2(nus, alphas, parameter, C2, spins):
-    nu_2 = nus[0]
-    alpha_1, alpha_2 = alphas
-    return [
-        # One spin
-        [((0, 0, 0),), (alpha_1,), C2 * (parameter @ spins[alpha_2])],
-        # One spin
-        [((0, 0, 0),), (alpha_2,), C2 * (spins[alpha_1] @ parameter)],
-        # Two spins
-        [((0, 0, 0), nu_2), (alpha_1, alpha_2), C2 * parameter],
-    ]
-
-
-def _get_corrections_3(nus, alphas, parameter, C3, spins):
-    nu_2 = nus[0]
-    nu_3 = nus[1]
-    alpha_1, alpha_2, alpha_3 = alphas
-    return [
-        # One spin
-        [
-            ((0, 0, 0),),
-            (alpha_1,),
-            C3 * np.einsum("ijk,j,k->i", parameter, spins[alpha_2], spins[alpha_3]),
-        ],
-        [
-            ((0, 0, 0),),
-            (alpha_2,),
-            C3 * np.einsum("jik,j,k->i", parameter, spins[alpha_1], spins[alpha_3]),
-        ],
-        [
-            ((0, 0, 0),),
-            (alpha_3,),
-            C3 * np.einsum("kji,j,k->i", parameter, spins[alpha_2], spins[alpha_1]),
-        ],
-        # Two spins
-        [
-            ((0, 0, 0), nu_2),
-            (alpha_1, alpha_2),
-            C3 * np.einsum("ijk,k->ij", parameter, spins[alpha_3]),
-        ],
-        [
-            ((0, 0, 0), nu_3),
-            (alpha_1, alpha_3),
-            C3 * np.einsum("ikj,k->ij", parameter, spins[alpha_2]),
-        ],
-        [
-            ((0, 0, 0), _diff(nu_3, nu_2)),
-            (alpha_2, alpha_3),
-            C3 * np.einsum("kij,k->ij", parameter, spins[alpha_1]),
-        ],
-        # Three spins
-        [((0, 0, 0), nu_2, nu_3), (alpha_1, alpha_2, alpha_3), C3 * parameter],
-    ]
-
-
-def _get_corrections_4(nus, alphas, parameter, C4, spins):
-    nu_2 = nus[0]
-    nu_3 = nus[1]
-    nu_4 = nus[2]
-    alpha_1, alpha_2, alpha_3, alpha_4 = alphas
-    return [
-        # One spin
-        [
-            ((0, 0, 0),),
-            (alpha_1,),
-            C4
-            * np.einsum(
-                "ijkl,j,k,l->i",
-                parameter,
-                spins[alpha_2],
-                spins[alpha_3],
-                spins[alpha_4],
-            ),
-        ],
-        [
-            ((0, 0, 0),),
-            (alpha_2,),
-            C4
-            * np.einsum(
-                "jikl,j,k,l->i",
-                parameter,
-                spins[alpha_1],
-                spins[alpha_3],
-                spins[alpha_4],
-            ),
-        ],
-        [
-            ((0, 0, 0),),
-            (alpha_3,),
-            C4
-            * np.einsum(
-                "kjil,j,k,l->i",
-                parameter,
-                spins[alpha_2],
-                spins[alpha_1],
-                spins[alpha_4],
-            ),
-        ],
-        [
-            ((0, 0, 0),),
-            (alpha_4,),
-            C4
-            * np.einsum(
-                "ljki,j,k,l->i",
-                parameter,
-                spins[alpha_2],
-                spins[alpha_3],
-                spins[alpha_1],
-            ),
-        ],
-        # Two spins
-        [
-            ((0, 0, 0), nu_2),
-            (alpha_1, alpha_2),
-            C4 * np.einsum("ijkl,k,l->ij", parameter, spins[alpha_3], spins[alpha_4]),
-        ],
-        [
-            ((0, 0, 0), nu_3),
-            (alpha_1, alpha_3),
-            C4 * np.einsum("ikjl,k,l->ij", parameter, spins[alpha_2], spins[alpha_4]),
-        ],
-        [
-            ((0, 0, 0), nu_4),
-            (alpha_1, alpha_4),
-            C4 * np.einsum("ilkj,k,l->ij", parameter, spins[alpha_3], spins[alpha_2]),
-        ],
-        [
-            ((0, 0, 0), _diff(nu_3, nu_2)),
-            (alpha_2, alpha_3),
-            C4 * np.einsum("kijl,k,l->ij", parameter, spins[alpha_1], spins[alpha_4]),
-        ],
-        [
-            ((0, 0, 0), _diff(nu_4, nu_2)),
-            (alpha_2, alpha_4),
-            C4 * np.einsum("likj,k,l->ij", parameter, spins[alpha_3], spins[alpha_1]),
-        ],
-        [
-            ((0, 0, 0), _diff(nu_4, nu_3)),
-            (alpha_3, alpha_4),
-            C4 * np.einsum("klij,k,l->ij", parameter, spins[alpha_1], spins[alpha_2]),
-        ],
-        # Three spins
-        [
-            ((0, 0, 0), nu_2, nu_3),
-            (alpha_1, alpha_2, alpha_3),
-            C4 * np.einsum("ijkl,l->ijk", parameter, spins[alpha_4]),
-        ],
-        [
-            ((0, 0, 0), nu_2, nu_4),
-            (alpha_1, alpha_2, alpha_4),
-            C4 * np.einsum("ijlk,l->ijk", parameter, spins[alpha_3]),
-        ],
-        [
-            ((0, 0, 0), nu_4, nu_3),
-            (alpha_1, alpha_4, alpha_3),
-            C4 * np.einsum("ilkj,l->ijk", parameter, spins[alpha_2]),
-        ],
-        [
-            ((0, 0, 0), _diff(nu_2, nu_4), _diff(nu_3, nu_4)),
-            (alpha_4, alpha_2, alpha_3),
-            C4 * np.einsum("ljki,l->ijk", parameter, spins[alpha_1]),
-        ],
-        # Four spins
-        [
-            ((0, 0, 0), nu_2, nu_3, nu_4),
-            (alpha_1, alpha_2, alpha_3, alpha_4),
-            C4 * parameter,
-        ],
-    ]
+    Returns
+    -------
+    p_n : (T, ) :numpy:`ndarray`
+        Same as in :py:func:`._get_specs`.
+    """
+
+    k = alphas.shape[1]
+
+    sites = np.concatenate((alphas[:, :, np.newaxis], nus), axis=2)
+
+    pairs = np.zeros(len(alphas), dtype=int)
+    for i in range(k):
+        for j in range(i + 1, k):
+            pairs += (sites[:, i] == sites[:, j]).all(axis=1)
+
+    return _P_N_BY_PAIRS[k][pairs]
 
 
 def _renormalized_parameters(
@@ -219,6 +96,9 @@ def _renormalized_parameters(
     Renormalizes the interaction parameters as described in supplementary note 6 of
     |paper-2026|_.
 
+    Parameters with the same n and p_n are contracted with the spin vectors at once.
+    Corrections with the same specs are summed.
+
     Parameters
     ----------
     parameters : _InteractionParameters
@@ -253,69 +133,65 @@ def _renormalized_parameters(
 
     spins = spin_values[:, np.newaxis] * spin_directions
 
-    renormalized_parameters = _InteractionParameters()
+    # {(n, p_n): [(keys, tensors), ...]}
+    corrections = {}
+
+    for block in parameters._get_blocks():
+        if len(block) == 0:
+            continue
+
+        n, T = block.n, len(block)
 
-    for (n, p_n, nus, alphas), parameter in parameters._container:
         if n == 1:
-            corrections = _get_corrections_1(
-                nus=nus, alphas=alphas, parameter=parameter, C1=convention.c1
-            )
+            C = convention.c1
+        else:
+            C = getattr(convention, f"c{n}{block.p_n}")
+
+        # Unit cell index of the first spin operator is included
+        nus = np.concatenate((np.zeros((T, 1, 3), dtype=int), block.nus), axis=1)
+        block_spins = spins[block.alphas]
+
+        indices = "ijkl"[:n]
 
-        elif n == 2:
-            # Get C2
-            if p_n == 1:
-                C2 = convention.c21
-            elif p_n == 2:
-                C2 = convention.c22
-            else:
-                raise ValueError(f"Invalid p_n={p_n} for n=2. Expected p_n=1 or p_n=2.")
-
-            corrections = _get_corrections_2(
-                nus=nus, alphas=alphas, parameter=parameter, C2=C2, spins=spins
+        for positions in _KEPT_POSITIONS[n]:
+            k = len(positions)
+            contracted = [m for m in range(n) if m not in positions]
+
+            subscripts = [f"t{indices}"] + [f"t{indices[m]}" for m in contracted]
+            kept = "".join([indices[m] for m in positions])
+            tensors = C * np.einsum(
+                ",".join(subscripts) + f"->t{kept}",
+                block.tensors,
+                *[block_spins[:, m] for m in contracted],
             )
 
-        elif n == 3:
-            if p_n == 1:
-                C3 = convention.c31
-            elif p_n == 2:
-                C3 = convention.c32
-            elif p_n == 3:
-                C3 = convention.c33
-            else:
-                raise ValueError(
-                    f"Invalid p_n={p_n} for n=3. Expected p_n=1, p_n=2 or p_n=3."
-                )
+            kept_nus = nus[:, positions]
+            kept_alphas = block.alphas[:, positions]
 
-            corrections = _get_corrections_3(
-                nus=nus, alphas=alphas, parameter=parameter, C3=C3, spins=spins
+            keys = np.concatenate(
+                (
+                    (kept_nus[:, 1:] - kept_nus[:, :1]).reshape((T, 3 * (k - 1))),
+                    kept_alphas,
+                ),
+                axis=1,
             )
+            p_ns = _get_p_n(nus=kept_nus, alphas=kept_alphas)
 
-        elif n == 4:
-            if p_n == 1:
-                C4 = convention.c41
-            elif p_n == 2:
-                C4 = convention.c42
-            elif p_n == 3:
-                C4 = convention.c43
-            elif p_n == 4:
-                C4 = convention.c44
-            elif p_n == 5:
-                C4 = convention.c45
-            else:
-                raise ValueError(
-                    f"Invalid p_n={p_n} for n=4. Expected p_n=1, p_n=2, p_n=3, p_n=4 or p_n=5."
+            for p_n in np.unique(p_ns):
+                mask = p_ns == p_n
+                corrections.setdefault((k, int(p_n)), []).append(
+                    (keys[mask], tensors[mask])
                 )
 
-            corrections = _get_corrections_4(
-                nus=nus, alphas=alphas, parameter=parameter, C4=C4, spins=spins
-            )
-        else:
-            raise ValueError(f"Invalid n={n}. Expected n=1, n=2, n=3 or n=4.")
+    renormalized_parameters = _InteractionParameters()
 
-        for nus, alphas, parameter in corrections:
-            specs = _get_specs(nus=nus, alphas=alphas)
-            renormalized_parameters.add(
-                specs=specs, parameter=parameter, when_present="sum"
-            )
+    for key, parts in corrections.items():
+        renormalized_parameters._merge_batch(
+            n=key[0],
+            p_n=key[1],
+            keys=np.concatenate([keys for keys, _ in parts], axis=0),
+            tensors=np.concatenate([tensors for _, tensors in parts], axis=0),
+            when_present="sum",
+        )
 
     return renormalized_parameters
@@ -52,7 +52,9 @@ from magnopy._parameters._interaction_parameters import (
 )
 from magnopy._parameters._equivalent_sets import (
     _get_equivalent,
+    _get_equivalent_block,
     _get_missing_parameters,
+    _representatives,
     _set_distribution,
 )
 
@@ -598,24 +600,32 @@ class SpinHamiltonian:
             return
 
         new_parameters = _InteractionParameters()
-        for (n, p_n, nus, alphas), parameter in self._parameters._container:
-            equivalent_parameters = _get_equivalent(
-                n=n, p_n=p_n, nus=nus, alphas=alphas, parameter=parameter
-            )
+        for block in self._parameters._get_blocks():
+            if len(block) == 0:
+                continue
 
-            degeneracy = len(equivalent_parameters)
+            keys, tensors = _get_equivalent_block(block)
+            T, V, K = keys.shape
 
             # It was absent before
             if multiple_counting:
-                for nus, alphas, parameter in equivalent_parameters:
-                    new_parameters.add(
-                        specs=(n, p_n, nus, alphas), parameter=parameter / degeneracy
-                    )
+                new_parameters._merge_batch(
+                    n=block.n,
+                    p_n=block.p_n,
+                    keys=keys.reshape((T * V, K)),
+                    tensors=tensors.reshape((T * V,) + (3,) * block.n) / V,
+                    when_present="raise error",
+                )
             # It was present before
             else:
-                nus, alphas, parameter = equivalent_parameters[0]
-                new_parameters.add(
-                    specs=(n, p_n, nus, alphas), parameter=parameter, when_present="sum"
+                rows = np.arange(T)
+                first = _representatives(keys)
+                new_parameters._merge_batch(
+                    n=block.n,
+                    p_n=block.p_n,
+                    keys=keys[rows, first],
+                    tensors=tensors[rows, first],
+                    when_present="sum",
                 )
 
         self._parameters = new_parameters
@@ -629,16 +639,16 @@ class SpinHamiltonian:
         if self.convention.spin_normalized == spin_normalized:
             return
 
-        for i, (specs, _) in enumerate(self._parameters._container):
-            factor = 1.0
-            for alpha in specs[3]:
-                factor = factor * self.atoms.spins[alpha]
+        spins = np.array(self.atoms.spins, dtype=float)
+        for block in self._parameters._get_blocks():
+            factors = np.prod(spins[block.alphas], axis=1)
+            factors = factors.reshape((len(block),) + (1,) * block.n)
             # Before it was not normalized
             if spin_normalized:
-                self._parameters._container[i][1] *= factor
+                block.tensors *= factors
             # Before it was normalized
             else:
-                self._parameters._container[i][1] /= factor
+                block.tensors /= factors
 
     def _set_convention_constant(self, old_value, new_value, n, p_n) -> None:
         if new_value is None or old_value is None:
@@ -650,11 +660,8 @@ class SpinHamiltonian:
             return
 
         # If factor is changing one has to scale parameters.
-        for i, (specs, _) in enumerate(self._parameters._container):
-            if specs[:2] == (n, p_n):
-                self._parameters._container[i][1] *= old_value / new_value
-            elif specs[:2] > (n, p_n):
-                break
+        for block in self._parameters._get_blocks(n=n, p_n=p_n):
+            block.tensors *= old_value / new_value
 
     ############################################################################
     #                                   Units                                  #
@@ -707,11 +714,11 @@ class SpinHamiltonian:
 
         conversion_factor = _PARAMETER_UNITS[self._units] / _PARAMETER_UNITS[new_units]
 
-        for i in range(len(self._parameters._container)):
-            self._parameters._container[i][1] *= conversion_factor
+        for block in self._parameters._get_blocks():
+            block.tensors *= conversion_factor
 
-        for i in range(len(self._zeeman_parameters._container)):
-            self._zeeman_parameters._container[i][1] *= conversion_factor
+        for block in self._zeeman_parameters._get_blocks():
+            block.tensors *= conversion_factor
 
         self._units = new_units.lower()
 
@@ -1131,13 +1138,15 @@ class SpinHamiltonian:
                                             parameter=parameter,
                                         )
 
-                                        nu, alphas, parameter = equivalent_parameters[0]
+                                        nus, alphas, parameter = equivalent_parameters[
+                                            0
+                                        ]
                                     else:
-                                        nu = (i, j, k)
+                                        nus = ((i, j, k),)
                                         alphas = (alpha, beta)
 
                                     dd_parameters.add(
-                                        specs=(2, 2, (nu,), alphas),
+                                        specs=(2, 2, nus, alphas),
                                         parameter=parameter,
                                         when_present="skip",
                                     )
@@ -1647,19 +1656,14 @@ class SpinHamiltonian:
             tolerance = 1e-8 * _PARAMETER_UNITS["mev"] / _PARAMETER_UNITS[self._units]
         tolerance = abs(float(tolerance))
 
-        # Remove from main container
-        new_parameters = _InteractionParameters()
-        for specs, parameter in self._parameters._container:
-            if not np.all(np.abs(parameter) < tolerance):
-                new_parameters._container.append([specs, parameter])
-        self._parameters = new_parameters
-
-        # Remove from Zeeman parameters
-        new_zeeman_parameters = _InteractionParameters()
-        for specs, parameter in self._zeeman_parameters._container:
-            if not np.all(np.abs(parameter) < tolerance):
-                new_zeeman_parameters._container.append([specs, parameter])
-        self._zeeman_parameters = new_zeeman_parameters
+        # Remove from main container and from Zeeman parameters
+        for parameters in [self._parameters, self._zeeman_parameters]:
+            for block in parameters._get_blocks():
+                block.take(
+                    (np.abs(block.tensors) >= tolerance)
+                    .reshape((len(block), 3**block.n))
+                    .any(axis=1)
+                )
 
     ############################################################################
     #                          One spin & one site (1)                         #
@@ -229,6 +229,7 @@ def make_supercell(spinham: SpinHamiltonian, supercell):
     for key in spinham.atoms:
         new_atoms[key] = []
 
+    specs_list, parameters = [], []
     for k in range(supercell[2]):
         for j in range(supercell[1]):
             for i in range(supercell[0]):
@@ -283,11 +284,12 @@ def make_supercell(spinham: SpinHamiltonian, supercell):
                             new_nus.append(nu)
                         new_alphas.append(alpha)
 
-                    new_spinham._parameters.add(
-                        specs=(n, p_n, tuple(new_nus), tuple(new_alphas)),
-                        parameter=parameter,
-                        when_present="replace",
-                    )
+                    specs_list.append((n, p_n, tuple(new_nus), tuple(new_alphas)))
+                    parameters.append(parameter)
+
+    new_spinham._parameters.add_many(
+        specs_list=specs_list, parameters=parameters, when_present="replace"
+    )
 
     return new_spinham
 
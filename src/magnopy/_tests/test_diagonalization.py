@@ -24,10 +24,15 @@ from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import arrays as harrays
 
-from magnopy._diagonalization import _check_grand_dynamical_matrix, _inverse_by_colpa
+import magnopy._diagonalization as diagonalization
+from magnopy._diagonalization import (
+    _check_grand_dynamical_matrix,
+    _inverse_by_colpa,
+    _solve_upper_triangular,
+)
 
 
-from magnopy import solve_via_colpa
+from magnopy import solve_via_colpa, solve_via_colpa_batched
 from magnopy import ColpaFailed
 
 
@@ -81,3 +86,89 @@ def test_solve_via_colpa_2_x_2(D):
 
     except ColpaFailed:
         pass
+
+
+@pytest.mark.parametrize(
+    "D",
+    [
+        [[1, 0], [0, 1]],
+        [[[1, 2, 3]]],
+        [[[1, 2, 3], [4, 5, 6], [7, 8, 9]]],
+    ],
+)
+def test_solve_via_colpa_batched_wrong_shape(D):
+    with pytest.raises(ValueError):
+        solve_via_colpa_batched(D)
+
+
+@given(
+    D=harrays(
+        dtype=np.complex128,
+        shape=(5, 4, 4),
+        elements=st.complex_numbers(
+            min_magnitude=0, max_magnitude=10, allow_subnormal=False
+        ),
+    )
+)
+def test_solve_via_colpa_batched(D):
+    # Small addition - to avoid dealing with finite precision issues
+    D = (D + np.conjugate(np.transpose(D, (0, 2, 1)))) / 2 + 1e-10 * np.eye(4)
+
+    E, G, failed = solve_via_colpa_batched(D)
+
+    assert E.shape == (5, 4)
+    assert G.shape == (5, 4, 4)
+    assert failed.shape == (5,)
+
+    for i in range(5):
+        try:
+            E_single, G_single = solve_via_colpa(D[i])
+            assert not failed[i]
+            assert np.allclose(E[i], E_single)
+            assert np.allclose(G[i], G_single)
+        except ColpaFailed:
+            assert failed[i]
+            assert np.isnan(E[i]).all()
+            assert np.isnan(G[i]).all()
+
+
+@pytest.mark.parametrize(
+    "D",
+    [
+        np.eye(4),
+        np.diag([1, 1, 3, 3]),
+        # Two identical decoupled bosons with Bogoliubov terms
+        np.kron(np.array([[2, 1], [1, 2]]), np.eye(2)),
+        np.kron(np.array([[2, 0.5j], [-0.5j, 2]]), np.eye(3)),
+    ],
+)
+def test_solve_via_colpa_degenerate(D):
+    N = len(D) // 2
+    g = np.diag(np.concatenate((np.ones(N), -np.ones(N))))
+
+    E, G = solve_via_colpa(D)
+
+    assert np.allclose(E.imag, 0)
+    assert np.allclose(E[:N], E[:N][::-1])
+    assert np.allclose(np.conjugate(G).T @ np.diag(E) @ G, D)
+    assert np.allclose(G @ g @ np.conjugate(G).T, g)
+
+
+@pytest.mark.parametrize("scipy_available", [True, False])
+@pytest.mark.parametrize("shape", [(4, 4), (3, 4, 4), (3, 40, 40), (2, 2, 20, 20)])
+def test_solve_upper_triangular(monkeypatch, shape, scipy_available):
+    monkeypatch.setattr(
+        diagonalization,
+        "SCIPY_AVAILABLE",
+        scipy_available and diagonalization.SCIPY_AVAILABLE,
+    )
+
+    rng = np.random.default_rng(0)
+    K = np.triu(rng.normal(size=shape) + 1j * rng.normal(size=shape))
+    K += shape[-1] * np.eye(shape[-1])
+    B = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+    X = _solve_upper_triangular(K, B)
+
+    assert X.shape == shape
+    assert np.allclose(K @ X, B)
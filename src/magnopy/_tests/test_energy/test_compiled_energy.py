@@ -0,0 +1,224 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import Convention, Energy, SpinHamiltonian
+from magnopy._parameters._interaction_parameters import _InteractionParametersIterator
+from magnopy._parameters._renormalization import _renormalized_parameters
+from magnopy.examples import full_ham
+
+
+def _reference_E_0(energy, spin_directions):
+    spin_directions = np.array(spin_directions, dtype=float)
+    spin_directions = (
+        spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+    )
+    spins = spin_directions * energy.spins[:, np.newaxis]
+
+    result = 0
+    for (n, _, _, alphas), parameter in energy._parameters._container:
+        result += np.einsum(
+            "ijuv"[:n] + "," + ",".join("ijuv"[:n]),
+            parameter,
+            *[spins[alpha] for alpha in alphas],
+        )
+
+    return result
+
+
+@pytest.mark.parametrize("M", [4, 5, 7])
+def test_compiled_E_0(M):
+    energy = Energy(full_ham(M=M))
+
+    for n in energy._compiled:
+        alphas, tensors = energy._compiled[n]
+        assert alphas.shape == (len(tensors), n)
+        assert tensors.shape[1:] == (3,) * n
+
+    spin_directions = np.random.default_rng(M).normal(size=(M, 3))
+
+    assert np.allclose(
+        energy.E_0(spin_directions), _reference_E_0(energy, spin_directions)
+    )
+
+
+def test_compiled_E_0_no_parameters():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(names=["Fe"], spins=[1.5], positions=[[0, 0, 0]]),
+        convention=Convention(multiple_counting=True, spin_normalized=False),
+    )
+
+    energy = Energy(spinham)
+
+    assert energy._compiled == {}
+    assert energy.E_0([[0, 0, 1]]) == 0
+
+
+@pytest.mark.parametrize("M", [4, 5])
+def test_gradient_from_renormalized_parameters(M):
+    energy = Energy(full_ham(M=M))
+
+    spin_directions = np.random.default_rng(M).normal(size=(M, 3))
+    spin_directions /= np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+
+    reference = np.zeros((M, 3), dtype=float)
+    for _, alphas, parameter in _InteractionParametersIterator(
+        _renormalized_parameters(
+            parameters=energy._parameters,
+            convention=energy.convention,
+            spin_directions=spin_directions,
+            spin_values=energy.spins,
+        ),
+        n=1,
+        p_n=1,
+    ):
+        reference[alphas[0]] = parameter * energy.spins[alphas[0]]
+
+    assert np.allclose(energy.gradient(spin_directions), reference)
+
+
+@pytest.mark.parametrize("quantum_correction", [False, True])
+def test_stack_of_configurations(quantum_correction):
+    energy = Energy(full_ham(M=4))
+
+    spin_directions = np.random.default_rng(0).normal(size=(3, 4, 3))
+
+    energies = energy(spin_directions, quantum_correction=quantum_correction)
+    gradients = energy.gradient(spin_directions, quantum_correction=quantum_correction)
+    torques = energy.torque(spin_directions, quantum_correction=quantum_correction)
+
+    assert energies.shape == (3,)
+    assert gradients.shape == (3, 4, 3)
+    assert torques.shape == (3, 4, 3)
+
+    for i, sd in enumerate(spin_directions):
+        assert np.allclose(
+            energies[i], energy(sd, quantum_correction=quantum_correction)
+        )
+        assert np.allclose(
+            gradients[i],
+            energy.gradient(sd, quantum_correction=quantum_correction),
+        )
+        assert np.allclose(
+            torques[i], energy.torque(sd, quantum_correction=quantum_correction)
+        )
+
+
+def test_stack_of_configurations_units():
+    energy = Energy(full_ham(M=4))
+
+    spin_directions = np.random.default_rng(1).normal(size=(2, 4, 3))
+
+    assert np.allclose(
+        energy.E_0(spin_directions, units="Joule"),
+        [energy.E_0(sd, units="Joule") for sd in spin_directions],
+    )
+
+
+def _finite_difference_E_corr_gradient(energy, spin_directions, h=1e-6):
+    gradient = np.zeros((energy.M, 3), dtype=float)
+
+    sd = np.array(spin_directions, dtype=float)
+    for alpha in range(energy.M):
+        for i in range(3):
+            sd[alpha][i] += h
+            energy_plus = energy.E_corr(spin_directions=sd, _normalize=False)
+            sd[alpha][i] -= 2 * h
+            energy_minus = energy.E_corr(spin_directions=sd, _normalize=False)
+            sd[alpha][i] += h
+
+            gradient[alpha][i] = (energy_plus - energy_minus) / 2 / h
+
+    return gradient
+
+
+@pytest.mark.parametrize(
+    "spins, spin_directions",
+    [
+        (None, np.random.default_rng(10).normal(size=(4, 3))),
+        (None, np.random.default_rng(11).normal(size=(4, 3))),
+        (
+            [0.5, 1, 0.5, 2.5],
+            [[0, 0, 1], [0, 0, -1], [1, 0, 0], [0.3, -0.2, 0.9]],
+        ),
+    ],
+)
+def test_analytic_E_corr_gradient(spins, spin_directions):
+    energy = Energy(full_ham(M=4))
+    if spins is not None:
+        energy.spins = np.array(spins, dtype=float)
+
+    spin_directions = np.array(spin_directions, dtype=float)
+    spin_directions /= np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+
+    reference = _finite_difference_E_corr_gradient(energy, spin_directions)
+
+    assert np.allclose(
+        energy.gradient(spin_directions, quantum_correction=True)
+        - energy.gradient(spin_directions),
+        reference,
+        rtol=1e-6,
+        atol=1e-6 * np.abs(reference).max(),
+    )
+
+
+@pytest.mark.parametrize("quantum_correction", [False, True])
+def test_energy_and_torque(quantum_correction):
+    energy = Energy(full_ham(M=4))
+
+    spin_directions = np.random.default_rng(12).normal(size=(2, 4, 3))
+
+    energies, torques = energy.energy_and_torque(
+        spin_directions, units="Joule", quantum_correction=quantum_correction
+    )
+
+    for i, sd in enumerate(spin_directions):
+        assert np.allclose(
+            energies[i],
+            energy(sd, units="Joule", quantum_correction=quantum_correction),
+        )
+        assert np.allclose(
+            torques[i],
+            energy.torque(sd, units="Joule", quantum_correction=quantum_correction),
+        )
+
+    single_energy, single_torque = energy.energy_and_torque(spin_directions[0])
+
+    assert isinstance(single_energy, float)
+    assert single_torque.shape == (4, 3)
+
+
+def test_trial_point_cache():
+    energy = Energy(full_ham(M=4))
+
+    reference_sd = np.random.default_rng(13).normal(size=(4, 3))
+    reference_sd /= np.linalg.norm(reference_sd, axis=1)[:, np.newaxis]
+    search_direction = -energy.torque(reference_sd).flatten()
+
+    cache = {}
+    first = energy._trial_point(reference_sd, search_direction, 0.5, cache)
+    second = energy._trial_point(reference_sd, search_direction, 0.5, cache)
+
+    assert len(cache) == 1
+    assert first is second
+    assert np.allclose(first[1], energy(first[0]))
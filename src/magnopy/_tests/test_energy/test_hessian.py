@@ -0,0 +1,103 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import Convention, Energy, SpinHamiltonian, span_local_rfs
+from magnopy.examples import full_ham
+
+
+def _finite_difference_hessian(energy, spin_directions, h=1e-4):
+    x, y, z = span_local_rfs(directional_vectors=spin_directions, hybridize=False)
+
+    def E_0(step):
+        displacement = np.reshape(step, (-1, 2))
+        displacement = displacement[:, :1] * x + displacement[:, 1:] * y
+        theta = np.linalg.norm(displacement, axis=1)[:, np.newaxis]
+        axis = np.divide(
+            displacement,
+            theta,
+            out=np.zeros(displacement.shape),
+            where=theta > 0,
+        )
+        return energy.E_0(spin_directions=np.cos(theta) * z + np.sin(theta) * axis)
+
+    N = 2 * len(spin_directions)
+    result = np.zeros((N, N))
+    for i in range(N):
+        for j in range(N):
+            e_i = np.zeros(N)
+            e_j = np.zeros(N)
+            e_i[i] = h
+            e_j[j] = h
+            result[i, j] = (
+                E_0(e_i + e_j) - E_0(e_i - e_j) - E_0(-e_i + e_j) + E_0(-e_i - e_j)
+            ) / (4 * h**2)
+    return result
+
+
+@pytest.mark.parametrize("M", [4, 5])
+def test_hessian(M):
+    energy = Energy(spinham=full_ham(M=M))
+    spin_directions = np.random.default_rng(M).normal(size=(M, 3))
+    spin_directions /= np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+
+    hessian = energy.hessian(spin_directions=spin_directions)
+
+    assert hessian.shape == (2 * M, 2 * M)
+    assert np.allclose(hessian, hessian.T)
+    assert np.allclose(
+        hessian,
+        _finite_difference_hessian(energy, spin_directions),
+        rtol=1e-5,
+        atol=1e-5 * np.abs(hessian).max(),
+    )
+
+
+def test_sparse_hessian():
+    pytest.importorskip("scipy")
+
+    energy = Energy(spinham=full_ham(M=5))
+    spin_directions = np.random.default_rng(0).normal(size=(5, 3))
+
+    dense = energy.hessian(spin_directions=spin_directions, sparse=False)
+    sparse = energy.hessian(spin_directions=spin_directions, sparse=True)
+
+    assert np.allclose(sparse.toarray(), dense)
+
+
+def test_is_stable():
+    convention = Convention(
+        multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
+    )
+    atoms = dict(names=["Fe"], spins=[2.5], positions=[[0, 0, 0]])
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=convention)
+    spinham.add(
+        nus=[(1, 0, 0)], alphas=[0, 0], parameter=-np.eye(3), populate_equivalent=True
+    )
+    spinham.add(nus=[(0, 0, 0)], alphas=[0, 0], parameter=np.diag([0, 0, -0.5]))
+
+    energy = Energy(spinham=spinham)
+
+    # Easy axis: minimum along z, maximum in the xy plane
+    assert energy.is_stable(spin_directions=[[0, 0, 1]])
+    assert energy.is_stable(spin_directions=[[0, 0, -1]])
+    assert not energy.is_stable(spin_directions=[[1, 0, 0]])
@@ -26,7 +26,9 @@ from magnopy import SpinHamiltonian, Convention, Energy
     "on_site,sd",
     [[[-0.5, 0, 0], [1, 0, 0]], [[0, -0.5, 0], [0, 1, 0]], [[0, 0, -0.5], [0, 0, 1]]],
 )
-def test_fm(on_site, sd):
+@pytest.mark.parametrize("optimizer", ["bfgs", "lbfgs", "trust-newton"])
+@pytest.mark.parametrize("tangent_space", [False, True])
+def test_fm(on_site, sd, optimizer, tangent_space):
     convention = Convention(
         multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
     )
@@ -55,7 +57,9 @@ def test_fm(on_site, sd):
 
     energy = Energy(spinham=spinham)
 
-    sd_opt = energy.optimize(quiet=True)
+    sd_opt = energy.optimize(
+        quiet=True, optimizer=optimizer, tangent_space=tangent_space
+    )
 
     assert np.allclose(sd_opt, sd, atol=1e-4) or np.allclose(
         sd_opt, -np.array(sd), atol=1e-4
@@ -66,7 +70,9 @@ def test_fm(on_site, sd):
     "on_site,sd",
     [[[-0.5, 0, 0], [1, 0, 0]], [[0, -0.5, 0], [0, 1, 0]], [[0, 0, -0.5], [0, 0, 1]]],
 )
-def test_afm(on_site, sd):
+@pytest.mark.parametrize("optimizer", ["bfgs", "lbfgs", "trust-newton"])
+@pytest.mark.parametrize("tangent_space", [False, True])
+def test_afm(on_site, sd, optimizer, tangent_space):
     convention = Convention(
         multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
     )
@@ -111,7 +117,9 @@ def test_afm(on_site, sd):
 
     energy = Energy(spinham=spinham)
 
-    sd_opt = energy.optimize(quiet=True)
+    sd_opt = energy.optimize(
+        quiet=True, optimizer=optimizer, tangent_space=tangent_space
+    )
 
     assert (
         np.allclose(sd_opt[0], sd, atol=1e-4)
@@ -120,3 +128,128 @@ def test_afm(on_site, sd):
         np.allclose(sd_opt[0], -np.array(sd), atol=1e-4)
         and np.allclose(sd_opt[1], sd, atol=1e-4)
     )
+
+
+@pytest.mark.parametrize(
+    "optimizer,history_length", [["newton", 10], ["lbfgs", 0], ["lbfgs", 2.5]]
+)
+def test_wrong_optimizer(optimizer, history_length):
+    convention = Convention(multiple_counting=True, spin_normalized=False, c21=1)
+    atoms = dict(names=["Fe"], spins=[2.5], positions=[[0, 0, 0]])
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=convention)
+    spinham.add(nus=[(0, 0, 0)], alphas=[0, 0], parameter=np.diag([0, 0, -1]))
+
+    energy = Energy(spinham=spinham)
+
+    with pytest.raises(ValueError):
+        energy.optimize(quiet=True, optimizer=optimizer, history_length=history_length)
+
+
+def test_trust_newton_quantum_correction():
+    convention = Convention(multiple_counting=True, spin_normalized=False, c21=1)
+    atoms = dict(names=["Fe"], spins=[2.5], positions=[[0, 0, 0]])
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=convention)
+    spinham.add(nus=[(0, 0, 0)], alphas=[0, 0], parameter=np.diag([0, 0, -1]))
+
+    energy = Energy(spinham=spinham)
+
+    with pytest.raises(ValueError):
+        energy.optimize(quiet=True, optimizer="trust-newton", quantum_correction=True)
+
+
+def test_trust_newton_rejected_steps(monkeypatch):
+    convention = Convention(multiple_counting=True, spin_normalized=False, c21=1)
+    atoms = dict(names=["Fe"], spins=[2.5], positions=[[0, 0, 0]])
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=convention)
+    spinham.add(nus=[(0, 0, 0)], alphas=[0, 0], parameter=np.diag([0, 0, -1]))
+
+    energy = Energy(spinham=spinham)
+
+    calls = dict(hessian=0, gradient=0, energy_and_torque=0)
+
+    def counted(name):
+        method = getattr(energy, name)
+
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for name in calls:
+        monkeypatch.setattr(energy, name, counted(name))
+
+    initial_sd = np.array([[1, 0, 0.05]]) / np.linalg.norm([1, 0, 0.05])
+
+    # Large trust region overshoots, thus some of the steps are rejected
+    steps = list(
+        energy._trust_newton(
+            initial_sd=initial_sd,
+            tolerance=np.array([1e-8, 1e-6]),
+            initial_radius=np.pi,
+        )
+    )
+
+    assert np.allclose(np.abs(steps[-1][1]), [[0, 0, 1]])
+    assert calls["energy_and_torque"] > len(steps) + 1
+    # Model of the energy is built only once per accepted point
+    assert calls["hessian"] == len(steps)
+    assert calls["gradient"] == 0
+
+
+def _isotropic_afm():
+    convention = Convention(
+        multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
+    )
+    atoms = dict(
+        names=["Fe1", "Fe2"],
+        spins=[2.5, 2.5],
+        positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+    )
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=convention)
+    spinham.add(
+        nus=[(0, 0, 0)], alphas=[0, 1], parameter=np.eye(3), populate_equivalent=True
+    )
+    spinham.add(
+        nus=[(-1, 0, 0)], alphas=[0, 1], parameter=np.eye(3), populate_equivalent=True
+    )
+
+    return spinham
+
+
+@pytest.mark.parametrize("number_processors", [1, 2])
+def test_optimize_multistart(number_processors):
+    energy = Energy(spinham=_isotropic_afm())
+
+    sd_opt, minima = energy.optimize_multistart(
+        n_starts=4, number_processors=number_processors, seed=42, quiet=True
+    )
+
+    # All states differ only by the global rotation
+    assert len(minima) == 1
+    energy_opt, sd_minimum, count = minima[0]
+    assert count == 4
+    assert np.allclose(sd_opt, sd_minimum)
+    assert np.allclose(sd_opt[0], -sd_opt[1], atol=1e-4)
+    assert np.isclose(energy_opt, energy.E_0(spin_directions=sd_opt))
+
+
+def test_optimize_multistart_seed():
+    energy = Energy(spinham=_isotropic_afm())
+
+    sd_serial, _ = energy.optimize_multistart(
+        n_starts=3, number_processors=1, seed=1, quiet=True
+    )
+    sd_parallel, _ = energy.optimize_multistart(
+        n_starts=3, number_processors=3, seed=1, quiet=True
+    )
+
+    assert np.allclose(sd_serial, sd_parallel)
+
+
+@pytest.mark.parametrize("n_starts", [0, -1, 2.5])
+def test_optimize_multistart_wrong_n_starts(n_starts):
+    energy = Energy(spinham=_isotropic_afm())
+
+    with pytest.raises(ValueError):
+        energy.optimize_multistart(n_starts=n_starts, quiet=True)
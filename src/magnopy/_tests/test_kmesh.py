@@ -0,0 +1,83 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, get_irreducible_kmesh, get_kmesh, make_supercell
+from magnopy.examples import cubic_ferro_nn, ivuzjo
+
+
+def test_get_kmesh():
+    kpoints = get_kmesh((3, 2, 4))
+
+    assert kpoints.shape == (24, 3)
+    assert len(np.unique(kpoints, axis=0)) == 24
+    assert np.allclose(kpoints[1], [0, 0, 0.25])
+    assert np.allclose(kpoints[-1], [2 / 3, 0.5, 0.75])
+
+
+@pytest.mark.parametrize("kmesh", [(1, 2), (1, 0, 1), (1, 2, "a")])
+def test_get_kmesh_wrong(kmesh):
+    with pytest.raises(ValueError):
+        get_kmesh(kmesh)
+
+
+def _antiferro():
+    spinham = make_supercell(spinham=cubic_ferro_nn(), supercell=(2, 2, 2))
+    spin_directions = [
+        [0, 0, (-1) ** int(round(2 * sum(position)))]
+        for position in spinham.magnetic_atoms.positions
+    ]
+    return spinham, spin_directions
+
+
+@pytest.mark.parametrize(
+    "spinham, spin_directions, kmesh",
+    [
+        (cubic_ferro_nn(), [[0, 0, 1]], (6, 6, 6)),
+        (cubic_ferro_nn(J_21=(0, 0, -0.3)), [[1, 1, 0]], (6, 5, 4)),
+        (*_antiferro(), (4, 4, 4)),
+        # Parameters have lower symmetry than the crystal
+        (ivuzjo(N=1), [[1, 0, 0]], (6, 6, 1)),
+    ],
+)
+def test_get_irreducible_kmesh(spinham, spin_directions, kmesh):
+    kpoints, weights, mapping = get_irreducible_kmesh(
+        spinham=spinham, spin_directions=spin_directions, kmesh=kmesh
+    )
+
+    full_kpoints = get_kmesh(kmesh)
+
+    assert len(kpoints) < len(full_kpoints)
+    assert weights.sum() == len(full_kpoints)
+    assert np.allclose(np.bincount(mapping), weights)
+
+    # Irreducible k-points are the points of the mesh
+    for k in kpoints:
+        assert np.any(np.all(np.isclose(full_kpoints, k), axis=1))
+
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions)
+    omegas = lswt.omega(k=kpoints, relative=True)
+
+    # Goldstone modes are not computed (NaN)
+    assert np.allclose(
+        omegas[mapping], lswt.omega(k=full_kpoints, relative=True), equal_nan=True
+    )
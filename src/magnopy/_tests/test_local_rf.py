@@ -25,7 +25,8 @@ from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import arrays as harrays
 
-from magnopy import span_local_rf
+from magnopy import span_local_rf, span_local_rfs
+from magnopy._energy import _rotate_sd
 
 
 def test_span_local_rf_along_z():
@@ -70,3 +71,65 @@ def test_span_local_rf(direction_vector):
         )
 
         assert np.allclose([x_a @ y_a, x_a @ z_a, y_a @ z_a], np.zeros(3))
+
+
+@given(
+    harrays(
+        np.float64,
+        (10, 3),
+        elements=st.floats(min_value=-1e8, max_value=1e8, allow_subnormal=False),
+    )
+)
+def test_span_local_rfs(directional_vectors):
+    # Add the poles and the vicinity of the poles
+    directional_vectors = np.concatenate(
+        (
+            directional_vectors,
+            [[0, 0, 1], [0, 0, -2], [1e-9, 0, 1], [0, 1e-9, -1], [1e-4, 0, -1]],
+        )
+    )
+
+    if np.isclose(directional_vectors, 0).all(axis=1).any():
+        with pytest.raises(ValueError):
+            span_local_rfs(directional_vectors)
+
+    else:
+        x_as, y_as, z_as = span_local_rfs(directional_vectors)
+
+        for i, direction_vector in enumerate(directional_vectors):
+            x_a, y_a, z_a = span_local_rf(direction_vector)
+            assert np.allclose(x_as[i], x_a)
+            assert np.allclose(y_as[i], y_a)
+            assert np.allclose(z_as[i], z_a)
+
+        assert np.allclose(np.cross(x_as, y_as), z_as)
+        assert np.allclose(np.linalg.norm(x_as, axis=1), 1)
+        assert np.allclose(np.einsum("ai,ai->a", x_as, z_as), 0)
+
+
+@pytest.mark.parametrize("directional_vectors", [[1, 0, 0], [[[1, 0, 0]]]])
+def test_span_local_rfs_wrong_shape(directional_vectors):
+    with pytest.raises(ValueError):
+        span_local_rfs(directional_vectors)
+
+
+def test_rotate_sd():
+    reference_sd = np.random.default_rng(0).normal(size=(5, 3))
+    rotation = np.random.default_rng(1).normal(size=15)
+    rotation[:3] = 0
+
+    directions = _rotate_sd(reference_sd=reference_sd, rotation=rotation)
+
+    assert np.allclose(directions[0], reference_sd[0])
+    for alpha in range(1, 5):
+        theta = np.linalg.norm(rotation[3 * alpha : 3 * alpha + 3])
+        axis = rotation[3 * alpha : 3 * alpha + 3] / theta
+        K = np.array(
+            [
+                [0, -axis[2], axis[1]],
+                [axis[2], 0, -axis[0]],
+                [-axis[1], axis[0], 0],
+            ]
+        )
+        R = np.eye(3) + np.sin(theta) * K + (1 - np.cos(theta)) * K @ K
+        assert np.allclose(directions[alpha], R @ reference_sd[alpha])
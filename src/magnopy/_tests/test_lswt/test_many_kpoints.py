@@ -0,0 +1,129 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, get_kmesh, make_supercell
+from magnopy.examples import cubic_ferro_nn, full_ham
+
+
+@pytest.fixture(scope="module")
+def lswt():
+    spinham = full_ham(M=4)
+    spin_directions = np.random.default_rng(42).normal(size=(spinham.M, 3))
+    return LSWT(spinham=spinham, spin_directions=spin_directions)
+
+
+def _reference_A(lswt, k, relative):
+    result = -np.diag(lswt.A1).astype(complex)
+    for nu in lswt.A2:
+        if relative:
+            phase = 2 * np.pi * (k @ nu)
+        else:
+            phase = k @ (nu @ lswt.cell)
+        result = result + lswt.A2[nu] * np.exp(1j * phase)
+    return result
+
+
+def _reference_B(lswt, k, relative):
+    result = np.zeros((lswt.M, lswt.M), dtype=complex)
+    for nu in lswt.B2:
+        if relative:
+            phase = 2 * np.pi * (k @ nu)
+        else:
+            phase = k @ (nu @ lswt.cell)
+        result = result + lswt.B2[nu] * np.exp(1j * phase)
+    return result
+
+
+@pytest.mark.parametrize("relative", [False, True])
+def test_A_B_many_kpoints(lswt, relative):
+    kpoints = np.random.default_rng(0).uniform(low=-2, high=2, size=(20, 3))
+
+    As = lswt.A(k=kpoints, relative=relative)
+    Bs = lswt.B(k=kpoints, relative=relative)
+
+    assert As.shape == (20, lswt.M, lswt.M)
+    assert Bs.shape == (20, lswt.M, lswt.M)
+
+    for i, k in enumerate(kpoints):
+        assert np.allclose(As[i], _reference_A(lswt, k, relative))
+        assert np.allclose(Bs[i], _reference_B(lswt, k, relative))
+        assert np.allclose(As[i], lswt.A(k=k, relative=relative))
+        assert np.allclose(Bs[i], lswt.B(k=k, relative=relative))
+
+
+@pytest.mark.parametrize("relative", [False, True])
+def test_GDM_many_kpoints(lswt, relative):
+    kpoints = np.random.default_rng(1).uniform(low=-2, high=2, size=(20, 3))
+    M = lswt.M
+
+    gdms = lswt.GDM(k=kpoints, relative=relative, units="Joule")
+
+    assert gdms.shape == (20, 2 * M, 2 * M)
+
+    for i, k in enumerate(kpoints):
+        gdm = lswt.GDM(k=k, relative=relative, units="Joule")
+        assert np.allclose(gdms[i], gdm)
+
+        A = lswt.A(k=k, relative=relative, units="Joule")
+        A_m = lswt.A(k=-k, relative=relative, units="Joule")
+        B = lswt.B(k=k, relative=relative, units="Joule")
+        assert np.allclose(gdm[:M, :M], A)
+        assert np.allclose(gdm[:M, M:], B)
+        assert np.allclose(gdm[M:, :M], np.conjugate(B).T)
+        assert np.allclose(gdm[M:, M:], np.conjugate(A_m))
+
+
+@pytest.mark.parametrize("grid", [(1, 1, 1), (2, 3, 4), (5, 4, 1)])
+def test_gdm_on_grid(lswt, grid):
+    gdms = lswt.gdm_on_grid(*grid, units="Joule")
+
+    assert gdms.shape == (np.prod(grid), 2 * lswt.M, 2 * lswt.M)
+    assert np.allclose(gdms, lswt.GDM(k=get_kmesh(grid), relative=True, units="Joule"))
+
+
+@pytest.mark.parametrize("grid", [(0, 1, 1), (2, -3, 4), (5, 4, 1.5)])
+def test_gdm_on_grid_wrong(lswt, grid):
+    with pytest.raises(ValueError):
+        lswt.gdm_on_grid(*grid)
+
+
+@pytest.mark.parametrize("k", [[1, 2], [[1, 2, 3, 4]], [[[0, 0, 0]]]])
+def test_wrong_kpoints_shape(lswt, k):
+    with pytest.raises(ValueError):
+        lswt.A(k=k)
+
+
+def test_energies_only():
+    spinham = make_supercell(spinham=cubic_ferro_nn(), supercell=(2, 1, 2))
+    lswt = LSWT(spinham=spinham, spin_directions=[[0, 0, 1]] * spinham.M)
+    kpoints = np.random.default_rng(2).uniform(low=-2, high=2, size=(10, 3))
+
+    omegas, deltas, G = lswt.diagonalize(k=kpoints)
+    omegas_only, deltas_only = lswt.diagonalize(k=kpoints, energies_only=True)
+
+    assert G.shape == (10, lswt.M, 2 * lswt.M)
+    assert not np.isnan(omegas).any()
+    assert np.allclose(omegas, omegas_only)
+    assert np.allclose(deltas, deltas_only)
+    assert np.allclose(lswt.omega(k=kpoints), omegas)
+    assert np.allclose(lswt.delta(k=kpoints), deltas)
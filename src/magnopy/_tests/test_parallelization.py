@@ -0,0 +1,226 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, dispersion_over_k, make_supercell, multiprocess_over_k
+import magnopy._parallelization as parallelization
+from magnopy._parallelization import (
+    _dispersion_over_k_chunks,
+    _get_k_layout,
+    _get_thread_layout,
+)
+from magnopy.examples import cubic_ferro_nn
+
+
+@pytest.fixture(scope="module")
+def lswt():
+    spinham = make_supercell(spinham=cubic_ferro_nn(), supercell=(2, 1, 2))
+    return LSWT(spinham=spinham, spin_directions=[[0, 0, 1]] * spinham.M)
+
+
+@pytest.mark.parametrize("backend", ["processes", "threads"])
+@pytest.mark.parametrize("number_processors", [1, 2])
+@pytest.mark.parametrize("relative", [False, True])
+def test_dispersion_over_k(lswt, number_processors, relative, backend):
+    kpoints = np.random.default_rng(0).uniform(low=-2, high=2, size=(37, 3))
+
+    omegas, deltas = dispersion_over_k(
+        lswt=lswt,
+        kpoints=kpoints,
+        relative=relative,
+        units="Joule",
+        number_processors=number_processors,
+        backend=backend,
+        number_threads=2,
+    )
+
+    assert omegas.shape == (37, lswt.M)
+    assert deltas.shape == (37,)
+    assert np.allclose(omegas, lswt.omega(k=kpoints, relative=relative, units="Joule"))
+    assert np.allclose(deltas, lswt.delta(k=kpoints, relative=relative, units="Joule"))
+
+
+@pytest.mark.parametrize("backend", ["processes", "threads"])
+def test_dispersion_over_k_no_kpoints(lswt, backend):
+    omegas, deltas = dispersion_over_k(
+        lswt=lswt, kpoints=np.zeros((0, 3)), number_processors=2, backend=backend
+    )
+
+    assert omegas.shape == (0, lswt.M)
+    assert deltas.shape == (0,)
+
+
+def test_dispersion_over_k_wrong_backend(lswt):
+    with pytest.raises(ValueError):
+        dispersion_over_k(lswt=lswt, kpoints=np.zeros((1, 3)), backend="mpi")
+
+
+@pytest.mark.parametrize("number_processors", [1, 2])
+def test_multiprocess_over_k(lswt, number_processors):
+    kpoints = np.random.default_rng(1).uniform(low=-2, high=2, size=(5, 3))
+
+    results = multiprocess_over_k(
+        kpoints=kpoints, function=lswt.omega, number_processors=number_processors
+    )
+
+    assert len(results) == 5
+    for k, omegas in zip(kpoints, results):
+        assert np.allclose(omegas, lswt.omega(k=k))
+
+
+@pytest.mark.parametrize(
+    "number_processors, number_threads, layout",
+    [(1, 8, (1, 8)), (2, 8, (2, 4)), (3, 8, (3, 2)), (8, 2, (2, 1)), (None, 4, (4, 1))],
+)
+def test_get_thread_layout(number_processors, number_threads, layout):
+    assert (
+        _get_thread_layout(
+            number_processors=number_processors, number_threads=number_threads
+        )
+        == layout
+    )
+
+
+@pytest.mark.parametrize("number_processors, number_threads", [(0, 1), (1, 0)])
+def test_get_thread_layout_wrong(number_processors, number_threads):
+    with pytest.raises(ValueError):
+        _get_thread_layout(
+            number_processors=number_processors, number_threads=number_threads
+        )
+
+
+@pytest.mark.parametrize("backend", ["processes", "threads"])
+@pytest.mark.parametrize("number_processors", [1, 2])
+@pytest.mark.parametrize("chunk_size", [None, 1, 6, 100])
+def test_dispersion_over_k_chunks(
+    lswt, tmp_path, backend, number_processors, chunk_size
+):
+    kpoints = np.random.default_rng(2).uniform(low=-2, high=2, size=(23, 3))
+
+    omegas = np.lib.format.open_memmap(
+        tmp_path / "OMEGAS.npy", mode="w+", dtype=complex, shape=(23, lswt.M)
+    )
+    deltas = np.lib.format.open_memmap(
+        tmp_path / "DELTAS.npy", mode="w+", dtype=complex, shape=(23,)
+    )
+    G = np.lib.format.open_memmap(
+        tmp_path / "G.npy", mode="w+", dtype=complex, shape=(23, lswt.M, 2 * lswt.M)
+    )
+
+    chunks = list(
+        _dispersion_over_k_chunks(
+            lswt=lswt,
+            kpoints=kpoints,
+            omegas=omegas,
+            deltas=deltas,
+            G=G,
+            chunk_size=chunk_size,
+            number_processors=number_processors,
+            backend=backend,
+        )
+    )
+    omegas.flush()
+    deltas.flush()
+    G.flush()
+
+    assert chunks[0][0] == 0 and chunks[-1][1] == 23
+    for (_, stop), (start, _) in zip(chunks[:-1], chunks[1:]):
+        assert stop == start
+
+    reference = lswt.diagonalize(k=kpoints)
+    assert np.allclose(np.load(tmp_path / "OMEGAS.npy"), reference[0])
+    assert np.allclose(np.load(tmp_path / "DELTAS.npy"), reference[1])
+    assert np.allclose(np.load(tmp_path / "G.npy"), reference[2])
+
+
+@pytest.mark.parametrize(
+    "N, chunk_size, number_processors, number_threads, layout",
+    [
+        (1, None, 8, 8, (1, 8)),
+        (4, None, 8, 8, (4, 2)),
+        (4, 1, 2, 8, (1, 8)),
+        (100, None, 2, 8, (2, 4)),
+        (100, None, 8, 4, (4, 1)),
+        (0, None, 2, 8, (1, 8)),
+    ],
+)
+def test_get_k_layout(N, chunk_size, number_processors, number_threads, layout):
+    chunks, *result = _get_k_layout(
+        N=N,
+        M=4,
+        chunk_size=chunk_size,
+        number_processors=number_processors,
+        number_threads=number_threads,
+    )
+
+    assert tuple(result) == layout
+
+    blocks = [block for chunk in chunks for block in chunk]
+    assert [stop for _, stop in blocks[:-1]] == [start for start, _ in blocks[1:]]
+    if N > 0:
+        assert blocks[0][0] == 0 and blocks[-1][1] == N
+
+
+@pytest.mark.parametrize(
+    "N, number_processors, number_threads", [(1, 8, 8), (4, 8, 8), (37, 4, 2)]
+)
+def test_dispersion_over_k_chunks_layout(
+    lswt, monkeypatch, N, number_processors, number_threads
+):
+    used = {"workers": 1, "blas_threads": []}
+
+    class RecordingExecutor(parallelization.ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            used["workers"] = max_workers
+            super().__init__(max_workers)
+
+    limit_blas_threads = parallelization._limit_blas_threads
+
+    def recording_limit(blas_threads):
+        used["blas_threads"].append(blas_threads)
+        return limit_blas_threads(blas_threads)
+
+    monkeypatch.setattr(parallelization, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(parallelization, "_limit_blas_threads", recording_limit)
+
+    kpoints = np.random.default_rng(3).uniform(low=-2, high=2, size=(N, 3))
+    layout = _get_k_layout(
+        N=N,
+        M=lswt.M,
+        number_processors=number_processors,
+        number_threads=number_threads,
+    )
+
+    list(
+        _dispersion_over_k_chunks(
+            lswt=lswt,
+            kpoints=kpoints,
+            omegas=np.empty((N, lswt.M), dtype=complex),
+            deltas=np.empty(N, dtype=complex),
+            number_processors=number_processors,
+            backend="threads",
+            number_threads=number_threads,
+        )
+    )
+
+    assert (used["workers"], used["blas_threads"]) == (layout[1], [layout[2]])
+    assert used["workers"] * used["blas_threads"][0] <= number_threads
@@ -0,0 +1,122 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy._parameters._equivalent_sets import (
+    _get_equivalent,
+    _get_equivalent_block,
+    _representatives,
+)
+from magnopy._parameters._interaction_parameters import (
+    _get_specs,
+    _InteractionParameters,
+)
+
+# Atoms and unit cells of the spin operators, all possible coincidences
+SITES = [
+    [(0, (0, 0, 0)), (1, (1, 0, 0))],
+    [(0, (0, 0, 0)), (0, (0, 0, 0)), (1, (0, 1, 0))],
+    [(0, (0, 0, 0)), (1, (0, 1, 0)), (0, (0, 0, 0))],
+    [(0, (0, 0, 0)), (1, (0, 1, 0)), (1, (0, 1, 0))],
+    [(0, (0, 0, 0)), (1, (0, 1, 0)), (0, (-1, 0, 0))],
+    [(2, (0, 0, 0)), (2, (0, 0, 0)), (2, (0, 0, 0)), (1, (0, 0, 1))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (2, (0, 0, 0)), (2, (0, 0, 0))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (1, (0, 0, 1)), (1, (0, 0, 1))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (2, (0, 0, 0)), (1, (0, 0, 1))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (1, (0, 0, 1)), (2, (0, 0, 0))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (1, (0, 0, 1)), (0, (1, 1, 0))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (0, (1, 1, 0)), (1, (0, 0, 1))],
+    [(2, (0, 0, 0)), (2, (0, 0, 0)), (1, (0, 0, 1)), (0, (1, 1, 0))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (0, (1, 1, 0)), (0, (1, 1, 0))],
+    [(2, (0, 0, 0)), (1, (0, 0, 1)), (0, (1, 1, 0)), (2, (-1, 0, 0))],
+]
+
+
+# Spin vectors are the same in all unit cells
+SPINS = np.random.default_rng(0).normal(size=(3, 3))
+
+
+def _energy(alphas, parameter):
+    n = len(alphas)
+    return np.einsum(
+        "ijkl"[:n] + "," + ",".join("ijkl"[:n]),
+        parameter,
+        *[SPINS[alpha] for alpha in alphas],
+    )
+
+
+@pytest.mark.parametrize("sites", SITES)
+def test_equivalent_sets(sites):
+    alphas = tuple([alpha for alpha, _ in sites])
+    nus = tuple([nu for _, nu in sites])
+    n, p_n, nus, alphas = _get_specs(nus=nus, alphas=alphas)
+    parameter = np.random.default_rng(n).normal(size=(3,) * n)
+
+    equivalent_parameters = _get_equivalent(
+        n=n, p_n=p_n, nus=nus, alphas=alphas, parameter=parameter
+    )
+
+    # All versions are different and describe the same interaction
+    assert len(set([(nus, alphas) for nus, alphas, _ in equivalent_parameters])) == len(
+        equivalent_parameters
+    )
+    for eq_nus, eq_alphas, eq_parameter in equivalent_parameters:
+        assert _get_specs(nus=((0, 0, 0),) + eq_nus, alphas=eq_alphas)[:2] == (n, p_n)
+        assert np.allclose(_energy(alphas, parameter), _energy(eq_alphas, eq_parameter))
+
+    # Same versions for the whole block
+    parameters = _InteractionParameters()
+    parameters.add(specs=(n, p_n, nus, alphas), parameter=parameter)
+    block = parameters._get_blocks(n=n, p_n=p_n)[0]
+
+    keys, tensors = _get_equivalent_block(block)
+    assert keys.shape[:2] == (1, len(equivalent_parameters))
+
+    versions = {tuple(key.tolist()): tensor for key, tensor in zip(keys[0], tensors[0])}
+    for eq_nus, eq_alphas, eq_parameter in equivalent_parameters:
+        key = tuple([i for nu in eq_nus for i in nu]) + eq_alphas
+        assert np.allclose(versions[key], eq_parameter)
+
+    first_nus, first_alphas, _ = equivalent_parameters[0]
+    assert tuple(keys[0, _representatives(keys)[0]].tolist()) == tuple(
+        [i for nu in first_nus for i in nu]
+    ) + tuple(first_alphas)
+
+
+@pytest.mark.parametrize(
+    "n, p_n, nus, alphas",
+    [
+        (2, 2, ((0, 0, 0),), (0, 0)),
+        (3, 2, ((1, 0, 0), (0, 1, 0)), (0, 0, 0)),
+        (3, 3, ((0, 0, 0), (0, 1, 0)), (0, 0, 1)),
+        (4, 3, ((0, 0, 0), (0, 0, 0), (1, 0, 0)), (0, 0, 1, 1)),
+    ],
+)
+def test_equivalent_sets_wrong_indices(n, p_n, nus, alphas):
+    with pytest.raises(ValueError):
+        _get_equivalent(n=n, p_n=p_n, nus=nus, alphas=alphas)
+
+    parameters = _InteractionParameters()
+    parameters.add(specs=(n, p_n, nus, alphas), parameter=np.zeros((3,) * n))
+
+    with pytest.raises(ValueError):
+        _get_equivalent_block(parameters._get_blocks(n=n, p_n=p_n)[0])
@@ -23,9 +23,14 @@ from hypothesis import given
 from hypothesis import strategies as st
 from copy import deepcopy
 
+import magnopy._parameters._interaction_parameters as interaction_parameters
 from magnopy._parameters._interaction_parameters import (
     _get_specs,
+    _group_starts,
     _InteractionParameters,
+    _pack_keys,
+    _sorting_order,
+    _specs_key,
 )
 
 ROLL = [
@@ -855,18 +860,18 @@ MULTIPLES_MULTIPLES = {
 def test_interaction_parameters_slices_multiples(wtd, n, p_n, slices):
     if n is not None and p_n is not None:
         if wtd == "add":
-            alphas = tuple([MULTIPLES_MULTIPLES[(n, p_n)] * _ for _ in ROLL[n - 1][0]])
+            nus = ROLL[n - 1][0]
+            alphas = tuple([MULTIPLES_MULTIPLES[(n, p_n)] * _ for _ in ROLL[n - 1][1]])
 
-            nus = ROLL[n - 1][1]
             MULTIPLES_MULTIPLES[(n, p_n)] += 1
             PARAMETERS_MULTIPLES.add(
-                specs=(n, p_n, alphas, nus), parameter=np.zeros((3,) * n)
+                specs=(n, p_n, nus, alphas), parameter=np.zeros((3,) * n)
             )
         elif wtd == "remove":
-            alphas = tuple([MULTIPLES_MULTIPLES[(n, p_n)] * _ for _ in ROLL[n - 1][0]])
-            nus = ROLL[n - 1][1]
+            nus = ROLL[n - 1][0]
+            alphas = tuple([MULTIPLES_MULTIPLES[(n, p_n)] * _ for _ in ROLL[n - 1][1]])
             MULTIPLES_MULTIPLES[(n, p_n)] = max(1, MULTIPLES_MULTIPLES[(n, p_n)] - 1)
-            PARAMETERS_MULTIPLES.remove(specs=(n, p_n, alphas, nus))
+            PARAMETERS_MULTIPLES.remove(specs=(n, p_n, nus, alphas))
 
     for key in slices:
         assert PARAMETERS_MULTIPLES._slices[key] == slices[key]
@@ -894,12 +899,12 @@ def test_interaction_parameters_slices_random(data):
         alphas = tuple([factors[n] * (_ + 1) for _ in range(n)])
 
         if wtd == 0:
-            parameters.add(specs=(n, 1, alphas, nus), parameter=np.zeros((3,) * n))
+            parameters.add(specs=(n, 1, nus, alphas), parameter=np.zeros((3,) * n))
             delta = 1
             factors[n] += 1
         elif wtd == 1:
             prev_len = len(parameters._container)
-            parameters.remove(specs=(n, 1, alphas, nus))
+            parameters.remove(specs=(n, 1, nus, alphas))
 
             delta = len(parameters._container) - prev_len
 
@@ -956,3 +961,258 @@ def test_add():
 
     assert p._container[0][0] == (1, 1, (), (1,))
     assert p._container[1][0] == (2, 1, ((0, 0, 0),), (0, 0))
+
+
+@given(
+    data=st.lists(
+        elements=st.tuples(
+            st.integers(min_value=1, max_value=4),
+            st.integers(min_value=0, max_value=3),
+            st.floats(min_value=-10, max_value=10),
+        ),
+        min_size=0,
+        max_size=100,
+    ),
+    split=st.integers(min_value=0, max_value=100),
+)
+@pytest.mark.parametrize("when_present", ["replace", "sum", "mean", "skip"])
+def test_add_many(data, split, when_present):
+    specs_list = []
+    values = []
+    for n, alpha, value in data:
+        specs_list.append((n, 1, ((0, 0, 0),) * (n - 1), (alpha,) * n))
+        values.append(np.full((3,) * n, value))
+
+    # Part of the parameters is present in the container before
+    reference = _InteractionParameters()
+    parameters = _InteractionParameters()
+    for specs, value in zip(specs_list[:split], values[:split]):
+        reference.add(specs=specs, parameter=value, when_present=when_present)
+        parameters.add(specs=specs, parameter=value, when_present=when_present)
+
+    for specs, value in zip(specs_list[split:], values[split:]):
+        reference.add(specs=specs, parameter=value, when_present=when_present)
+    parameters.add_many(
+        specs_list=specs_list[split:],
+        parameters=values[split:],
+        when_present=when_present,
+    )
+
+    assert parameters._slices == reference._slices
+    assert len(parameters) == len(reference)
+    for (specs, value), (ref_specs, ref_value) in zip(
+        parameters._container, reference._container
+    ):
+        assert specs == ref_specs
+        assert np.allclose(value, ref_value)
+
+
+@pytest.mark.parametrize(
+    "when_present", ["raise error", "replace", "sum", "mean", "weighted average", "skip"]
+)
+def test_add_many_unsupported(when_present):
+    parameters = _InteractionParameters()
+
+    with pytest.raises(ValueError):
+        parameters.add_many(
+            specs_list=[(1, 1, (), (0,)), (5, 1, (), (0,) * 5)],
+            parameters=[np.ones(3), np.ones((3,) * 5)],
+            when_present=when_present,
+            weights=(1, 1),
+        )
+
+    # Container is not changed
+    assert len(parameters) == 0
+
+
+def test_remove_and_add_again():
+    parameters = _InteractionParameters()
+    specs_list = [(2, 1, ((0, 0, 0),), (i, i)) for i in range(5)]
+    parameters.add_many(specs_list=specs_list, parameters=np.ones((5, 3, 3)))
+
+    parameters.remove(specs_list[1])
+    parameters.remove(specs_list[3])
+    parameters.remove(specs_list[3])
+
+    assert len(parameters) == 3
+    assert specs_list[1] not in parameters
+    assert specs_list[2] in parameters
+
+    parameters.add(specs=specs_list[1], parameter=2 * np.ones((3, 3)))
+    with pytest.raises(ValueError):
+        parameters.add_many(specs_list=[specs_list[2]], parameters=np.ones((1, 3, 3)))
+    parameters.add_many(specs_list=[specs_list[3]], parameters=3 * np.ones((1, 3, 3)))
+
+    assert len(parameters) == 5
+    assert [specs for specs, _ in parameters._container] == specs_list
+    assert [value[0, 0] for _, value in parameters._container] == [1, 2, 1, 3, 1]
+
+
+def test_add_many_raise_error():
+    parameters = _InteractionParameters()
+    parameters.add(specs=(1, 1, (), (0,)), parameter=np.ones(3))
+
+    with pytest.raises(ValueError):
+        parameters.add_many(
+            specs_list=[(1, 1, (), (1,)), (1, 1, (), (0,))],
+            parameters=np.zeros((2, 3)),
+        )
+
+    with pytest.raises(ValueError):
+        parameters.add_many(
+            specs_list=[(1, 1, (), (1,)), (1, 1, (), (1,))],
+            parameters=np.zeros((2, 3)),
+        )
+
+    with pytest.raises(ValueError):
+        parameters.add_many(specs_list=[(1, 1, (), (1,))], parameters=np.zeros((2, 3)))
+
+    # Container is not changed
+    assert len(parameters) == 1
+    assert np.allclose(parameters._container[0][1], np.ones(3))
+
+    parameters.add_many(
+        specs_list=[(1, 1, (), (2,)), (1, 1, (), (1,))], parameters=np.zeros((2, 3))
+    )
+    assert [specs for specs, _ in parameters._container] == [
+        (1, 1, (), (0,)),
+        (1, 1, (), (1,)),
+        (1, 1, (), (2,)),
+    ]
+
+
+def test_add_sums_common():
+    p1 = _InteractionParameters()
+    p2 = _InteractionParameters()
+
+    p1.add(specs=(2, 2, ((1, 0, 0),), (0, 1)), parameter=np.ones((3, 3)))
+    p1.add(specs=(2, 2, ((0, 0, 0),), (0, 1)), parameter=np.ones((3, 3)))
+    p2.add(specs=(2, 2, ((1, 0, 0),), (0, 1)), parameter=2 * np.ones((3, 3)))
+
+    p = p1 - p2
+
+    assert len(p) == 2
+    assert p._container[0][0] == (2, 2, ((0, 0, 0),), (0, 1))
+    assert np.allclose(p._container[0][1], np.ones((3, 3)))
+    assert p._container[1][0] == (2, 2, ((1, 0, 0),), (0, 1))
+    assert np.allclose(p._container[1][1], -np.ones((3, 3)))
+
+
+def test_map_alphas():
+    parameters = _InteractionParameters()
+    parameters.add(specs=(1, 1, (), (0,)), parameter=np.zeros(3))
+    parameters.add(specs=(1, 1, (), (2,)), parameter=np.ones(3))
+
+    parameters._map_alphas(mapping=[1, 5, 0])
+
+    assert [specs for specs, _ in parameters._container] == [
+        (1, 1, (), (0,)),
+        (1, 1, (), (1,)),
+    ]
+    assert np.allclose(parameters._container[0][1], np.ones(3))
+
+
+@given(
+    data=st.lists(
+        elements=st.tuples(
+            st.integers(min_value=-(2**40), max_value=2**40),
+            st.integers(min_value=-5, max_value=5),
+            st.integers(min_value=0, max_value=2**30),
+        ),
+        min_size=1,
+        max_size=50,
+    )
+)
+def test_sorting_order(data):
+    keys = np.array(data, dtype=np.int64)
+
+    order = _sorting_order(keys)
+
+    assert [tuple(row) for row in keys[order].tolist()] == sorted(
+        [tuple(row) for row in keys.tolist()]
+    )
+
+    starts = _group_starts(keys[order])
+    assert len(starts) == len(set(data))
+
+
+def test_pack_keys_overflow():
+    keys = np.array([[-(2**62), 0, 0], [2**62, 1, 1]], dtype=np.int64)
+
+    assert _pack_keys(keys) is None
+    assert np.allclose(_sorting_order(keys), [0, 1])
+    assert np.allclose(_sorting_order(keys[::-1]), [1, 0])
+
+
+def test_specs_key():
+    parameters = _InteractionParameters()
+    specs = (3, 3, ((1, -2, 0), (0, 0, 5)), (0, 1, 2))
+    parameters.add(specs=specs, parameter=np.ones((3, 3, 3)))
+
+    block = parameters._get_blocks(n=3, p_n=3)[0]
+
+    assert (_specs_key(specs) == block.keys()[0]).all()
+    assert block.find(specs) == 0
+    assert block.find((3, 3, ((1, -2, 0), (0, 0, 4)), (0, 1, 2))) == -1
+    assert specs in parameters
+
+
+@pytest.mark.parametrize("large", [False, True])
+def test_find_remove_and_add(large):
+    # Large unit cell indices do not fit into the packed keys
+    shift = 2**61 if large else 0
+    specs_list = [
+        (2, 1, ((i * shift + i, j, 0),), (0, 0)) for i in range(-3, 4) for j in range(3)
+    ]
+
+    parameters = _InteractionParameters()
+    parameters.add_many(specs_list=specs_list[::2], parameters=np.ones((11, 3, 3)))
+    for specs in specs_list[1::2]:
+        parameters.add(specs=specs, parameter=np.ones((3, 3)))
+
+    block = parameters._get_blocks(n=2, p_n=1)[0]
+    assert (block.index()[0] is None) == large
+    assert [specs for specs, _ in parameters._container] == sorted(specs_list)
+    assert [block.find(specs) for specs in sorted(specs_list)] == list(range(21))
+    assert block.find((2, 1, ((5, 0, 0),), (0, 0))) == -1
+
+    for specs in specs_list[::3]:
+        parameters.remove(specs)
+        assert specs not in parameters
+
+    assert [specs for specs, _ in parameters._container] == sorted(
+        set(specs_list) - set(specs_list[::3])
+    )
+
+
+def test_no_index_rebuilds(monkeypatch):
+    specs_list = [
+        (2, 2, ((i, j, 0),), (0, 1)) for i in range(200) for j in range(200)
+    ]
+    parameters = _InteractionParameters()
+    parameters.add_many(specs_list=specs_list, parameters=np.ones((40000, 3, 3)))
+    parameters._slices
+
+    calls = []
+
+    def counted(keys):
+        calls.append(len(keys))
+        return get_packing(keys)
+
+    get_packing = interaction_parameters._get_packing
+    monkeypatch.setattr(interaction_parameters, "_get_packing", counted)
+
+    # Index of the block is updated in place by the removals and additions, that
+    # are interleaved with the reads
+    for specs in specs_list[::100]:
+        parameters.remove(specs)
+        parameters._slices
+        assert specs not in parameters
+    for specs in specs_list[::100]:
+        parameters.add(specs=specs, parameter=np.ones((3, 3)))
+        parameters._slices
+        assert specs in parameters
+
+    assert calls == []
+    assert len(parameters) == 40000
+    assert [specs for specs, _ in parameters._container] == specs_list
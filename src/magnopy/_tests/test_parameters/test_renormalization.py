@@ -0,0 +1,145 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+#
+# Copyright (C) 2023 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you  can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the  Free Software
+# Foundation,  either  version 3  of the License,  or (at your option) any later
+# version.
+#
+# This program is distributed in the  hope  that it will be useful,  but WITHOUT
+# ANY WARRANTY;  without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the  GNU General Public License  along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+# ================================ END LICENSE =================================
+
+import numpy as np
+import pytest
+
+from magnopy import Convention
+from magnopy._parameters._interaction_parameters import _InteractionParameters
+from magnopy._parameters._renormalization import _get_p_n, _renormalized_parameters
+
+CONVENTION = Convention(
+    multiple_counting=True,
+    spin_normalized=False,
+    c1=1,
+    c21=1,
+    c22=-0.5,
+    c31=1,
+    c32=1,
+    c33=1,
+    c41=1,
+    c42=1,
+    c43=1,
+    c44=1,
+    c45=2,
+)
+
+
+def _as_dict(parameters):
+    return {specs: parameter for specs, parameter in parameters._container}
+
+
+@pytest.mark.parametrize(
+    "nus, alphas, p_n",
+    [
+        ([(0, 0, 0)], [0], 1),
+        ([(0, 0, 0), (0, 0, 0)], [1, 1], 1),
+        ([(0, 0, 0), (1, 0, 0)], [1, 1], 2),
+        ([(0, 0, 0), (1, 0, 0), (0, 0, 0)], [1, 1, 1], 2),
+        ([(0, 0, 0), (1, 0, 0), (0, 0, 0)], [1, 1, 2], 3),
+        ([(0, 0, 0)] * 4, [0, 0, 0, 0], 1),
+        ([(0, 0, 0)] * 4, [0, 0, 1, 0], 2),
+        ([(0, 0, 0)] * 4, [0, 1, 1, 0], 3),
+        ([(0, 0, 0)] * 4, [0, 1, 2, 0], 4),
+        ([(0, 0, 0)] * 4, [0, 1, 2, 3], 5),
+    ],
+)
+def test_get_p_n(nus, alphas, p_n):
+    assert _get_p_n(nus=np.array([nus]), alphas=np.array([alphas]))[0] == p_n
+
+
+def test_renormalization_22():
+    spins = np.random.default_rng(0).normal(size=(2, 3))
+    J = np.random.default_rng(1).normal(size=(3, 3))
+
+    parameters = _InteractionParameters()
+    parameters.add(specs=(2, 2, ((1, 0, 0),), (0, 1)), parameter=J)
+
+    result = _as_dict(
+        _renormalized_parameters(
+            parameters=parameters,
+            convention=CONVENTION,
+            spin_directions=spins,
+            spin_values=np.linalg.norm(spins, axis=1),
+        )
+    )
+
+    assert len(result) == 3
+    assert np.allclose(result[(1, 1, (), (0,))], -0.5 * J @ spins[1])
+    assert np.allclose(result[(1, 1, (), (1,))], -0.5 * spins[0] @ J)
+    assert np.allclose(result[(2, 2, ((1, 0, 0),), (0, 1))], -0.5 * J)
+
+
+def test_renormalization_45():
+    spins = np.random.default_rng(2).normal(size=(4, 3))
+    tensor = np.random.default_rng(3).normal(size=(3, 3, 3, 3))
+    nu_2, nu_3, nu_4 = (1, 0, 0), (0, 1, 0), (0, 0, 1)
+
+    parameters = _InteractionParameters()
+    parameters.add(specs=(4, 5, (nu_2, nu_3, nu_4), (0, 1, 2, 3)), parameter=tensor)
+
+    result = _as_dict(
+        _renormalized_parameters(
+            parameters=parameters,
+            convention=CONVENTION,
+            spin_directions=spins,
+            spin_values=np.linalg.norm(spins, axis=1),
+        )
+    )
+
+    # 4 one-spin, 6 two-spin, 4 three-spin and the four-spin terms
+    assert len(result) == 15
+    assert np.allclose(
+        result[(1, 1, (), (2,))],
+        2 * np.einsum("kjil,j,k,l->i", tensor, spins[1], spins[0], spins[3]),
+    )
+    assert np.allclose(
+        result[(2, 2, ((-1, 0, 1),), (1, 3))],
+        2 * np.einsum("likj,k,l->ij", tensor, spins[2], spins[0]),
+    )
+    assert np.allclose(
+        result[(3, 3, ((1, 0, -1), (0, 1, -1)), (3, 1, 2))],
+        2 * np.einsum("ljki,l->ijk", tensor, spins[0]),
+    )
+    assert np.allclose(result[(4, 5, (nu_2, nu_3, nu_4), (0, 1, 2, 3))], 2 * tensor)
+
+
+def test_renormalization_sums_corrections():
+    spins = np.random.default_rng(4).normal(size=(1, 3))
+    J = np.random.default_rng(5).normal(size=(3, 3))
+
+    parameters = _InteractionParameters()
+    parameters.add(specs=(2, 1, ((0, 0, 0),), (0, 0)), parameter=J)
+    parameters.add(specs=(2, 2, ((1, 0, 0),), (0, 0)), parameter=J)
+
+    result = _as_dict(
+        _renormalized_parameters(
+            parameters=parameters,
+            convention=CONVENTION,
+            spin_directions=spins,
+            spin_values=np.linalg.norm(spins, axis=1),
+        )
+    )
+
+    assert len(result) == 3
+    assert np.allclose(
+        result[(1, 1, (), (0,))],
+        J @ spins[0] + spins[0] @ J - 0.5 * (J @ spins[0] + spins[0] @ J),
+    )
@@ -133,3 +133,37 @@ def test_E_cut(lattice_variation, E_cut):
     spinham.add_dipole_dipole(
         E_cut=E_cut, alphas=[i for i in range(len(spinham.atoms.names))]
     )
+
+
+def test_no_multiple_counting():
+    cell = np.eye(3)
+    atoms = dict(
+        names=["Cr1", "Cr2"],
+        spins=[3 / 2, 3 / 2],
+        positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+        g_factors=[2, 2],
+    )
+
+    spinham = SpinHamiltonian(
+        cell=cell,
+        atoms=atoms,
+        convention=Convention(multiple_counting=True, spin_normalized=False, c22=1),
+    )
+    spinham_single = SpinHamiltonian(
+        cell=cell,
+        atoms=atoms,
+        convention=Convention(multiple_counting=False, spin_normalized=False, c22=1),
+    )
+
+    spinham.add_dipole_dipole(R_cut=2)
+    spinham_single.add_dipole_dipole(R_cut=2)
+
+    assert 2 * len(spinham_single.p22) == len(spinham.p22)
+
+    spinham_single.convention = spinham.convention
+
+    for (nus, alphas, parameter), (ref_nus, ref_alphas, ref_parameter) in zip(
+        spinham_single.p22, spinham.p22
+    ):
+        assert (nus, alphas) == (ref_nus, ref_alphas)
+        assert np.allclose(parameter, ref_parameter)
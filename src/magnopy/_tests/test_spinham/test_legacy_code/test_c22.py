@@ -33,6 +33,8 @@ ARRAY = harrays(
     (3, 3),
     elements=st.floats(min_value=-MAX_MODULUS, max_value=MAX_MODULUS),
 )
+# Indices of the unit cells are stored as 64-bit integers
+INDEX = st.integers(min_value=-(2**62) + 1, max_value=2**62 - 1)
 RANDOM_UC = harrays(int, (4, 3), elements=st.integers(min_value=-1000, max_value=1000))
 
 
@@ -76,7 +78,7 @@ def get_spinham(natoms=9, for_supercell=False):
 @given(
     st.integers(),
     st.integers(),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     ARRAY,
 )
 def test_add_22(alpha, beta, nu, parameter):
@@ -114,16 +116,16 @@ def test_add_22_when_present(when_present, parameter):
 @given(
     st.integers(min_value=0, max_value=8),
     st.integers(min_value=0, max_value=8),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     st.integers(min_value=0, max_value=8),
     st.integers(min_value=0, max_value=8),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     st.integers(min_value=0, max_value=8),
     st.integers(min_value=0, max_value=8),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     st.integers(min_value=0, max_value=8),
     st.integers(min_value=0, max_value=8),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     ARRAY,
 )
 def test_add_22_sorting(
@@ -161,7 +163,7 @@ def test_add_22_sorting(
 @given(
     st.integers(min_value=0, max_value=2),
     st.integers(min_value=0, max_value=2),
-    st.tuples(st.integers(), st.integers(), st.integers()),
+    st.tuples(INDEX, INDEX, INDEX),
     RANDOM_UC,
 )
 def test_remove_22(r_alpha, r_beta, r_nu, nus):
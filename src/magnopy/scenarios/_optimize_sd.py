@@ -46,6 +46,10 @@ def optimize_sd(
     no_html=False,
     hide_personal_data=False,
     quantum_correction=False,
+    optimizer="bfgs",
+    history_length=10,
+    n_starts=1,
+    number_processors=None,
 ) -> None:
     r"""
     Optimizes classical energy of spin Hamiltonian and finds a set of spin directions
@@ -107,6 +111,31 @@ def optimize_sd(
             This option is experimental. Will be improved and tested in future
             releases. Use with caution.
 
+    optimizer : str, default "bfgs"
+        .. versionadded:: 0.7.0
+
+        Optimization method. See :py:meth:`.Energy.optimize` for the supported methods.
+
+    history_length : int, default 10
+        .. versionadded:: 0.7.0
+
+        Amount of previous steps that are kept by the "lbfgs" optimizer.
+
+    n_starts : int, default 1
+        .. versionadded:: 0.7.0
+
+        Amount of starts of the optimization. The first start uses the saved initial
+        guess, other starts use random initial guesses. If ``n_starts > 1``, then
+        distinct local minima are saved in the file "LOCAL_MINIMA.txt" and the state
+        with the lowest energy is used as the result. See
+        :py:meth:`.Energy.optimize_multistart`.
+
+    number_processors : int, optional
+        .. versionadded:: 0.7.0
+
+        Number of processes, that run the starts in parallel. By default Magnopy uses
+        all available processes. Ignored if ``n_starts = 1``.
+
     Raises
     ------
 
@@ -140,6 +169,7 @@ def optimize_sd(
     )
     E_0_TXT = envelope_path(os.path.join(output_folder, "E_0.txt"))
     E_CORR_TXT = envelope_path(os.path.join(output_folder, "E_corr.txt"))
+    LOCAL_MINIMA_TXT = envelope_path(os.path.join(output_folder, "LOCAL_MINIMA.txt"))
 
     ################################################################################
     ##                           Input data verification                          ##
@@ -171,6 +201,16 @@ def optimize_sd(
     print(f"Energy tolerance       : {energy_tolerance:.5e} meV")
     print(f"Torque tolerance       : {torque_tolerance:.5e}")
 
+    # Optimization method
+    print(f"Optimizer              : {optimizer}", end="")
+    if optimizer.lower() == "lbfgs":
+        print(f" (history length {history_length})")
+    else:
+        print()
+
+    # Multi-start
+    print(f"Amount of starts       : {n_starts}")
+
     # Target energy function
     print(
         f"Target energy function : {'E^{(0)}' if not quantum_correction else 'E^{(0)} + E^{corr}'}"
@@ -213,13 +253,28 @@ def optimize_sd(
     print(f"\n{' Start optimization ':=^80}\n")
 
     energy = Energy(spinham=spinham)
-    spin_directions = energy.optimize(
-        initial_guess=initial_guess,
-        energy_tolerance=energy_tolerance,
-        torque_tolerance=torque_tolerance,
-        quiet=False,
-        quantum_correction=quantum_correction,
-    )
+    if n_starts == 1:
+        spin_directions = energy.optimize(
+            initial_guess=initial_guess,
+            energy_tolerance=energy_tolerance,
+            torque_tolerance=torque_tolerance,
+            quiet=False,
+            quantum_correction=quantum_correction,
+            optimizer=optimizer,
+            history_length=history_length,
+        )
+    else:
+        spin_directions, minima = energy.optimize_multistart(
+            n_starts=n_starts,
+            number_processors=number_processors,
+            initial_guess=initial_guess,
+            energy_tolerance=energy_tolerance,
+            torque_tolerance=torque_tolerance,
+            quiet=False,
+            quantum_correction=quantum_correction,
+            optimizer=optimizer,
+            history_length=history_length,
+        )
     print("Optimization is done.")
 
     ################################################################################
@@ -249,6 +304,19 @@ def optimize_sd(
         f"\nOptimized spin directions are saved in file\n{ICON_OUT_FILE} {SPIN_DIRECTIONS_TXT}"
     )
 
+    # Distinct local minima
+    if n_starts > 1:
+        with open(LOCAL_MINIMA_TXT, "w", encoding="utf-8") as f:
+            for rank, (minimum_energy, minimum_sd, count) in enumerate(minima):
+                f.write(
+                    f"# Minimum {rank + 1}: energy {minimum_energy:.8f} meV, found in "
+                    f"{count} of {n_starts} starts\n"
+                )
+                np.savetxt(f, minimum_sd, fmt="%12.8f %12.8f %12.8f")
+        print(
+            f"\nSpin directions of {len(minima)} distinct local minima are saved in file\n{ICON_OUT_FILE} {LOCAL_MINIMA_TXT}"
+        )
+
     # Real-space absolute positions of magnetic centers
     positions = np.array(spinham.magnetic_atoms["positions"]) @ spinham.cell
     np.savetxt(SPIN_POSITIONS_TXT, positions, fmt="%12.8f %12.8f %12.8f")
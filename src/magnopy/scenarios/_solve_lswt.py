@@ -23,11 +23,17 @@ import os
 
 import numpy as np
 import wulfric
+from numpy.lib.format import open_memmap
 
 from magnopy._energy import Energy
+from magnopy._kmesh import get_irreducible_kmesh, get_kmesh
 from magnopy._lswt import LSWT
 from magnopy._package_info import logo
-from magnopy._parallelization import multiprocess_over_k
+from magnopy._parallelization import (
+    THREADPOOLCTL_AVAILABLE,
+    _dispersion_over_k_chunks,
+    _get_k_layout,
+)
 from magnopy.io import plot_dispersion
 from magnopy._plotly_engine import PlotlyEngine
 from magnopy._constants._icons import ICON_OUT_FILE
@@ -61,6 +67,42 @@ old_dir = set(dir())
 old_dir.add("old_dir")
 
 
+def _save_txt_by_chunks(filename, array, part, chunk_size, fmt, header):
+    r"""
+    Saves real or imaginary part of the array into the text file chunk by chunk.
+
+    Parameters
+    ----------
+
+    filename : str
+        Name of the output file.
+
+    array : (N, ...) :numpy:`ndarray`
+        Array to be saved. Can be memory-mapped.
+
+    part : str
+        Either ``"real"`` or ``"imag"``.
+
+    chunk_size : int, optional
+        Number of rows, that are formatted at once. By default all rows are formatted
+        at once.
+
+    fmt : str
+        Format of one row, see ``numpy.savetxt``.
+
+    header : str
+        First line of the file.
+    """
+
+    if chunk_size is None:
+        chunk_size = max(1, len(array))
+
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(header + "\n")
+        for start in range(0, len(array), chunk_size):
+            np.savetxt(f, getattr(array[start : start + chunk_size], part), fmt=fmt)
+
+
 def solve_lswt(
     spinham,
     spin_directions=None,
@@ -74,6 +116,12 @@ def solve_lswt(
     no_html=False,
     hide_personal_data=False,
     spglib_symprec=1e-5,
+    backend="processes",
+    number_threads=None,
+    chunk_size=None,
+    no_txt=False,
+    save_G=False,
+    kmesh=None,
 ) -> None:
     r"""
     Computes magnon Hamiltonian at the level of Linear Spin Wave theory.
@@ -96,7 +144,7 @@ def solve_lswt(
         Specification of the k-path. The format is "G-X-Y|G-Z" For more details
         on the format see documentation of |wulfric|_. If nothing given, then the
         k-path is computed by |wulfric|_ automatically based on the lattice type.
-        Ignored if ``kpoints`` are given.
+        Ignored if ``kpoints`` or ``kmesh`` are given.
 
     kpoints : (N, 3) |array-like|_, optional
         Explicit list of k-points to be used instead of automatically generated.
@@ -139,12 +187,62 @@ def solve_lswt(
         Tolerance parameter for the space group symmetry search by |spglib|_. Reduce it
         if the space group is not the one you expected.
 
+    backend : str, default "processes"
+        .. versionadded:: 0.7.0
+
+        How the calculation is parallelized over the k-points. Either ``"processes"``
+        or ``"threads"``. See :py:func:`.dispersion_over_k` for details.
+
+    number_threads : int, optional
+        .. versionadded:: 0.7.0
+
+        Total number of threads, that can be used by Magnopy. Each process (or thread)
+        uses at most ``number_threads // number_processors`` threads for BLAS. The
+        number of processes (or threads) is reduced to ``number_threads`` if it is
+        larger. By default it is equal to the number of available processors.
+
+    chunk_size : int, optional
+        .. versionadded:: 0.7.0
+
+        If given, then k-points are processed in chunks of ``chunk_size`` k-points and
+        the results are written into the memory-mapped "OMEGAS.npy" and "DELTAS.npy"
+        files as soon as each chunk is finished. Memory, that is used for the
+        calculation, is proportional to ``chunk_size`` and not to the amount of
+        k-points. Text output is written chunk by chunk as well, .png plots are not
+        produced.
+
+    no_txt : bool, default False
+        .. versionadded:: 0.7.0
+
+        Whether to skip the text output of omegas and deltas. If ``True``, then the
+        results are saved in "OMEGAS.npy" and "DELTAS.npy" files only. The files can be
+        read with ``numpy.load(filename, mmap_mode="r")`` and converted to text
+        afterwards, if needed.
+
+    save_G : bool, default False
+        .. versionadded:: 0.7.0
+
+        Whether to compute the transformation matrices (see :py:meth:`.LSWT.G`) and to
+        save them into the memory-mapped "G.npy" file of the shape (N, M, 2M).
+
+    kmesh : (3, ) tuple of int, optional
+        .. versionadded:: 0.7.0
+
+        Sizes of the uniform mesh of k-points :math:`(n_1, n_2, n_3)` (see
+        :py:func:`.get_kmesh`). If given, then the mesh is reduced to its irreducible
+        part by the symmetry of the crystal and of the ground state (see
+        :py:func:`.get_irreducible_kmesh`) and only irreducible k-points are computed.
+        Irreducible k-points and their weights are saved in "K-POINTS.txt", the full
+        mesh with the indices of the equivalent irreducible k-points is saved in
+        "K-MESH.txt". Ignored if ``kpoints`` are given. Plots of the dispersion are not
+        produced.
+
 
     Notes
     -----
 
-    When using this function of Magnopy in your Python scripts make sure to safeguard
-    your script with the
+    When using this function of Magnopy with ``backend="processes"`` in your Python
+    scripts make sure to safeguard your script with the
 
     .. code-block:: python
 
@@ -184,12 +282,16 @@ def solve_lswt(
     )
     K_POINTS_HTML = envelope_path(os.path.join(output_folder, "K-POINTS.html"))
     K_POINTS_TXT = envelope_path(os.path.join(output_folder, "K-POINTS.txt"))
+    K_MESH_TXT = envelope_path(os.path.join(output_folder, "K-MESH.txt"))
     OMEGAS_TXT = envelope_path(os.path.join(output_folder, "OMEGAS.txt"))
     OMEGAS_PNG = envelope_path(os.path.join(output_folder, "OMEGAS.png"))
     OMEGAS_IMAG_TXT = envelope_path(os.path.join(output_folder, "OMEGAS-IMAG.txt"))
     OMEGAS_IMAG_PNG = envelope_path(os.path.join(output_folder, "OMEGAS-IMAG.png"))
     DELTAS_TXT = envelope_path(os.path.join(output_folder, "DELTAS.txt"))
     DELTAS_PNG = envelope_path(os.path.join(output_folder, "DELTAS.png"))
+    OMEGAS_NPY = envelope_path(os.path.join(output_folder, "OMEGAS.npy"))
+    DELTAS_NPY = envelope_path(os.path.join(output_folder, "DELTAS.npy"))
+    G_NPY = envelope_path(os.path.join(output_folder, "G.npy"))
     E_0_TXT = envelope_path(os.path.join(output_folder, "E_0.txt"))
     E_2_TXT = envelope_path(os.path.join(output_folder, "E_2.txt"))
     E_CORR_TXT = envelope_path(os.path.join(output_folder, "E_corr.txt"))
@@ -370,6 +472,20 @@ def solve_lswt(
         f"Correction to the classic energy of optimized state (E_corr = {E_corr:.3f} meV) is saved in file\n{ICON_OUT_FILE} {E_CORR_TXT}"
     )
 
+    # Classical stability: positive semi-definite Hessian of E_0
+    if energy.is_stable(spin_directions=spin_directions):
+        print("\nHessian of the classic energy is positive semi-definite.")
+    else:
+        print(
+            _envelope_warning(
+                "Hessian of the classic energy has negative eigenvalues. Spin "
+                "directions are not a local minimum of the classic energy and "
+                "imaginary magnon energies are expected. Consider to optimize the spin "
+                "directions (i.e. with magnopy-optimize-sd and optimizer="
+                '"trust-newton").'
+            )
+        )
+
     ################################################################################
     ##                            K-points and k-path                             ##
     ################################################################################
@@ -405,6 +521,42 @@ def solve_lswt(
 
         print("K-points are provided by user.")
 
+    elif kmesh is not None:
+        print("Reducing uniform mesh of k-points based on the symmetry.")
+        spglib_data = wulfric.get_spglib_data(
+            cell=spinham.cell, atoms=spinham.atoms, spglib_symprec=spglib_symprec
+        )
+        kpoints_relative, weights, mapping = get_irreducible_kmesh(
+            spinham=spinham,
+            spin_directions=spin_directions,
+            kmesh=kmesh,
+            spglib_symprec=spglib_data.symprec,
+        )
+        kpoints_absolute = kpoints_relative @ wulfric.cell.get_reciprocal(
+            cell=spinham.cell
+        )
+        print(
+            f"\nspglib_symprec         : {spglib_symprec:.5e}.",
+            f"Space group            : {spglib_data.space_group_number}",
+            f"Mesh                   : {' x '.join([str(n) for n in kmesh])}",
+            f"Irreducible k-points   : {len(kpoints_relative)} out of {weights.sum()}",
+            sep="\n",
+        )
+
+        # Full mesh is saved, so that the results can be unfolded on demand
+        np.savetxt(
+            K_MESH_TXT,
+            np.concatenate((get_kmesh(kmesh=kmesh), mapping[:, np.newaxis]), axis=1),
+            fmt="%12.8f %12.8f %12.8f   %12d",
+            header=f"{'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'irreducible':>12}",
+            comments="",
+        )
+        print(
+            f"\nFull mesh of k-points and indices of the equivalent irreducible k-points "
+            f"(rows of K-POINTS.txt, starting from 0) are saved in file\n"
+            f"{ICON_OUT_FILE} {K_MESH_TXT}"
+        )
+
     else:
         print("Deducing k-points based on the crystal symmetry.")
         print("See wulfric.org for more details on procedure and conventions.")
@@ -493,15 +645,26 @@ def solve_lswt(
             )
 
     # Save k-points info to the .txt file
-    np.savetxt(
-        K_POINTS_TXT,
-        np.concatenate(
-            (kpoints_absolute, kpoints_relative, x_data[:, np.newaxis]), axis=1
-        ),
-        fmt="%12.8f %12.8f %12.8f   %12.8f %12.8f %12.8f   %12.8f",
-        header=f"{'k_x':>12} {'k_y':>12} {'k_z':>12}   {'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'flat index':>12}",
-        comments="",
-    )
+    if kpoints is None and kmesh is not None:
+        np.savetxt(
+            K_POINTS_TXT,
+            np.concatenate(
+                (kpoints_absolute, kpoints_relative, weights[:, np.newaxis]), axis=1
+            ),
+            fmt="%12.8f %12.8f %12.8f   %12.8f %12.8f %12.8f   %12d",
+            header=f"{'k_x':>12} {'k_y':>12} {'k_z':>12}   {'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'weight':>12}",
+            comments="",
+        )
+    else:
+        np.savetxt(
+            K_POINTS_TXT,
+            np.concatenate(
+                (kpoints_absolute, kpoints_relative, x_data[:, np.newaxis]), axis=1
+            ),
+            fmt="%12.8f %12.8f %12.8f   %12.8f %12.8f %12.8f   %12.8f",
+            header=f"{'k_x':>12} {'k_y':>12} {'k_z':>12}   {'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'flat index':>12}",
+            comments="",
+        )
     print(
         f"\nExplicit list of k-points is saved in file\n{ICON_OUT_FILE} {K_POINTS_TXT}"
     )
@@ -556,18 +719,69 @@ def solve_lswt(
         )
 
     # Compute data for each k-point
+    N = len(kpoints_absolute)
+    layout = _get_k_layout(
+        N=N,
+        M=lswt.M,
+        chunk_size=chunk_size,
+        number_processors=number_processors,
+        number_threads=number_threads,
+    )
+    _, number_processors, blas_threads = layout
+    if backend == "processes":
+        worker = "process"
+    else:
+        worker = "thread"
+    print(
+        "\nCalculations are parallelized over k-points\n"
+        f"  number of {backend}: {number_processors}\n"
+        f"  number of BLAS threads per {worker}: {blas_threads}"
+    )
+    if not THREADPOOLCTL_AVAILABLE:
+        print(
+            _envelope_warning(
+                "Number of BLAS threads is not controlled by Magnopy, because "
+                "threadpoolctl is not available. Processors might be oversubscribed.\n"
+                "You can install threadpoolctl with 'pip install threadpoolctl'"
+            )
+        )
+    streaming = chunk_size is not None or no_txt
+
+    # Results are written to the disk as soon as they are computed
+    if streaming:
+        omegas = open_memmap(OMEGAS_NPY, mode="w+", dtype=complex, shape=(N, lswt.M))
+        deltas = open_memmap(DELTAS_NPY, mode="w+", dtype=complex, shape=(N,))
+    else:
+        omegas = np.empty((N, lswt.M), dtype=complex)
+        deltas = np.empty(N, dtype=complex)
+
+    # Transformation matrices are computed only if they are written
+    if save_G:
+        G = open_memmap(G_NPY, mode="w+", dtype=complex, shape=(N, lswt.M, 2 * lswt.M))
+    else:
+        G = None
+
     print("\nStart calculations over k-points ... ", end="")
-    results = multiprocess_over_k(
+    has_imaginary = False
+    has_nans = False
+    has_negative = False
+    for start, stop in _dispersion_over_k_chunks(
+        lswt=lswt,
         kpoints=kpoints_absolute,
-        function=lswt.diagonalize,
+        omegas=omegas,
+        deltas=deltas,
+        G=G,
         relative=False,
-        number_processors=number_processors,
-    )
-    omegas = np.array([i[0] for i in results]).T
-    deltas = np.array([i[1] for i in results])
-    n_modes = len(omegas)
-    has_imaginary = not np.allclose(omegas.imag, np.zeros(omegas.imag.shape))
-    has_nans = np.any(np.isnan(omegas))
+        backend=backend,
+        layout=layout,
+    ):
+        chunk = omegas[start:stop]
+        has_imaginary = has_imaginary or not np.allclose(
+            chunk.imag, np.zeros(chunk.imag.shape)
+        )
+        has_nans = has_nans or bool(np.any(np.isnan(chunk)))
+        has_negative = has_negative or bool(np.any(chunk.real < -1e-8))
+    n_modes = lswt.M
     print("Done")
 
     if has_nans:
@@ -596,7 +810,7 @@ def solve_lswt(
             )
         )
 
-    if np.any(omegas.real < -1e-8):
+    if has_negative:
         all_good = False
         print(
             _envelope_warning(
@@ -613,41 +827,70 @@ def solve_lswt(
     ################################################################################
     print(f"\n{' Output ':=^80}\n")
 
-    # Omegas
-    np.savetxt(
-        OMEGAS_TXT,
-        omegas.real.T,
-        fmt=("%15.6e " * n_modes)[:-1],
-        header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
-        comments="",
-    )
-    print(f"\nOmegas are saved in file\n{ICON_OUT_FILE} {OMEGAS_TXT}")
-
-    # Deltas
-    np.savetxt(DELTAS_TXT, deltas.real, fmt="%10.6e", header="Delta", comments="")
-    print(f"Deltas are saved in file\n{ICON_OUT_FILE} {DELTAS_TXT}")
+    for array, filename, name in [
+        (omegas, OMEGAS_NPY, "Omegas"),
+        (deltas, DELTAS_NPY, "Deltas"),
+        (G, G_NPY, "Transformation matrices"),
+    ]:
+        if isinstance(array, np.memmap):
+            array.flush()
+            print(f"{name} are saved in file\n{ICON_OUT_FILE} {filename}")
 
-    # Imaginary omegas
-    if has_imaginary or has_nans:
-        np.savetxt(
-            OMEGAS_IMAG_TXT,
-            omegas.imag.T,
+    if not no_txt:
+        # Omegas
+        _save_txt_by_chunks(
+            filename=OMEGAS_TXT,
+            array=omegas,
+            part="real",
+            chunk_size=chunk_size,
             fmt=("%15.6e " * n_modes)[:-1],
             header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
-            comments="",
         )
-        print(
-            f"Imaginary part of omegas is saved in file\n{ICON_OUT_FILE} {OMEGAS_IMAG_TXT}"
+        print(f"\nOmegas are saved in file\n{ICON_OUT_FILE} {OMEGAS_TXT}")
+
+        # Deltas
+        _save_txt_by_chunks(
+            filename=DELTAS_TXT,
+            array=deltas,
+            part="real",
+            chunk_size=chunk_size,
+            fmt="%10.6e",
+            header="Delta",
         )
+        print(f"Deltas are saved in file\n{ICON_OUT_FILE} {DELTAS_TXT}")
+
+        # Imaginary omegas
+        if has_imaginary or has_nans:
+            _save_txt_by_chunks(
+                filename=OMEGAS_IMAG_TXT,
+                array=omegas,
+                part="imag",
+                chunk_size=chunk_size,
+                fmt=("%15.6e " * n_modes)[:-1],
+                header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
+            )
+            print(
+                f"Imaginary part of omegas is saved in file\n{ICON_OUT_FILE} {OMEGAS_IMAG_TXT}"
+            )
 
     ################################################################################
     ##                                 png output                                 ##
     ################################################################################
 
-    if MATPLOTLIB_AVAILABLE:
+    # Dispersion is plotted only along the path in the reciprocal space
+    plot = chunk_size is None and (kpoints is not None or kmesh is None)
+
+    if not plot:
+        print(
+            "\nPlots are not produced when k-points are processed by chunks "
+            "(chunk_size is given) or when the mesh of k-points is used (kmesh is "
+            "given)."
+        )
+
+    if MATPLOTLIB_AVAILABLE and plot:
         # Omegas
         plot_dispersion(
-            modes=omegas.real,
+            modes=omegas.real.T,
             x_data=x_data,
             ticks=ticks,
             labels=labels,
@@ -670,7 +913,7 @@ def solve_lswt(
         # Imaginary omegas
         if has_imaginary or has_nans:
             plot_dispersion(
-                modes=omegas.imag,
+                modes=omegas.imag.T,
                 x_data=x_data,
                 ticks=ticks,
                 labels=labels,